@@ -0,0 +1,109 @@
+#
+# -*- coding: utf-8 -*-
+#
+# Copyright 2015-2025 NETCAT (www.netcat.pl)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# @author NETCAT <firma@netcat.pl>
+# @copyright 2015-2025 NETCAT (www.netcat.pl)
+# @license http://www.apache.org/licenses/LICENSE-2.0
+#
+
+
+
+#
+# Serialization of model objects: Codec vs pickle vs JSON (size, encode and decode time)
+#
+# python benchmarks/bench_codec.py [iterations]
+#
+
+import datetime
+import json
+import os
+import pickle
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from nip24 import NIP24Client, MemoryTransport, Number, Codec
+from responses import transport_responses
+
+classes = dict((cls.__name__, cls) for cls in Codec.CLASSES)
+
+
+def to_json(value):
+    if hasattr(value, '__slots__'):
+        d = dict((name, to_json(getattr(value, name))) for name in value.__slots__)
+        d['__type__'] = type(value).__name__
+        return d
+
+    if isinstance(value, list):
+        return [to_json(item) for item in value]
+
+    if isinstance(value, datetime.datetime):
+        return {'__datetime__': value.isoformat()}
+
+    return value
+
+
+def from_json(value):
+    if isinstance(value, dict):
+        if '__datetime__' in value:
+            return datetime.datetime.fromisoformat(value['__datetime__'])
+
+        obj = classes[value.pop('__type__')]()
+
+        for name, item in value.items():
+            setattr(obj, name, from_json(item))
+
+        return obj
+
+    if isinstance(value, list):
+        return [from_json(item) for item in value]
+
+    return value
+
+
+codecs = [
+    ('codec', Codec.toBytes, Codec.fromBytes),
+    ('pickle', pickle.dumps, pickle.loads),
+    ('json', lambda obj: json.dumps(to_json(obj)).encode(), lambda data: from_json(json.loads(data)))
+]
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+
+    nip24 = NIP24Client()
+    nip24.setTransport(MemoryTransport(transport_responses(pkds=10, entities=5)))
+
+    objects = [
+        ('AllData', nip24.getAllDataExt(Number.NIP, '7171642051')),
+        ('SearchResult', nip24.searchVATRegistryExt(Number.NIP, '7171642051', '2023-05-06')),
+        ('AccountStatus', nip24.getAccountStatus())
+    ]
+
+    print('%-14s %-8s %8s %12s %12s' % ('object', 'format', 'size', 'encode', 'decode'))
+
+    for name, obj in objects:
+        for codec, encode, decode in codecs:
+            data = encode(obj)
+
+            assert str(decode(data)) == str(obj)
+
+            te = min(timeit.repeat(lambda: encode(obj), number=n, repeat=3)) / n
+            td = min(timeit.repeat(lambda: decode(data), number=n, repeat=3)) / n
+
+            print('%-14s %-8s %6d B %9.1f us %9.1f us' % (name, codec, len(data), te * 1e6, td * 1e6))
@@ -0,0 +1,59 @@
+#
+# -*- coding: utf-8 -*-
+#
+# Copyright 2015-2025 NETCAT (www.netcat.pl)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# @author NETCAT <firma@netcat.pl>
+# @copyright 2015-2025 NETCAT (www.netcat.pl)
+# @license http://www.apache.org/licenses/LICENSE-2.0
+#
+
+
+
+#
+# Collection mapping benchmark: time per item should stay flat as the lists grow
+#
+# python benchmarks/bench_collections.py [iterations]
+#
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from nip24 import Mapper
+from responses import all_data, search_result
+
+sizes = [10, 100, 500, 1000]
+
+
+def bench(name, mapper, content, items, n):
+    doc = Mapper.parse(content)
+
+    t = min(timeit.repeat(lambda: mapper(doc), number=n, repeat=3)) / n
+    print('%-16s %6d items %10.1f us/call %8.2f us/item' % (name, items, t * 1e6, t * 1e6 / items))
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+
+    for size in sizes:
+        bench('allData', Mapper.allData, all_data(pkds=size, partners=size), 2 * size, n)
+
+    for size in sizes:
+        bench('searchResult', Mapper.searchResult, search_result(entities=1, ibans=size, persons=size),
+              4 * size, n)
@@ -0,0 +1,63 @@
+#
+# -*- coding: utf-8 -*-
+#
+# Copyright 2015-2025 NETCAT (www.netcat.pl)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# @author NETCAT <firma@netcat.pl>
+# @copyright 2015-2025 NETCAT (www.netcat.pl)
+# @license http://www.apache.org/licenses/LICENSE-2.0
+#
+
+
+#
+# Eager vs lazy AllData mapping: read only a few fields or all of them
+#
+# python benchmarks/bench_lazy.py [iterations]
+#
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from nip24 import NIP24Client, MemoryTransport, Number
+from responses import transport_responses
+
+nip = '7171642051'
+
+
+def read_few(all):
+    return (all.name, all.nip, all.regon, all.street, all.streetNumber, all.houseNumber, all.postCode, all.postCity,
+            all.city)
+
+
+def read_all(all):
+    return str(all)
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+
+    nip24 = NIP24Client()
+    nip24.setTransport(MemoryTransport(transport_responses(pkds=20)))
+
+    for lazy in (False, True):
+        nip24.setLazy(lazy)
+
+        for name, read in (('name and address', read_few), ('all fields', read_all)):
+            t = min(timeit.repeat(lambda: read(nip24.getAllDataExt(Number.NIP, nip)), number=n, repeat=3)) / n
+            print('%-6s %-18s %8.1f us/call' % ('lazy' if lazy else 'eager', name, t * 1e6))
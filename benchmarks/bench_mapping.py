@@ -0,0 +1,67 @@
+#
+# -*- coding: utf-8 -*-
+#
+# Copyright 2015-2025 NETCAT (www.netcat.pl)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# @author NETCAT <firma@netcat.pl>
+# @copyright 2015-2025 NETCAT (www.netcat.pl)
+# @license http://www.apache.org/licenses/LICENSE-2.0
+#
+
+
+#
+# Parsing and mapping benchmark run against in-memory transport (no network)
+#
+# python benchmarks/bench_mapping.py [iterations]
+#
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from nip24 import NIP24Client, MemoryTransport, Number
+from responses import transport_responses
+
+nip = '7171642051'
+account_number = '49154000046458439719826658'
+
+nip24 = NIP24Client()
+nip24.setTransport(MemoryTransport(transport_responses()))
+
+calls = [
+    ('isActiveExt', lambda: nip24.isActiveExt(Number.NIP, nip)),
+    ('getInvoiceDataExt', lambda: nip24.getInvoiceDataExt(Number.NIP, nip)),
+    ('getAllDataExt', lambda: nip24.getAllDataExt(Number.NIP, nip)),
+    ('getVIESData', lambda: nip24.getVIESData('PL' + nip)),
+    ('getVATStatusExt', lambda: nip24.getVATStatusExt(Number.NIP, nip)),
+    ('getIBANStatusExt', lambda: nip24.getIBANStatusExt(Number.NIP, nip, account_number, '2023-05-06')),
+    ('getWhitelistStatusExt', lambda: nip24.getWhitelistStatusExt(Number.NIP, nip, account_number, '2023-05-06')),
+    ('searchVATRegistryExt', lambda: nip24.searchVATRegistryExt(Number.NIP, nip, '2023-05-06')),
+    ('getAccountStatus', lambda: nip24.getAccountStatus())
+]
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+
+    for name, call in calls:
+        if not call():
+            print(name + ': error ' + str(nip24.getLastErrorCode()) + ' ' + str(nip24.getLastError()))
+            continue
+
+        t = min(timeit.repeat(call, number=n, repeat=3)) / n
+        print('%-24s %8.1f us/call' % (name, t * 1e6))
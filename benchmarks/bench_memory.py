@@ -0,0 +1,82 @@
+#
+# -*- coding: utf-8 -*-
+#
+# Copyright 2015-2025 NETCAT (www.netcat.pl)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# @author NETCAT <firma@netcat.pl>
+# @copyright 2015-2025 NETCAT (www.netcat.pl)
+# @license http://www.apache.org/licenses/LICENSE-2.0
+#
+
+
+
+#
+# Memory used by model objects: __slots__ classes vs the same classes with per-instance __dict__,
+# and mapped results with and without string pool
+#
+# python benchmarks/bench_memory.py [instances]
+#
+
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from nip24 import (InvoiceData, AllData, VIESData, VATStatus, IBANStatus, WLStatus, VATPerson, VATEntity, SearchResult,
+                   AccountStatus, BusinessPartner, PKD, Mapper, StringPool)
+from responses import all_data
+
+models = [InvoiceData, AllData, VIESData, VATStatus, IBANStatus, WLStatus, VATPerson, VATEntity, SearchResult,
+          AccountStatus, BusinessPartner, PKD]
+
+
+def measure(factory, n):
+    tracemalloc.start()
+
+    objects = [factory() for i in range(n)]
+    size = tracemalloc.get_traced_memory()[0]
+
+    tracemalloc.stop()
+
+    # list of references is not part of the object size
+    return (size - sys.getsizeof(objects)) / float(n)
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+
+    print('%-16s %10s %10s' % ('model', '__dict__', '__slots__'))
+
+    for cls in models:
+        # same constructor and attributes, but without __slots__
+        plain = type(cls.__name__, (), {'__init__': cls.__init__})
+
+        print('%-16s %8.0f B %8.0f B' % (cls.__name__, measure(plain, n), measure(cls, n)))
+
+    # every result gets its own copies of field values unless they are pooled
+    doc = Mapper.parse(all_data(pkds=10))
+
+    print()
+    print('%-16s %10s %10s' % ('result', 'no pool', 'pool'))
+
+    plain = measure(lambda: Mapper.allData(doc), n // 10)
+
+    Mapper.setStringPool(StringPool())
+    pooled = measure(lambda: Mapper.allData(doc), n // 10)
+    Mapper.setStringPool(None)
+
+    print('%-16s %8.0f B %8.0f B' % ('AllData+10 PKD', plain, pooled))
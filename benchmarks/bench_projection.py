@@ -0,0 +1,66 @@
+#
+# -*- coding: utf-8 -*-
+#
+# Copyright 2015-2025 NETCAT (www.netcat.pl)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# @author NETCAT <firma@netcat.pl>
+# @copyright 2015-2025 NETCAT (www.netcat.pl)
+# @license http://www.apache.org/licenses/LICENSE-2.0
+#
+
+
+#
+# Field projection: AllData mapping time by number of requested fields
+#
+# python benchmarks/bench_projection.py [iterations]
+#
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from nip24 import NIP24Client, MemoryTransport, Number, AllData, Mapper
+from responses import all_data, transport_responses
+
+nip = '7171642051'
+
+attributes = [name for name in AllData.__slots__ if name not in ('businessPartner', 'pkd')]
+
+projections = [
+    ('all', None),
+    ('all scalars', attributes),
+    ('half scalars', attributes[:len(attributes) // 2]),
+    ('name regon pkd', ['name', 'regon', 'pkd']),
+    ('name regon', ['name', 'regon'])
+]
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+
+    nip24 = NIP24Client()
+    nip24.setTransport(MemoryTransport(transport_responses(pkds=20)))
+
+    doc = Mapper.parse(all_data(20))
+
+    print('%-16s %12s %12s' % ('fields', 'mapping', 'call'))
+
+    for name, fields in projections:
+        tm = min(timeit.repeat(lambda: Mapper.allData(doc, fields), number=n, repeat=3)) / n
+        tc = min(timeit.repeat(lambda: nip24.getAllDataExt(Number.NIP, nip, fields=fields), number=n, repeat=3)) / n
+
+        print('%-16s %9.1f us %9.1f us' % (name, tm * 1e6, tc * 1e6))
@@ -0,0 +1,85 @@
+#
+# -*- coding: utf-8 -*-
+#
+# Copyright 2015-2025 NETCAT (www.netcat.pl)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# @author NETCAT <firma@netcat.pl>
+# @copyright 2015-2025 NETCAT (www.netcat.pl)
+# @license http://www.apache.org/licenses/LICENSE-2.0
+#
+
+
+
+#
+# Buffered vs streaming parsing of a large search result: time and peak memory
+#
+# python benchmarks/bench_streaming.py [entities]
+#
+
+import os
+import resource
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from nip24 import Mapper
+from responses import search_result
+
+
+def chunks(entities):
+    # response body as it would arrive from the socket, never held in memory as a whole
+    content = search_result(entities=1, ibans=10, persons=3)
+
+    start = content.index(b'<entity>')
+    end = content.index(b'</entities>')
+
+    yield content[:start]
+
+    for n in range(entities):
+        yield content[start:end]
+
+    yield content[end:]
+
+
+def run(mode, entities):
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+
+    if mode == 'buffered':
+        sr = Mapper.searchResult(Mapper.parse(b''.join(chunks(entities))))
+    else:
+        mapped = []
+        doc = Mapper.parse(chunks(entities), None, 'entity', lambda element: mapped.append(Mapper.vatEntity(element)))
+        sr = Mapper.searchResult(doc, mapped)
+
+    t = time.perf_counter() - start
+    mem = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss
+
+    print('%-10s %6d entities %8.1f ms %8.1f MB peak' % (mode, len(sr.results), t * 1e3, mem / 1024.0))
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 2:
+        run(sys.argv[1], int(sys.argv[2]))
+        sys.exit(0)
+
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+
+    # every mode runs in a fresh process so that peak memory is not shared
+    for mode in ('buffered', 'streaming'):
+        subprocess.check_call([sys.executable, os.path.abspath(__file__), mode, str(n)])
@@ -0,0 +1,115 @@
+#
+# -*- coding: utf-8 -*-
+#
+# Copyright 2015-2025 NETCAT (www.netcat.pl)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# @author NETCAT <firma@netcat.pl>
+# @copyright 2015-2025 NETCAT (www.netcat.pl)
+# @license http://www.apache.org/licenses/LICENSE-2.0
+#
+
+
+
+#
+# Tabular output of batch results: AllData objects converted to rows vs ResultTable filled from parsed XML
+#
+# Every variant runs in its own process and reports growth of peak RSS, which includes memory of parsed
+# documents allocated by libxml2 (not visible to tracemalloc).
+#
+# python benchmarks/bench_table.py [numbers]
+#
+
+import io
+import os
+import resource
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from nip24 import NIP24Client, MemoryTransport, Number, ResultTable
+from responses import transport_responses
+
+nip24 = NIP24Client()
+nip24.setTransport(MemoryTransport(transport_responses(pkds=10)))
+nip24.setSingleFlight(False)
+
+
+def nips(n):
+    # distinct valid numbers, so that batch does not de-duplicate them
+    i = 0
+
+    while n > 0:
+        digits = [int(d) for d in '%09d' % (100000000 + i)]
+        check = sum(w * d for w, d in zip((6, 5, 7, 2, 3, 4, 5, 6, 7), digits)) % 11
+        i += 1
+
+        if check != 10:
+            n -= 1
+            yield (Number.NIP, ''.join(str(d) for d in digits) + str(check))
+
+
+def objects(numbers):
+    rows = []
+
+    for result in nip24.getAllDataBatch(numbers, workers=1):
+        all = result.value
+        row = dict((name, getattr(all, name)) for name in all.__slots__ if name not in ('pkd', 'businessPartner'))
+        row['pkd'] = [dict((name, getattr(pkd, name)) for name in pkd.__slots__) for pkd in all.pkd]
+        rows.append(row)
+
+    return rows
+
+
+def table(numbers):
+    return nip24.getAllDataTable(numbers, workers=1)
+
+
+def run(name, func, numbers):
+    base = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+
+    result = func(numbers)
+
+    t = time.perf_counter() - start
+    size = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - base
+
+    # ru_maxrss is in kilobytes on Linux
+    print('%-10s %6d rows %8.1f ms %8.1f MB peak RSS growth' % (name, len(result), t * 1e3, size / 1024.0))
+
+    return result
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+
+    if len(sys.argv) < 3:
+        for name in ('objects', 'table'):
+            subprocess.check_call([sys.executable, os.path.abspath(__file__), str(n), name])
+
+        sys.exit(0)
+
+    numbers = list(nips(n))
+
+    if sys.argv[2] == 'objects':
+        run('objects', objects, numbers)
+    else:
+        t = run('table', table, numbers)
+
+        start = time.perf_counter()
+        t.toNDJSON(io.StringIO())
+        print('%-10s %6d rows %8.1f ms' % ('ndjson', len(t), (time.perf_counter() - start) * 1e3))
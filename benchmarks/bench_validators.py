@@ -0,0 +1,64 @@
+#
+# -*- coding: utf-8 -*-
+#
+# Copyright 2015-2025 NETCAT (www.netcat.pl)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# @author NETCAT <firma@netcat.pl>
+# @copyright 2015-2025 NETCAT (www.netcat.pl)
+# @license http://www.apache.org/licenses/LICENSE-2.0
+#
+
+
+#
+# Per-call cost of number validators and of request path construction
+#
+# python benchmarks/bench_validators.py [iterations]
+#
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from nip24 import NIP24Client, Number, NIP, REGON, KRS, EUVAT, IBAN
+
+cases = [
+    ('NIP', NIP, '717-164-20-51'),
+    ('NIP invalid', NIP, '7171642052'),
+    ('REGON 9', REGON, '123456785'),
+    ('REGON 14', REGON, '12345678512347'),
+    ('KRS', KRS, '123456'),
+    ('EUVAT PL', EUVAT, 'PL 7171642051'),
+    ('EUVAT DE', EUVAT, 'DE123456789'),
+    ('IBAN', IBAN, 'PL61 1090 1014 0000 0712 1981 2874'),
+    ('IBAN invalid', IBAN, 'PL61109010140000071219812875')
+]
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+
+    print('%-14s %12s %12s' % ('number', 'normalize', 'isValid'))
+
+    for name, validator, number in cases:
+        tn = min(timeit.repeat(lambda: validator.normalize(number), number=n, repeat=3)) / n
+        tv = min(timeit.repeat(lambda: validator.isValid(number), number=n, repeat=3)) / n
+
+        print('%-14s %9.2f us %9.2f us' % (name, tn * 1e6, tv * 1e6))
+
+    nip24 = NIP24Client()
+
+    tp = min(timeit.repeat(lambda: nip24._get_path_suffix(Number.NIP, '7171642051'), number=n, repeat=3)) / n
+    print('%-14s %22.2f us' % ('path suffix', tp * 1e6))
@@ -0,0 +1,156 @@
+#
+# -*- coding: utf-8 -*-
+#
+# Copyright 2015-2025 NETCAT (www.netcat.pl)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# @author NETCAT <firma@netcat.pl>
+# @copyright 2015-2025 NETCAT (www.netcat.pl)
+# @license http://www.apache.org/licenses/LICENSE-2.0
+#
+
+
+#
+# Synthetic NIP24 service responses used by benchmarks
+#
+
+
+def _firm_address():
+    return '<street>Ul. Prosta</street><streetCode>12345</streetCode><streetNumber>12</streetNumber>' \
+        '<houseNumber>3</houseNumber><city>Warszawa</city><cityCode>0918123</cityCode>' \
+        '<community>Warszawa-Śródmieście</community><communityCode>146502</communityCode>' \
+        '<county>Warszawa</county><countyCode>1465</countyCode><state>mazowieckie</state><stateCode>14</stateCode>' \
+        '<postCode>00-001</postCode><postCity>Warszawa</postCity>'
+
+
+def invoice_data():
+    return ('<?xml version="1.0" encoding="UTF-8"?><result><firm><uid>a1b2c3</uid><nip>7171642051</nip>'
+            '<name>Przykładowa Firma Sp. z o.o.</name><firstname></firstname><lastname></lastname>'
+            + _firm_address() +
+            '<phone>221234567</phone><email>biuro@example.pl</email><www>www.example.pl</www>'
+            '</firm></result>').encode()
+
+
+def all_data(pkds=5, partners=2):
+    pkd = ''.join('<PKD><code>62.%02d.Z</code><description>Działalność związana z oprogramowaniem %d</description>'
+                  '<primary>%s</primary><version>2007</version></PKD>'
+                  % (i % 100, i, 'true' if i == 0 else 'false') for i in range(pkds))
+    bp = ''.join('<businessPartner><regon>%09d</regon><firmName>Wspólnik %d</firmName><firstName>Jan</firstName>'
+                 '<secondName></secondName><lastName>Kowalski</lastName></businessPartner>' % (i, i)
+                 for i in range(partners))
+
+    return ('<?xml version="1.0" encoding="UTF-8"?><result><firm><uid>a1b2c3</uid><type>1</type>'
+            '<nip>7171642051</nip><regon>123456785</regon><name>Przykładowa Firma Sp. z o.o.</name>'
+            '<shortname>Przykładowa</shortname><firstname></firstname><secondname></secondname><lastname></lastname>'
+            + _firm_address() +
+            '<phone>221234567</phone><email>biuro@example.pl</email><www>www.example.pl</www>'
+            '<creationDate>2010-01-01</creationDate><startDate>2010-02-01</startDate>'
+            '<registrationDate>2010-01-15</registrationDate><holdDate></holdDate><renevalDate></renevalDate>'
+            '<lastUpdateDate>2023-05-06</lastUpdateDate><endDate></endDate>'
+            '<registryEntity><code>138</code><name>Sąd Rejonowy dla m.st. Warszawy</name></registryEntity>'
+            '<registry><code>138</code><name>Rejestr przedsiębiorców KRS</name></registry>'
+            '<record><created>2010-01-15</created><number>0000123456</number></record>'
+            '<basicLegalForm><code>2</code><name>JEDNOSTKA ORGANIZACYJNA NIEMAJĄCA OSOBOWOŚCI PRAWNEJ</name>'
+            '</basicLegalForm><specificLegalForm><code>117</code><name>SPÓŁKI Z OGRANICZONĄ ODPOWIEDZIALNOŚCIĄ'
+            '</name></specificLegalForm><ownershipForm><code>214</code><name>WŁASNOŚĆ KRAJOWYCH OSÓB FIZYCZNYCH'
+            '</name></ownershipForm><businessPartners>' + bp + '</businessPartners><PKDs>' + pkd + '</PKDs>'
+            '</firm></result>').encode()
+
+
+def vies_data():
+    return ('<?xml version="1.0" encoding="UTF-8"?><result><vies><uid>a1b2c3</uid><countryCode>PL</countryCode>'
+            '<vatNumber>7171642051</vatNumber><valid>true</valid><traderName>PRZYKŁADOWA FIRMA</traderName>'
+            '<traderCompanyType>---</traderCompanyType><traderAddress>UL. PROSTA 12, 00-001 WARSZAWA</traderAddress>'
+            '<id>WAPIAAAAYNJ_Znen</id><date>2023-05-06+02:00</date><source>http://ec.europa.eu</source>'
+            '</vies></result>').encode()
+
+
+def vat_status():
+    return ('<?xml version="1.0" encoding="UTF-8"?><result><vat><uid>a1b2c3</uid><nip>7171642051</nip>'
+            '<regon>123456785</regon><name>PRZYKŁADOWA FIRMA SP. Z O.O.</name><status>2</status>'
+            '<result>Czynny</result><id>Z1234567890</id><date>2023-05-06+02:00</date>'
+            '<source>http://www.finanse.mf.gov.pl</source></vat></result>').encode()
+
+
+def iban_status():
+    return ('<?xml version="1.0" encoding="UTF-8"?><result><iban><uid>a1b2c3</uid><nip>7171642051</nip>'
+            '<regon>123456785</regon><iban>PL49154000046458439719826658</iban><valid>true</valid>'
+            '<id>Z1234567890</id><date>2023-05-06Z</date><source>http://www.finanse.mf.gov.pl</source>'
+            '</iban></result>').encode()
+
+
+def whitelist_status():
+    return ('<?xml version="1.0" encoding="UTF-8"?><result><whitelist><uid>a1b2c3</uid><nip>7171642051</nip>'
+            '<iban>PL49154000046458439719826658</iban><valid>true</valid><virtual>false</virtual>'
+            '<vatStatus>2</vatStatus><vatResult>Czynny</vatResult><hashIndex>-1</hashIndex><maskIndex>-1</maskIndex>'
+            '<date>2023-05-06Z</date><source>http://www.finanse.mf.gov.pl</source></whitelist></result>').encode()
+
+
+def search_result(entities=1, ibans=3, persons=2):
+    def people(tag):
+        return '<' + tag + '>' + ''.join('<person><nip>7171642051</nip><companyName></companyName>'
+                                         '<firstName>Jan</firstName><lastName>Nowak %d</lastName></person>' % i
+                                         for i in range(persons)) + '</' + tag + '>'
+
+    entity = ''.join('<entity><name>PRZYKŁADOWA FIRMA %d</name><nip>7171642051</nip><regon>123456785</regon>'
+                     '<krs>0000123456</krs><residenceAddress>UL. PROSTA 12, 00-001 WARSZAWA</residenceAddress>'
+                     '<workingAddress></workingAddress><vat><status>2</status><result>Czynny</result></vat>'
+                     % n + people('representatives') + people('authorizedClerks') + people('partners') +
+                     '<ibans>' + ''.join('<iban>PL%026d</iban>' % i for i in range(ibans)) + '</ibans>'
+                     '<hasVirtualAccounts>false</hasVirtualAccounts><registrationLegalDate>2010-01-15+01:00'
+                     '</registrationLegalDate><registrationDenialDate></registrationDenialDate>'
+                     '<registrationDenialBasis></registrationDenialBasis><restorationDate></restorationDate>'
+                     '<restorationBasis></restorationBasis><removalDate></removalDate><removalBasis></removalBasis>'
+                     '</entity>' for n in range(entities))
+
+    return ('<?xml version="1.0" encoding="UTF-8"?><result><search><uid>a1b2c3</uid><entities>' + entity +
+            '</entities><id>Z1234567890</id><date>2023-05-06+02:00</date><source>http://www.finanse.mf.gov.pl'
+            '</source></search></result>').encode()
+
+
+def account_status():
+    flags = ''.join('<%s>true</%s>' % (f, f) for f in (
+        'overplanAllowed', 'terytCodes', 'excelAddin', 'jpkVat', 'cli', 'stats', 'nipMonitor', 'searchByNip',
+        'searchByRegon', 'searchByKrs', 'funcIsActive', 'funcGetInvoiceData', 'funcGetAllData', 'funcGetVIESData',
+        'funcGetVATStatus', 'funcGetIBANStatus', 'funcGetWLStatus', 'funcSearchVAT'))
+    counts = ''.join('<%s>%d</%s>' % (f, i, f) for i, f in enumerate((
+        'invoiceData', 'allData', 'firmStatus', 'vatStatus', 'viesStatus', 'ibanStatus', 'wlStatus', 'searchVAT',
+        'total')))
+
+    return ('<?xml version="1.0" encoding="UTF-8"?><result><account><uid>a1b2c3</uid><type>1</type>'
+            '<validTo>2030-12-31T23:59:59.000+01:00</validTo><billingPlan><name>Biznes</name>'
+            '<subscriptionPrice>100.00</subscriptionPrice><itemPrice>0.10</itemPrice>'
+            '<itemPriceCheckStatus>0.05</itemPriceCheckStatus><itemPriceInvoiceData>0.10</itemPriceInvoiceData>'
+            '<itemPriceAllData>0.20</itemPriceAllData><itemPriceIBANStatus>0.05</itemPriceIBANStatus>'
+            '<itemPriceWLStatus>0.05</itemPriceWLStatus><itemPriceSearchVAT>0.05</itemPriceSearchVAT>'
+            '<limit>10000</limit><requestDelay>0</requestDelay><domainLimit>5</domainLimit>' + flags +
+            '</billingPlan><requests>' + counts + '</requests></account></result>').encode()
+
+
+def transport_responses(pkds=5, entities=1):
+    """
+    Canned responses for MemoryTransport by URL path fragment
+    """
+
+    return {
+        '/check/firm/': b'<?xml version="1.0" encoding="UTF-8"?><result><firm><active>true</active></firm></result>',
+        '/get/invoice/': invoice_data(),
+        '/get/all/': all_data(pkds),
+        '/get/vies/': vies_data(),
+        '/check/vat/': vat_status(),
+        '/check/iban/': iban_status(),
+        '/check/whitelist/': whitelist_status(),
+        '/search/vat/': search_result(entities),
+        '/check/account/': account_status()
+    }
@@ -34,11 +34,31 @@ from nip24.vatperson import *
 from nip24.vatentity import *
 from nip24.searchresult import *
 from nip24.accountstatus import *
+from nip24.lazymodel import *
+from nip24.lazyalldata import *
+from nip24.schema import *
 from nip24.nip import *
 from nip24.regon import *
 from nip24.krs import *
 from nip24.euvat import *
 from nip24.iban import *
+from nip24.result import *
+from nip24.stringpool import *
+from nip24.mapper import *
+from nip24.resulttable import *
+from nip24.codec import *
+from nip24.response import *
+from nip24.httputil import *
+from nip24.bodyreader import *
+from nip24.transport import *
+from nip24.memorytransport import *
+from nip24.connectionpool import *
+from nip24.ratelimiter import *
+from nip24.retrypolicy import *
+from nip24.singleflight import *
+from nip24.asyncconnectionpool import *
+from nip24.basenip24client import *
 from nip24.nip24client import *
+from nip24.asyncnip24client import *
 
 __version__ = '1.4.2'
@@ -26,6 +26,16 @@ class AccountStatus:
     Account status
     """
 
+    __slots__ = (
+        'uid', 'type', 'validTo', 'billingPlanName', 'subscriptionPrice', 'itemPrice', 'itemPriceStatus',
+        'itemPriceInvoice', 'itemPriceAll', 'itemPriceIBAN', 'itemPriceWhitelist', 'itemPriceSearchVAT', 'limit',
+        'requestDelay', 'domainLimit', 'overPlanAllowed', 'terytCodes', 'excelAddIn', 'JPKVAT', 'CLI', 'stats',
+        'nipMonitor', 'searchByNIP', 'searchByREGON', 'searchByKRS', 'funcIsActive', 'funcGetInvoiceData',
+        'funcGetAllData', 'funcGetVIESData', 'funcGetVATStatus', 'funcGetIBANStatus', 'funcGetWhitelistStatus',
+        'funcSearchVAT', 'invoiceDataCount', 'allDataCount', 'firmStatusCount', 'vatStatusCount', 'viesStatusCount',
+        'ibanStatusCount', 'whitelistStatusCount', 'searchVATCount', 'totalCount'
+    )
+
     def __init__(self):
         self.uid = None
 
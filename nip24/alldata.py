@@ -26,6 +26,16 @@ class AllData:
     All firm data
     """
 
+    __slots__ = (
+        'uid', 'type', 'nip', 'regon', 'name', 'shortname', 'firstname', 'secondname', 'lastname', 'street',
+        'streetCode', 'streetNumber', 'houseNumber', 'city', 'cityCode', 'community', 'communityCode', 'county',
+        'countyCode', 'state', 'stateCode', 'postCode', 'postCity', 'phone', 'email', 'www', 'creationDate',
+        'startDate', 'registrationDate', 'holdDate', 'renevalDate', 'lastUpdateDate', 'endDate', 'registryEntityCode',
+        'registryEntityName', 'registryCode', 'registryName', 'recordCreationDate', 'recordNumber',
+        'basicLegalFormCode', 'basicLegalFormName', 'specificLegalFormCode', 'specificLegalFormName',
+        'ownershipFormCode', 'ownershipFormName', 'businessPartner', 'pkd'
+    )
+
     def __init__(self):
         self.uid = None
         self.type = None
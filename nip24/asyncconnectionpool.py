@@ -0,0 +1,385 @@
+#
+# -*- coding: utf-8 -*-
+#
+# Copyright 2015-2025 NETCAT (www.netcat.pl)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# @author NETCAT <firma@netcat.pl>
+# @copyright 2015-2025 NETCAT (www.netcat.pl)
+# @license http://www.apache.org/licenses/LICENSE-2.0
+#
+
+
+import asyncio
+import http.client
+import time
+
+from nip24 import Response, AsyncTransport, HTTPUtil
+
+
+class AsyncConnectionPool(AsyncTransport):
+    """
+    HTTP/1.1 keep-alive connection pool for asyncio
+
+    Connections and limits are kept separately for every event loop using the pool. Like ConnectionPool, the pool
+    uses proxies configured by environment variables (http_proxy, https_proxy, no_proxy) and follows redirects of
+    GET and HEAD requests.
+    """
+
+    def __init__(self, maxConnections=100, idleTimeout=30.0):
+        """
+        Construct new connection pool
+
+        :param maxConnections: maximum number of connections opened to a single host
+        :type maxConnections: int
+        :param idleTimeout: number of seconds after which an idle connection is closed (0 - disable reuse)
+        :type idleTimeout: float
+        """
+
+        self.maxConnections = maxConnections
+        self.idleTimeout = idleTimeout
+
+        # host state per event loop, connections and semaphores cannot be shared by different loops
+        self.__loops__ = {}
+
+    async def send(self, method, url, headers, connectTimeout=None, readTimeout=None, deadline=None):
+        """
+        Send HTTP request using pooled connection
+
+        :param method: HTTP method
+        :type method: str
+        :param url: target URL
+        :type url: str
+        :param headers: request headers
+        :type headers: dict
+        :param connectTimeout: connect timeout in seconds (None - no timeout)
+        :type connectTimeout: float
+        :param readTimeout: timeout of sending request and reading whole response in seconds (None - no timeout)
+        :type readTimeout: float
+        :param deadline: call deadline as time.monotonic() value limiting also the wait for a free connection and
+            reading of the body (None - no limit)
+        :type deadline: float
+        :return: response with lowercase header names
+        :rtype: Response
+        """
+
+        for redirect in range(HTTPUtil.MAX_REDIRECTS + 1):
+            status, hdrs, body = await self.__send(method, url, headers, connectTimeout, readTimeout, deadline)
+
+            location = HTTPUtil.getLocation(method, url, status, hdrs.get('location'))
+
+            if not location:
+                break
+
+            url = location
+
+        return Response(status, hdrs, body)
+
+    async def close(self):
+        """
+        Close all idle connections
+        """
+
+        for host in self.__get_hosts().values():
+            for conn, ts in host['idle']:
+                conn[1].close()
+
+            host['idle'] = []
+
+    async def __send(self, method, url, headers, connectTimeout, readTimeout, deadline):
+        """
+        Send HTTP request using pooled connection without following redirects
+
+        :param method: HTTP method
+        :type method: str
+        :param url: target URL
+        :type url: str
+        :param headers: request headers
+        :type headers: dict
+        :param connectTimeout: connect timeout in seconds (None - no timeout)
+        :type connectTimeout: float
+        :param readTimeout: timeout of sending request and reading whole response in seconds (None - no timeout)
+        :type readTimeout: float
+        :param deadline: call deadline as time.monotonic() value (None - no limit)
+        :type deadline: float
+        :return: response status, response headers with lowercase names and response body
+        :rtype: tuple
+        """
+
+        key, path, netloc = HTTPUtil.splitURL(url)
+
+        hosts = self.__get_hosts()
+        host = hosts.get(key)
+
+        if not host:
+            host = hosts[key] = {'idle': [], 'slots': asyncio.Semaphore(self.maxConnections),
+                                 'proxy': HTTPUtil.getProxy(key)}
+
+        path, headers = HTTPUtil.getProxyRequest(key, path, netloc, headers, host['proxy'])
+
+        slots = host['slots']
+
+        if deadline is None:
+            await slots.acquire()
+        else:
+            await asyncio.wait_for(slots.acquire(), HTTPUtil.getTimeout(None, deadline))
+
+        try:
+            conn = self.__acquire(host)
+            reused = conn is not None
+
+            while True:
+                try:
+                    if not conn:
+                        conn = await asyncio.wait_for(self.__connect(key, host['proxy']),
+                                                      HTTPUtil.getTimeout(connectTimeout, deadline))
+
+                    # whole exchange including the body is limited, so a slow server cannot keep it past the deadline
+                    status, hdrs, body, keep = await asyncio.wait_for(
+                        self.__exchange(conn, method, path, netloc, headers),
+                        HTTPUtil.getTimeout(readTimeout, deadline))
+                    break
+                except ConnectionError:
+                    # server closed kept-alive connection, safe to repeat only idempotent requests
+                    if conn:
+                        conn[1].close()
+
+                    if not reused or method not in HTTPUtil.IDEMPOTENT_METHODS:
+                        raise
+
+                    conn = None
+                    reused = False
+                except BaseException:
+                    if conn:
+                        conn[1].close()
+
+                    raise
+
+            if keep and self.idleTimeout > 0:
+                host['idle'].append((conn, time.monotonic()))
+            else:
+                conn[1].close()
+        finally:
+            slots.release()
+
+        return status, hdrs, body
+
+    def __get_hosts(self):
+        """
+        Get host state of running event loop
+
+        :return: host state by host key
+        :rtype: dict
+        """
+
+        loop = asyncio.get_running_loop()
+        hosts = self.__loops__.get(loop)
+
+        if hosts is None:
+            # connections of closed loops cannot be used nor closed any more, they are released with the loop
+            for other in list(self.__loops__):
+                if other.is_closed():
+                    self.__loops__.pop(other, None)
+
+            hosts = self.__loops__[loop] = {}
+
+        return hosts
+
+    def __acquire(self, host):
+        """
+        Get idle connection
+
+        :param host: host state
+        :type host: dict
+        :return: reader and writer pair or None
+        :rtype: tuple or None
+        """
+
+        now = time.monotonic()
+
+        while host['idle']:
+            conn, ts = host['idle'].pop()
+
+            if now - ts <= self.idleTimeout and not conn[0].at_eof() and not conn[1].is_closing():
+                return conn
+
+            conn[1].close()
+
+        return None
+
+    async def __connect(self, key, proxy):
+        """
+        Open new connection
+
+        :param key: host key
+        :type key: tuple
+        :param proxy: proxy host, port and headers or None
+        :type proxy: tuple
+        :return: reader and writer pair
+        :rtype: tuple
+        """
+
+        scheme, host, port = key
+
+        if not proxy:
+            if scheme == 'https':
+                return await asyncio.open_connection(host, port, ssl=HTTPUtil.getSSLContext(), server_hostname=host)
+
+            return await asyncio.open_connection(host, port)
+
+        reader, writer = await asyncio.open_connection(proxy[0], proxy[1])
+
+        if scheme == 'https':
+            try:
+                await self.__tunnel((reader, writer), host, port, proxy[2])
+            except BaseException:
+                writer.close()
+                raise
+
+        return reader, writer
+
+    async def __tunnel(self, conn, host, port, headers):
+        """
+        Open tunnel to the host through the proxy and start TLS over it
+
+        :param conn: reader and writer pair connected to the proxy
+        :type conn: tuple
+        :param host: target host
+        :type host: str
+        :param port: target port
+        :type port: int
+        :param headers: proxy request headers
+        :type headers: dict
+        """
+
+        reader, writer = conn
+
+        target = ('[' + host + ']' if ':' in host else host) + ':' + str(port)
+
+        lines = ['CONNECT ' + target + ' HTTP/1.1', 'Host: ' + target]
+        lines.extend(k + ': ' + v for k, v in headers.items())
+
+        writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1'))
+        await writer.drain()
+
+        version, status, hdrs = await self.__read_head(reader)
+
+        if status != 200:
+            raise OSError('Tunnel connection failed: ' + str(status))
+
+        await writer.start_tls(HTTPUtil.getSSLContext(), server_hostname=host)
+
+    async def __exchange(self, conn, method, path, netloc, headers):
+        """
+        Send request and read response
+
+        :param conn: reader and writer pair
+        :type conn: tuple
+        :param method: HTTP method
+        :type method: str
+        :param path: request path
+        :type path: str
+        :param netloc: host header value
+        :type netloc: str
+        :param headers: request headers
+        :type headers: dict
+        :return: response status, response headers with lowercase names, response body and keep-alive flag
+        :rtype: tuple
+        """
+
+        reader, writer = conn
+
+        lines = [method + ' ' + path + ' HTTP/1.1', 'Host: ' + netloc]
+        lines.extend(k + ': ' + v for k, v in headers.items())
+
+        writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1'))
+        await writer.drain()
+
+        version, status, hdrs = await self.__read_head(reader)
+
+        # body
+        try:
+            if method == 'HEAD' or status in (204, 304):
+                body = b''
+            elif hdrs.get('transfer-encoding', '').lower() == 'chunked':
+                chunks = []
+
+                while True:
+                    size = int((await reader.readline()).split(b';')[0].strip(), 16)
+
+                    if size == 0:
+                        # trailer
+                        while (await reader.readline()) not in (b'\r\n', b'\n', b''):
+                            pass
+
+                        break
+
+                    chunks.append(await reader.readexactly(size))
+                    await reader.readexactly(2)
+
+                body = b''.join(chunks)
+            elif 'content-length' in hdrs:
+                body = await reader.readexactly(int(hdrs['content-length']))
+            else:
+                body = await reader.read()
+                hdrs['connection'] = 'close'
+        except asyncio.IncompleteReadError as e:
+            raise http.client.IncompleteRead(e.partial)
+        except ValueError:
+            raise http.client.HTTPException('Invalid chunk size or content length')
+
+        keep = version == 'HTTP/1.1' and hdrs.get('connection', '').lower() != 'close'
+
+        return status, hdrs, body, keep
+
+    async def __read_head(self, reader):
+        """
+        Read response status line and headers, skipping interim 1xx responses
+
+        :param reader: stream reader
+        :type reader: asyncio.StreamReader
+        :return: response version, status and headers with lowercase names
+        :rtype: tuple
+        """
+
+        while True:
+            line = await reader.readline()
+
+            if not line:
+                raise http.client.RemoteDisconnected('Remote end closed connection without response')
+
+            parts = line.decode('latin-1').split(None, 2)
+
+            if len(parts) < 2 or not parts[0].startswith('HTTP/') or not parts[1].isdigit():
+                raise http.client.BadStatusLine(line)
+
+            version = parts[0]
+            status = int(parts[1])
+
+            hdrs = {}
+
+            while True:
+                line = await reader.readline()
+
+                if line in (b'\r\n', b'\n'):
+                    break
+
+                if not line:
+                    raise http.client.IncompleteRead(b'')
+
+                name, sep, value = line.decode('latin-1').partition(':')
+                hdrs[name.strip().lower()] = value.strip()
+
+            if status >= 200:
+                return version, status, hdrs
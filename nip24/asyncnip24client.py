@@ -0,0 +1,914 @@
+#
+# -*- coding: utf-8 -*-
+#
+# Copyright 2015-2025 NETCAT (www.netcat.pl)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# @author NETCAT <firma@netcat.pl>
+# @copyright 2015-2025 NETCAT (www.netcat.pl)
+# @license http://www.apache.org/licenses/LICENSE-2.0
+#
+
+
+import asyncio
+import http.client
+import time
+
+from nip24 import Error, Number, Mapper, Result, RateLimiter, BaseNIP24Client, AsyncConnectionPool, AsyncSingleFlight
+
+
+class AsyncNIP24Client(BaseNIP24Client):
+    """
+    NIP24 service client for asyncio
+
+    Provides the same methods as NIP24Client, methods sending requests are coroutines.
+    """
+
+    def __init__(self, id=None, key=None):
+        """
+        Construct new service client object
+
+        :param id: NIP24 key identifier
+        :type id: str
+        :param key: NIP24 key
+        :type key: str
+        """
+
+        BaseNIP24Client.__init__(self, id, key)
+
+        self.__transport__ = AsyncConnectionPool()
+        self.__flight__ = AsyncSingleFlight()
+
+    def setTransport(self, transport):
+        """
+        Set non default HTTP transport
+
+        :param transport: transport object, e.g. AsyncConnectionPool(idleTimeout=0) to disable keep-alive
+        :type transport: AsyncTransport
+        """
+
+        self.__transport__ = transport
+
+    def setSingleFlight(self, enabled):
+        """
+        Enable or disable sharing of one in-flight request by concurrent identical calls
+
+        :param enabled: True to coalesce identical concurrent requests (default)
+        :type enabled: bool
+        """
+
+        self.__flight__ = AsyncSingleFlight() if enabled else None
+
+    async def configureRateLimiter(self, burst=1):
+        """
+        Configure client side rate limiter using current account's billing plan
+
+        :param burst: number of requests that may be sent at once without waiting
+        :type burst: int
+        :return: True if rate limiter was configured
+        :rtype: bool
+        """
+
+        status = await self.getAccountStatus()
+
+        if not status:
+            return False
+
+        self.setRateLimiter(RateLimiter.fromAccountStatus(status, burst))
+
+        return True
+
+    async def close(self):
+        """
+        Close idle connections
+        """
+
+        await self.__transport__.close()
+
+    async def call(self, method, *args, **kwargs):
+        """
+        Call client method and return its result together with error info
+
+        :param method: bound client method, e.g. client.getAllDataExt
+        :type method: callable
+        :param args: method arguments
+        :param kwargs: method keyword arguments
+        :return: call result
+        :rtype: Result
+        """
+
+        start = time.perf_counter()
+        value = await method(*args, **kwargs)
+
+        return Result(value, self.getLastErrorCode(), self.getLastError(), time.perf_counter() - start)
+
+    async def callRaw(self, method, *args, **kwargs):
+        """
+        Call client method and return service response XML instead of model object together with error info
+
+        The request is validated, sent, retried and shared with concurrent identical calls as by the method
+        itself, only the response is not mapped. Supported are methods returning single result, e.g. isActiveExt,
+        getAllDataExt, searchVATRegistryExt or getAccountStatus.
+
+        :param method: bound client method, e.g. client.getAllDataExt
+        :type method: callable
+        :param args: method arguments
+        :param kwargs: method keyword arguments
+        :return: call result with response XML as received (decompressed) or False as value, in streaming mode the
+            XML is serialized from the parsed response
+        :rtype: Result
+        """
+
+        start = time.perf_counter()
+        previous = self._begin_raw()
+
+        try:
+            return self._raw_result(await method(*args, **kwargs), start, True)
+        finally:
+            self._end_raw(previous)
+
+    async def callElement(self, method, *args, **kwargs):
+        """
+        Call client method and return root element of service response instead of model object together with error
+        info
+
+        Same as callRaw(), but the parsed response is returned. It may be shared with concurrent identical calls
+        and must not be modified.
+
+        :param method: bound client method, e.g. client.getAllDataExt
+        :type method: callable
+        :param args: method arguments
+        :param kwargs: method keyword arguments
+        :return: call result with response root element or False as value
+        :rtype: Result
+        """
+
+        start = time.perf_counter()
+        previous = self._begin_raw()
+
+        try:
+            return self._raw_result(await method(*args, **kwargs), start, False)
+        finally:
+            self._end_raw(previous)
+
+    async def isActive(self, nip_):
+        """
+        Check firm activity
+
+        :param nip_: NIP number
+        :type nip_: str
+        :returns: True is firm is active
+        :rtype: bool
+        """
+
+        return await self.isActiveExt(Number.NIP, nip_)
+
+    async def isActiveExt(self, type, number):
+        """
+        Check firm activity
+
+        :param type: search number type as Number.xxx value
+        :type type: Number
+        :param number: search number value
+        :type number: str
+        :returns: True is firm is active
+        :rtype: bool
+        """
+
+        url = self._get_url('/check/firm/', type, number)
+
+        if not url:
+            return False
+
+        return self._is_active(await self.__fetch(url))
+
+    async def getInvoiceData(self, nip, force=True):
+        """
+        Get invoice data for specified NIP number
+
+        :param nip: NIP number
+        :type nip: str
+        :param force: ignored, left for backward compatibility
+        :type force: bool
+        :return: InvoiceData object or False
+        :rtype: InvoiceData or False
+        """
+
+        return await self.getInvoiceDataExt(Number.NIP, nip)
+
+    async def getInvoiceDataExt(self, type, number, force=True):
+        """
+        Get invoice data for specified number type
+
+        :param type: search number type as Number.xxx value
+        :type type: Number
+        :param number: search number value
+        :type number: str
+        :param force: ignored, left for backward compatibility
+        :type force: bool
+        :return: InvoiceData object or False
+        :rtype: InvoiceData or False
+        """
+
+        url = self._get_url('/get/invoice/', type, number)
+
+        if not url:
+            return False
+
+        return self._map(await self.__fetch(url), Mapper.invoiceData)
+
+    async def getAllData(self, nip, force=True, fields=None):
+        """
+        Get all firm data for specified NIP number
+
+        :param nip: NIP number
+        :type nip: str
+        :param force: ignored, left for backward compatibility
+        :type force: bool
+        :param fields: names of AllData attributes to map, e.g. ['name', 'regon', 'pkd'] (None - all attributes)
+        :type fields: iterable of str
+        :return: AllData object or False
+        :rtype: AllData or False
+        """
+
+        return await self.getAllDataExt(Number.NIP, nip, fields=fields)
+
+    async def getAllDataExt(self, type, number, force=True, fields=None):
+        """
+        Get all data for specified number type
+
+        :param type: search number type as Number.xxx value
+        :type type: Number
+        :param number: search number value
+        :type number: str
+        :param force: ignored, left for backward compatibility
+        :type force: bool
+        :param fields: names of AllData attributes to map, other attributes keep default values, lists
+            businessPartner and pkd are built only if named (None - all attributes, ignored in lazy mode)
+        :type fields: iterable of str
+        :return: AllData object or False
+        :rtype: AllData or False
+        :raises ValueError: if fields contain a name which is not an AllData attribute
+        """
+
+        # fail before sending the request
+        self._check_fields(fields)
+
+        return self._map(await self.__get_all_data(type, number), Mapper.allData, fields)
+
+    async def getVIESData(self, euvat):
+        """
+        Get VIES data for specified number
+
+        :param euvat: EU VAT number with 2-letter country prefix
+        :type euvat: str
+        :return: VIESData object or False
+        :rtype: VIESData or False
+        """
+
+        url = self._get_url('/get/vies/', Number.EUVAT, euvat)
+
+        if not url:
+            return False
+
+        return self._map(await self.__fetch(url), Mapper.viesData)
+
+    async def getVATStatus(self, nip, direct=True):
+        """
+        Check if frim is an active VAT payer
+
+        :param nip: NIP number
+        :type nip: str
+        :param direct: ignored, left for backward compatibility
+        :type direct: bool
+        :return: VATStatus object or False
+        :rtype: VATStatus or False
+        """
+
+        return await self.getVATStatusExt(Number.NIP, nip)
+
+    async def getVATStatusExt(self, type, number, direct=True):
+        """
+        Check if firm is an active VAT payer
+
+        :param type: search number type as Number.xxx value
+        :type type: Number
+        :param number: search number value
+        :type number: str
+        :param direct: ignored, left for backward compatibility
+        :type direct: bool
+        :return: VATStatus object or False
+        :rtype: VATStatus or False
+        """
+
+        url = self._get_url('/check/vat/direct/', type, number)
+
+        if not url:
+            return False
+
+        return self._map(await self.__fetch(url), Mapper.vatStatus)
+
+    async def getIBANStatus(self, nip, iban, date=None):
+        """
+        Check if firm owns bank account number
+
+        :param nip: NIP number
+        :type nip: str
+        :param iban: bank account IBAN (for polish numbers PL prefix may be omitted)
+        :type iban: str
+        :param date: date in format 'yyyy-mm-dd' (null - current day)
+        :type date: str
+        :return: IBANStatus object or False
+        :rtype: IBANStatus or False
+        """
+
+        return await self.getIBANStatusExt(Number.NIP, nip, iban, date)
+
+    async def getIBANStatusExt(self, type, number, iban, date=None):
+        """
+        Check if firm owns bank account number
+
+        :param type: search number type as Number.xxx value
+        :type type: Number
+        :param number: search number value
+        :type number: str
+        :param iban: bank account IBAN (for polish numbers PL prefix may be omitted)
+        :type iban: str
+        :param date: date in format 'yyyy-mm-dd' (None - current day)
+        :type date: str
+        :return: IBANStatus object or False
+        :rtype: IBANStatus or False
+        """
+
+        url = self._get_iban_url('/check/iban/', type, number, iban, date)
+
+        if not url:
+            return False
+
+        return self._map(await self.__fetch(url), Mapper.ibanStatus)
+
+    async def getWhitelistStatus(self, nip, iban, date=None):
+        """
+        Check bank account status and VAT status using whitelist file
+
+        :param nip: NIP number
+        :type nip: str
+        :param iban: bank account IBAN (for polish numbers PL prefix may be omitted)
+        :type iban: str
+        :param date: date in format 'yyyy-mm-dd' (null - current day)
+        :type date: str
+        :return: WLStatus object or False
+        :rtype: WLStatus or False
+        """
+
+        return await self.getWhitelistStatusExt(Number.NIP, nip, iban, date)
+
+    async def getWhitelistStatusExt(self, type, number, iban, date=None):
+        """
+        Check bank account status and VAT status using whitelist file
+
+        :param type: search number type as Number.xxx value
+        :type type: Number
+        :param number: search number value
+        :type number: str
+        :param iban: bank account IBAN (for polish numbers PL prefix may be omitted)
+        :type iban: str
+        :param date: date in format 'yyyy-mm-dd' (None - current day)
+        :type date: str
+        :return: WLStatus object or False
+        :rtype: WLStatus or False
+        """
+
+        url = self._get_iban_url('/check/whitelist/', type, number, iban, date)
+
+        if not url:
+            return False
+
+        return self._map(await self.__fetch(url), Mapper.wlStatus)
+
+    async def searchVATRegistry(self, nip, date=None):
+        """
+        Search data in VAT registry
+
+        :param nip: NIP number
+        :type nip: str
+        :param date: date in format 'yyyy-mm-dd' (null - current day)
+        :type date: str
+        :return: search result object or False
+        :rtype: SearchResult or False
+        """
+
+        return await self.searchVATRegistryExt(Number.NIP, nip, date)
+
+    async def searchVATRegistryExt(self, type, number, date=None):
+        """
+        Search data in VAT registry
+
+        :param type: search number type as Number.xxx value
+        :type type: Number
+        :param number: search number value
+        :type number: str
+        :param date: date in format 'yyyy-mm-dd' (None - current day)
+        :type date: str
+        :return: search result object or False
+        :rtype: SearchResult or False
+        """
+
+        url = self._get_search_url(type, number, date)
+
+        if not url:
+            return False
+
+        # send request
+        entities = [] if self.__stream__ else None
+
+        doc = await self.__fetch(url, entities)
+
+        if not doc:
+            return False
+
+        return Mapper.searchResult(doc, entities)
+
+    async def iterVATRegistry(self, nip, date=None):
+        """
+        Search data in VAT registry, yielding entities one by one
+
+        :param nip: NIP number
+        :type nip: str
+        :param date: date in format 'yyyy-mm-dd' (None - current day)
+        :type date: str
+        :return: asynchronous generator of VATEntity objects, check getLastErrorCode() after iteration
+        :rtype: async_generator
+        """
+
+        async for ve in self.iterVATRegistryExt(Number.NIP, nip, date):
+            yield ve
+
+    async def iterVATRegistryExt(self, type, number, date=None):
+        """
+        Search data in VAT registry, yielding entities one by one
+
+        Response is received as a whole, entities are mapped while it is parsed and are not kept by the client.
+        Iteration ends early on error, in which case getLastErrorCode() returns error code.
+
+        :param type: search number type as Number.xxx value
+        :type type: Number
+        :param number: search number value
+        :type number: str
+        :param date: date in format 'yyyy-mm-dd' (None - current day)
+        :type date: str
+        :return: asynchronous generator of VATEntity objects, check getLastErrorCode() after iteration
+        :rtype: async_generator
+        """
+
+        url = self._get_search_url(type, number, date)
+
+        if not url:
+            return
+
+        # send request, it can be repeated only until first entity is returned
+        deadline = self._get_deadline()
+        attempt = 0
+
+        while True:
+            self._clear()
+
+            res = await self.__get(url, deadline)
+            yielded = False
+
+            if not res:
+                if not self.getLastErrorCode():
+                    self._set(Error.CLI_CONNECT)
+            else:
+                entities = Mapper.iterSearchResult(res.body, res.headers.get('content-encoding'))
+
+                try:
+                    while True:
+                        ve = next(entities)
+                        yielded = True
+
+                        yield ve
+                except StopIteration as e:
+                    if self._check(e.value):
+                        return
+
+            if yielded:
+                return
+
+            delay = self._get_retry_delay(attempt, deadline)
+
+            if delay is None:
+                return
+
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def searchVATRegistryTable(self, type, number, date=None):
+        """
+        Search data in VAT registry and return found entities as a columnar table
+
+        Rows are filled while the response is parsed, without creating VATEntity objects.
+
+        :param type: search number type as Number.xxx value
+        :type type: Number
+        :param number: search number value
+        :type number: str
+        :param date: date in format 'yyyy-mm-dd' (None - current day)
+        :type date: str
+        :return: table of VATEntity attributes or False
+        :rtype: ResultTable or False
+        """
+
+        url = self._get_search_url(type, number, date)
+
+        if not url:
+            return False
+
+        # send request
+        table = self._search_table()
+
+        if not await self.__fetch(url, table):
+            return False
+
+        return table
+
+    async def getAccountStatus(self):
+        """
+        Get user account's status
+
+        :return: AccountStatus object or False
+        :rtype: AccountStatus or False
+        """
+
+        return self._map(await self.__fetch(self._get_url('/check/account/status')), Mapper.accountStatus)
+
+    async def isActiveBatch(self, numbers, *, workers=10):
+        """
+        Check activity of many firms concurrently
+
+        :param numbers: iterable of (Number.xxx, number) pairs
+        :type numbers: iterable
+        :param workers: maximum number of concurrent requests
+        :type workers: int
+        :return: list of results in input order, each with True or False as value
+        :rtype: list of Result
+        """
+
+        return await self.__batch(self.isActiveExt, numbers, workers)
+
+    async def getInvoiceDataBatch(self, numbers, *, workers=10):
+        """
+        Get invoice data for many numbers concurrently
+
+        :param numbers: iterable of (Number.xxx, number) pairs
+        :type numbers: iterable
+        :param workers: maximum number of concurrent requests
+        :type workers: int
+        :return: list of results in input order, each with InvoiceData object or False as value
+        :rtype: list of Result
+        """
+
+        return await self.__batch(self.getInvoiceDataExt, numbers, workers)
+
+    async def getAllDataBatch(self, numbers, *, workers=10, fields=None):
+        """
+        Get all data for many numbers concurrently
+
+        :param numbers: iterable of (Number.xxx, number) pairs
+        :type numbers: iterable
+        :param workers: maximum number of concurrent requests
+        :type workers: int
+        :param fields: names of AllData attributes to map (None - all attributes)
+        :type fields: iterable of str
+        :return: list of results in input order, each with AllData object or False as value
+        :rtype: list of Result
+        :raises ValueError: if fields contain a name which is not an AllData attribute
+        """
+
+        return await self.__batch(self.getAllDataExt, numbers, workers, True, fields)
+
+    async def getAllDataTable(self, numbers, *, workers=10, fields=None):
+        """
+        Get all data for many numbers concurrently as a columnar table
+
+        Rows are filled directly from parsed responses, without creating AllData objects. Every response is
+        released as soon as its rows are added, only responses of up to 2 * workers items are kept at once.
+
+        :param numbers: iterable of (Number.xxx, number) pairs
+        :type numbers: iterable
+        :param workers: maximum number of concurrent requests
+        :type workers: int
+        :param fields: names of AllData attributes to include as columns or lists (None - all attributes)
+        :type fields: iterable of str
+        :return: table with a row per input item in input order, columns code and error hold error info of items
+            whose other columns are left empty
+        :rtype: ResultTable
+        :raises ValueError: if fields contain a name which is not an AllData attribute
+        """
+
+        table = self._all_data_table(fields)
+
+        await self.__batch_table(table, numbers, workers)
+
+        return table
+
+    async def getVIESDataBatch(self, euvats, *, workers=10):
+        """
+        Get VIES data for many numbers concurrently
+
+        :param euvats: iterable of EU VAT numbers with 2-letter country prefix
+        :type euvats: iterable
+        :param workers: maximum number of concurrent requests
+        :type workers: int
+        :return: list of results in input order, each with VIESData object or False as value
+        :rtype: list of Result
+        """
+
+        return await self.__batch(lambda type, number: self.getVIESData(number), ((Number.EUVAT, euvat) for euvat in euvats), workers)
+
+    async def getVATStatusBatch(self, numbers, *, workers=10):
+        """
+        Check VAT status of many firms concurrently
+
+        :param numbers: iterable of (Number.xxx, number) pairs
+        :type numbers: iterable
+        :param workers: maximum number of concurrent requests
+        :type workers: int
+        :return: list of results in input order, each with VATStatus object or False as value
+        :rtype: list of Result
+        """
+
+        return await self.__batch(self.getVATStatusExt, numbers, workers)
+
+    async def getIBANStatusBatch(self, numbers, date=None, *, workers=10):
+        """
+        Check bank accounts of many firms concurrently
+
+        :param numbers: iterable of (Number.xxx, number, iban) tuples
+        :type numbers: iterable
+        :param date: date in format 'yyyy-mm-dd' (None - current day)
+        :type date: str
+        :param workers: maximum number of concurrent requests
+        :type workers: int
+        :return: list of results in input order, each with IBANStatus object or False as value
+        :rtype: list of Result
+        """
+
+        return await self.__batch(self.getIBANStatusExt, numbers, workers, date)
+
+    async def getWhitelistStatusBatch(self, numbers, date=None, *, workers=10):
+        """
+        Check bank accounts and VAT status of many firms using whitelist file concurrently
+
+        :param numbers: iterable of (Number.xxx, number, iban) tuples
+        :type numbers: iterable
+        :param date: date in format 'yyyy-mm-dd' (None - current day)
+        :type date: str
+        :param workers: maximum number of concurrent requests
+        :type workers: int
+        :return: list of results in input order, each with WLStatus object or False as value
+        :rtype: list of Result
+        """
+
+        return await self.__batch(self.getWhitelistStatusExt, numbers, workers, date)
+
+    async def searchVATRegistryBatch(self, numbers, date=None, *, workers=10):
+        """
+        Search data in VAT registry for many numbers concurrently
+
+        :param numbers: iterable of (Number.xxx, number) pairs
+        :type numbers: iterable
+        :param date: date in format 'yyyy-mm-dd' (None - current day)
+        :type date: str
+        :param workers: maximum number of concurrent requests
+        :type workers: int
+        :return: list of results in input order, each with SearchResult object or False as value
+        :rtype: list of Result
+        """
+
+        return await self.__batch(self.searchVATRegistryExt, numbers, workers, date)
+
+    async def __batch(self, method, items, workers, *args):
+        """
+        Call method for every unique item using concurrent tasks
+
+        :param method: bound client method
+        :type method: callable
+        :param items: iterable of method arguments tuples
+        :type items: iterable
+        :param workers: maximum number of concurrent requests
+        :type workers: int
+        :param args: additional arguments common to all calls
+        :return: list of results in input order
+        :rtype: list of Result
+        """
+
+        keys, unique, results = self._prepare_batch(items)
+
+        slots = asyncio.Semaphore(workers)
+
+        async def run(item):
+            async with slots:
+                return await self.call(method, *(item + args))
+
+        values = await asyncio.gather(*[run(item) for item in unique.values()])
+        results.update(zip(unique.keys(), values))
+
+        return [results[key] for key in keys]
+
+    async def __batch_table(self, table, items, workers):
+        """
+        Get all data for every unique item using concurrent tasks and add rows to the table in input order
+
+        :param table: table receiving rows
+        :type table: ResultTable
+        :param items: iterable of (Number.xxx, number) pairs
+        :type items: iterable
+        :param workers: maximum number of concurrent requests
+        :type workers: int
+        """
+
+        keys, unique, results = self._prepare_batch(items)
+
+        # row of last occurrence of every item, its response is released after adding it
+        last = dict((key, i) for i, key in enumerate(keys))
+        pending = {}
+        queue = iter(unique.items())
+
+        slots = asyncio.Semaphore(workers)
+
+        async def run(item):
+            async with slots:
+                return await self.call(self.__get_all_data, *item)
+
+        try:
+            for i, key in enumerate(keys):
+                result = results.get(key)
+
+                if result is None:
+                    # requests are sent ahead of the row being added, but not more than 2 * workers
+                    while key not in pending or len(pending) < 2 * workers:
+                        entry = next(queue, None)
+
+                        if not entry:
+                            break
+
+                        pending[entry[0]] = asyncio.ensure_future(run(entry[1]))
+
+                    result = await pending[key]
+
+                    if last[key] == i:
+                        del pending[key]
+
+                self._add_row(table, result)
+        finally:
+            # requests of remaining items if the call is cancelled
+            for task in pending.values():
+                task.cancel()
+
+    async def __get_all_data(self, type, number):
+        """
+        Get all data response document
+
+        :param type: search number type as Number.xxx value
+        :type type: Number
+        :param number: search number value
+        :type number: str
+        :return: etree document or False
+        :rtype: tree or False
+        """
+
+        url = self._get_url('/get/all/', type, number)
+
+        if not url:
+            return False
+
+        return await self.__fetch(url) or False
+
+    async def __fetch(self, url, entities=None):
+        """
+        Send request and parse response, sharing the request with concurrent identical calls
+
+        :param url: target URL
+        :type url: str
+        :param entities: list or table receiving entities mapped while parsing search result (None - do not map
+            entities)
+        :type entities: list of VATEntity or ResultTable
+        :return: etree document or None
+        :rtype: tree or None
+        """
+
+        raw = self._get_raw()
+        body = None
+
+        if raw is not None:
+            # callRaw() gets the whole document and the received content
+            entities = None
+            body = []
+
+        deadline = self._get_deadline()
+
+        if not self.__flight__ or entities is not None:
+            # entities are removed from the document while parsing, so it cannot be shared
+            doc = await self.__request(url, deadline, entities, body)
+        else:
+            async def request():
+                doc = await self.__request(url, deadline, body=body)
+                return doc, body, self.getLastErrorCode(), self.getLastError()
+
+            try:
+                # content is kept only for callRaw() calls, so they are shared only with each other
+                doc, body, code, err = await self.__flight__.do(url if body is None else (url, 'raw'), request, deadline)
+            except (asyncio.TimeoutError, TimeoutError):
+                doc, body, code, err = None, None, Error.CLI_TIMEOUT, None
+
+            if code:
+                self._set(code, err)
+            else:
+                self._clear()
+
+        if raw is not None:
+            # response is returned by callRaw(), calling method ends without mapping it
+            self._add_raw(raw, doc, body)
+            return None
+
+        return doc
+
+    async def __request(self, url, deadline, entities=None, body=None):
+        """
+        Send request and parse response, retrying transient errors
+
+        :param url: target URL
+        :type url: str
+        :param deadline: call deadline as time.monotonic() value or None
+        :type deadline: float
+        :param entities: list or table receiving entities mapped while parsing search result (None - do not map
+            entities)
+        :type entities: list of VATEntity or ResultTable
+        :param body: list receiving decompressed response content (None - content is not kept)
+        :type body: list of bytes
+        :return: etree document or None
+        :rtype: tree or None
+        """
+
+        attempt = 0
+
+        while True:
+            self._clear()
+
+            doc = self._parse(await self.__get(url, deadline), entities, body)
+
+            if doc:
+                return doc
+
+            delay = self._get_retry_delay(attempt, deadline)
+
+            if delay is None:
+                return None
+
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def __get(self, url, deadline=None):
+        """
+        Get result of HTTP GET request
+
+        :param url: target URL
+        :type url: str
+        :param deadline: call deadline as time.monotonic() value or None
+        :type deadline: float
+        :returns: HTTP response or False
+        :rtype: Response or False
+        """
+
+        request = self._prepare_get(url, deadline)
+
+        if not request:
+            return False
+
+        headers, wait, timeouts = request
+
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+        # send request
+        try:
+            res = await self.__transport__.send('GET', url, headers, *timeouts, deadline=deadline)
+        except (asyncio.TimeoutError, TimeoutError):
+            self._set(Error.CLI_TIMEOUT)
+            return False
+        except (OSError, http.client.HTTPException):
+            return False
+
+        return self._check_response(res)
@@ -0,0 +1,889 @@
+#
+# -*- coding: utf-8 -*-
+#
+# Copyright 2015-2025 NETCAT (www.netcat.pl)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# @author NETCAT <firma@netcat.pl>
+# @copyright 2015-2025 NETCAT (www.netcat.pl)
+# @license http://www.apache.org/licenses/LICENSE-2.0
+#
+
+import base64
+import contextvars
+import datetime
+import hashlib
+import hmac
+import http.client
+import os
+import socket
+import sys
+import time
+import urllib.parse
+import weakref
+
+from nip24 import Error, Number, NIP, REGON, KRS, EUVAT, IBAN, Mapper, ResultTable, Result
+from dateutil.parser import parse
+
+
+class BaseNIP24Client:
+    """
+    Common part of NIP24Client and AsyncNIP24Client
+
+    Holds client configuration, error info, request preparation and response parsing, which do not depend on
+    the way requests are sent.
+    """
+
+    VERSION = '1.4.2'
+
+    PRODUCTION_URL = 'https://www.nip24.pl/api'
+    TEST_URL = 'https://www.nip24.pl/api-test'
+
+    TEST_ID = 'test_id'
+    TEST_KEY = 'test_key'
+
+    HMAC_ALG = hashlib.sha256
+
+    # error info columns of batch result tables
+    TABLE_STATUS_COLUMNS = [('code', 'int'), ('error', 'text')]
+
+    # error info and responses of callRaw() calls in progress of all clients, kept per thread and per asyncio task;
+    # variables are shared, because a context keeps every variable ever set in it
+    __errors__ = contextvars.ContextVar('nip24_errors')
+    __no_error__ = (0, '')
+    __raws__ = contextvars.ContextVar('nip24_raws')
+
+    def __init__(self, id=None, key=None):
+        """
+        Construct new service client object
+
+        :param id: NIP24 key identifier
+        :type id: str
+        :param key: NIP24 key
+        :type key: str
+        """
+        self.__url__ = self.TEST_URL
+        self.__id__ = self.TEST_ID
+        self.__key__ = self.TEST_KEY
+
+        if id is not None and key is not None:
+            self.__url__ = self.PRODUCTION_URL
+            self.__id__ = id
+            self.__key__ = key
+
+        self.__transport__ = None
+        self.__limiter__ = None
+        self.__retry__ = None
+        self.__timeouts__ = (None, None)
+        self.__deadline__ = None
+        self.__flight__ = None
+        self.__stream__ = False
+        self.__lazy__ = False
+
+        # key of this client in context variables, which do not keep the client alive
+        self.__ref__ = weakref.ref(self)
+
+        self._clear()
+
+    def setURL(self, url):
+        """
+        Set non default service URL
+
+        :param url: service URL
+        :type url: str
+        """
+
+        self.__url__ = url
+
+    def setTimeouts(self, connect=None, read=None, deadline=None):
+        """
+        Set request timeouts
+
+        :param connect: connect timeout in seconds (None - no timeout)
+        :type connect: float
+        :param read: response read timeout in seconds (None - no timeout)
+        :type read: float
+        :param deadline: maximum duration of a single call including retries in seconds (None - no limit)
+        :type deadline: float
+        """
+
+        self.__timeouts__ = (connect, read)
+        self.__deadline__ = deadline
+
+    def setStreaming(self, enabled):
+        """
+        Enable or disable streaming response parsing
+
+        Response is parsed while it is being received and entities of search results are mapped and released
+        one by one, which lowers memory usage of large responses. Streamed search requests are not shared
+        by concurrent identical calls. AsyncNIP24Client receives the whole response before parsing it.
+
+        :param enabled: True to parse responses as they arrive (default False)
+        :type enabled: bool
+        """
+
+        self.__stream__ = enabled
+
+    def setLazy(self, enabled):
+        """
+        Enable or disable lazy mapping of responses
+
+        Objects returned by getInvoiceData, getAllData, getVIESData, getVATStatus, getIBANStatus, getWhitelistStatus
+        and getAccountStatus methods keep the parsed response and decode each attribute on its first access, so fields
+        which are never read are never converted. Reading all attributes is slower than eager mapping and the response
+        document stays in memory as long as the object does. Objects are pickled and copied as objects of the model
+        class (e.g. AllData, not LazyAllData), decoding all attributes first.
+
+        :param enabled: True to decode attributes on first access (default False)
+        :type enabled: bool
+        """
+
+        self.__lazy__ = enabled
+
+    def setRateLimiter(self, limiter):
+        """
+        Set client side request rate limiter
+
+        :param limiter: rate limiter or None to disable rate limiting
+        :type limiter: RateLimiter
+        """
+
+        self.__limiter__ = limiter
+
+    def setRetryPolicy(self, policy):
+        """
+        Set retry policy for transient errors
+
+        :param policy: retry policy or None to disable retries
+        :type policy: RetryPolicy
+        """
+
+        self.__retry__ = policy
+
+    def getLastErrorCode(self):
+        """
+        Get last error code
+
+        :return: error code
+        :rtype: int
+        """
+
+        return self._get_context(BaseNIP24Client.__errors__, BaseNIP24Client.__no_error__)[0]
+
+    def getLastError(self):
+        """
+        Get last error message
+
+        :return: unicode string
+        :rtype: str
+        """
+
+        return self._get_context(BaseNIP24Client.__errors__, BaseNIP24Client.__no_error__)[1]
+
+    def _get_url(self, path, type=None, number=None):
+        """
+        Clear error info and prepare request URL
+
+        :param path: service path, e.g. '/get/all/'
+        :type path: str
+        :param type: search number type as Number.xxx value appended to the path (None - no number)
+        :type type: Number
+        :param number: search number value
+        :type number: str
+        :return: request URL or False if number is invalid
+        :rtype: str or False
+        """
+
+        # clear error
+        self._clear()
+
+        if type is None:
+            return self.__url__ + path
+
+        # validate number and construct path
+        suffix = self._get_path_suffix(type, number)
+
+        if not suffix:
+            return False
+
+        return self.__url__ + path + suffix
+
+    def _get_iban_url(self, path, type, number, iban, date):
+        """
+        Clear error info and prepare URL of bank account check
+
+        :param path: service path, e.g. '/check/iban/'
+        :type path: str
+        :param type: search number type as Number.xxx value
+        :type type: Number
+        :param number: search number value
+        :type number: str
+        :param iban: bank account IBAN (for polish numbers PL prefix may be omitted)
+        :type iban: str
+        :param date: date in format 'yyyy-mm-dd' (None - current day)
+        :type date: str
+        :return: request URL or False if number or IBAN is invalid
+        :rtype: str or False
+        """
+
+        url = self._get_url(path, type, number)
+
+        if not url:
+            return False
+
+        if not IBAN.isValid(iban):
+            iban = 'PL' + iban
+
+            if not IBAN.isValid(iban):
+                self._set(Error.CLI_IBAN)
+                return False
+
+        return url + '/' + IBAN.normalize(iban) + '/' + self.__format_date(date)
+
+    def _get_search_url(self, type, number, date):
+        """
+        Clear error info and prepare URL of VAT registry search
+
+        :param type: search number type as Number.xxx value
+        :type type: Number
+        :param number: search number value
+        :type number: str
+        :param date: date in format 'yyyy-mm-dd' (None - current day)
+        :type date: str
+        :return: request URL or False if number is invalid
+        :rtype: str or False
+        """
+
+        url = self._get_url('/search/vat/', type, number)
+
+        if not url:
+            return False
+
+        return url + '/' + self.__format_date(date)
+
+    def _is_active(self, doc):
+        """
+        Get result of firm activity check
+
+        :param doc: etree document or None on error
+        :type doc: tree
+        :return: True if firm is active
+        :rtype: bool
+        """
+
+        if not doc:
+            if self.getLastErrorCode() == Error.NIP_NOT_ACTIVE:
+                # not active
+                self._clear()
+
+            return False
+
+        # ok
+        return True
+
+    def _map(self, doc, mapper, fields=None):
+        """
+        Map response document to model object
+
+        :param doc: etree document or None on error
+        :type doc: tree
+        :param mapper: Mapper method, e.g. Mapper.invoiceData
+        :type mapper: callable
+        :param fields: names of attributes to map (None - all attributes)
+        :type fields: iterable of str
+        :return: model object or False
+        :rtype: object or False
+        """
+
+        if not doc:
+            return False
+
+        return mapper(doc, fields, self.__lazy__)
+
+    def _check_fields(self, fields):
+        """
+        Check names of AllData attributes before sending the request
+
+        :param fields: names of AllData attributes (None - all attributes)
+        :type fields: iterable of str
+        :raises ValueError: if fields contain a name which is not an AllData attribute
+        """
+
+        if fields is not None:
+            Mapper.project(Mapper.ALL_DATA_SCHEMA, fields)
+
+    def _all_data_table(self, fields):
+        """
+        Create table for all data batch results
+
+        :param fields: names of AllData attributes to include as columns or lists (None - all attributes)
+        :type fields: iterable of str
+        :return: empty table with error info columns
+        :rtype: ResultTable
+        :raises ValueError: if fields contain a name which is not an AllData attribute
+        """
+
+        if fields is None:
+            return ResultTable(Mapper.ALL_DATA_FIELDS, Mapper.ALL_DATA_LISTS, self.TABLE_STATUS_COLUMNS)
+
+        return ResultTable(*Mapper.project(Mapper.ALL_DATA_SCHEMA, fields),
+                           columns=self.TABLE_STATUS_COLUMNS)
+
+    def _search_table(self):
+        """
+        Create table for VAT registry search results
+
+        :return: empty table of VATEntity attributes
+        :rtype: ResultTable
+        """
+
+        return ResultTable(Mapper.VAT_ENTITY_FIELDS, Mapper.VAT_ENTITY_LISTS)
+
+    def _add_row(self, table, result):
+        """
+        Add all data batch result to the table
+
+        :param table: table receiving rows
+        :type table: ResultTable
+        :param result: result with all data document or False as value
+        :type result: Result
+        """
+
+        table.append(result.value.getroot().find('firm') if result.value else None, code=result.code,
+                     error=result.error)
+
+    def _raw_result(self, value, start, xml):
+        """
+        Get result of callRaw() or callElement() call
+
+        :param value: value returned by called method
+        :param start: call start as time.perf_counter() value
+        :type start: float
+        :param xml: True to return response as XML, False to return its root element
+        :type xml: bool
+        :return: call result
+        :rtype: Result
+        """
+
+        raw = self._get_context(BaseNIP24Client.__raws__)
+
+        if not raw:
+            # request was not sent, e.g. invalid number
+            return Result(value, self.getLastErrorCode(), self.getLastError(), time.perf_counter() - start)
+
+        doc, body, code, err = raw[-1]
+
+        if not doc:
+            value = False
+        elif xml:
+            # streamed response is not kept, so it is serialized from the document
+            value = body if body is not None else Mapper.toXML(doc)
+        else:
+            value = doc.getroot()
+
+        return Result(value, code, err, time.perf_counter() - start)
+
+    def _begin_raw(self):
+        """
+        Start collecting responses for callRaw() or callElement() call
+
+        :return: previous responses list to restore by _end_raw()
+        :rtype: list or None
+        """
+
+        return self._set_context(BaseNIP24Client.__raws__, [])
+
+    def _end_raw(self, previous):
+        """
+        Stop collecting responses for callRaw() or callElement() call
+
+        :param previous: value returned by _begin_raw()
+        :type previous: list or None
+        """
+
+        self._set_context(BaseNIP24Client.__raws__, previous)
+
+    def _get_raw(self):
+        """
+        Get responses list of callRaw() or callElement() call in progress
+
+        :return: list of responses or None if no such call is in progress
+        :rtype: list or None
+        """
+
+        return self._get_context(BaseNIP24Client.__raws__)
+
+    def _add_raw(self, raw, doc, body):
+        """
+        Keep response of callRaw() or callElement() call
+
+        :param raw: list of responses returned by _get_raw()
+        :type raw: list
+        :param doc: etree document or None
+        :type doc: tree or None
+        :param body: list with decompressed response content or None
+        :type body: list of bytes
+        """
+
+        raw.append((doc, body[0] if body else None, self.getLastErrorCode(), self.getLastError()))
+
+    def _clear(self):
+        """
+        Clear error info
+        """
+
+        self._set_context(BaseNIP24Client.__errors__, BaseNIP24Client.__no_error__)
+
+    def _set(self, code, err=None):
+        """
+        Set error info
+        :param code: error code
+        :type code: int
+        :param err: error message
+        :type err: str
+        """
+
+        self._set_context(BaseNIP24Client.__errors__, (code, err if err else Error.message(code)))
+
+    def _get_context(self, var, default=None):
+        """
+        Get value of this client in context variable
+
+        :param var: context variable holding values by client
+        :type var: contextvars.ContextVar
+        :param default: value returned if the client has no value
+        :return: value or default
+        """
+
+        values = var.get(None)
+
+        if not values:
+            return default
+
+        return values.get(self.__ref__, default)
+
+    def _set_context(self, var, value):
+        """
+        Set value of this client in context variable
+
+        :param var: context variable holding values by client
+        :type var: contextvars.ContextVar
+        :param value: new value (None - remove value)
+        :return: previous value or None
+        """
+
+        values = var.get(None) or {}
+        previous = values.get(self.__ref__)
+
+        if previous is value:
+            return previous
+
+        # dict may be shared with other contexts, so it is copied, values of collected clients are dropped
+        values = dict((ref, v) for ref, v in values.items() if ref() is not None and ref is not self.__ref__)
+
+        if value is not None:
+            values[self.__ref__] = value
+
+        var.set(values)
+
+        return previous
+
+    def _prepare_batch(self, items):
+        """
+        Validate and de-duplicate batch input
+
+        :param items: iterable of method arguments tuples starting with number type and number
+        :type items: iterable
+        :return: keys in input order, unique arguments by key and results of invalid items by key
+        :rtype: tuple
+        """
+
+        keys = []
+        unique = {}
+        results = {}
+
+        for item in items:
+            item = tuple(item)
+
+            self._clear()
+
+            suffix = self._get_path_suffix(item[0], item[1])
+
+            if suffix:
+                key = (suffix,) + item[2:]
+
+                if key not in unique:
+                    unique[key] = item
+            else:
+                key = item
+
+                results[key] = Result(False, self.getLastErrorCode(), self.getLastError())
+
+            keys.append(key)
+
+        self._clear()
+
+        return keys, unique, results
+
+    def _get_deadline(self):
+        """
+        Get deadline of a call starting now
+
+        :return: deadline as time.monotonic() value or None
+        :rtype: float or None
+        """
+
+        if not self.__deadline__:
+            return None
+
+        return time.monotonic() + self.__deadline__
+
+    def _get_timeouts(self, deadline, wait=0.0):
+        """
+        Get connect and read timeouts limited by call deadline
+
+        :param deadline: call deadline as time.monotonic() value or None
+        :type deadline: float
+        :param wait: time to wait before sending request in seconds
+        :type wait: float
+        :return: connect and read timeouts or None if deadline would be exceeded
+        :rtype: tuple or None
+        """
+
+        connect, read = self.__timeouts__
+
+        if deadline is None:
+            return connect, read
+
+        remaining = deadline - time.monotonic() - wait
+
+        if remaining <= 0:
+            return None
+
+        return min(connect or remaining, remaining), min(read or remaining, remaining)
+
+    def _prepare_get(self, url, deadline):
+        """
+        Prepare GET request, reserving its rate limiter slot
+
+        :param url: target URL
+        :type url: str
+        :param deadline: call deadline as time.monotonic() value or None
+        :type deadline: float
+        :return: request headers, seconds to wait before sending the request and connect and read timeouts, or None
+            if the request cannot be sent
+        :rtype: tuple or None
+        """
+
+        # auth
+        auth = self._auth('GET', url)
+
+        if not auth:
+            return None
+
+        # rate limit
+        wait = 0.0
+
+        if self.__limiter__:
+            wait = self.__limiter__.reserve()
+
+            if wait is None:
+                self._set(Error.DB_AUTH_OVER_PLAN)
+                return None
+
+        timeouts = self._get_timeouts(deadline, wait)
+
+        if not timeouts:
+            if self.__limiter__:
+                # request is not sent, so it must not delay other requests nor use quota
+                self.__limiter__.cancel()
+
+            self._set(Error.CLI_TIMEOUT)
+            return None
+
+        return {
+            'Accept': 'application/xml',
+            'Accept-Encoding': 'gzip, deflate',
+            'Authorization': auth,
+            'User-Agent': self._user_agent()
+        }, wait, timeouts
+
+    def _check_response(self, res):
+        """
+        Check HTTP status of response
+
+        Server errors and 429 responses set CLI_UNAVAILABLE, which is retried by default, other unexpected statuses
+        set CLI_HTTP, which is not.
+
+        :param res: HTTP response
+        :type res: Response
+        :return: response or False
+        :rtype: Response or False
+        """
+
+        if 200 <= res.status < 300:
+            return res
+
+        res.close()
+
+        code = Error.CLI_UNAVAILABLE if res.status >= 500 or res.status == 429 else Error.CLI_HTTP
+        self._set(code, Error.message(code) + ' (' + str(res.status) + ')')
+
+        return False
+
+    def _parse(self, res, entities=None, body=None):
+        """
+        Parse response content and check for service error
+
+        :param res: HTTP response
+        :type res: Response or False
+        :param entities: list or table receiving entities mapped while parsing search result (None - do not map
+            entities)
+        :type entities: list of VATEntity or ResultTable
+        :param body: list receiving decompressed response content, left empty for streamed response (None - content
+            is not kept)
+        :type body: list of bytes
+        :return: etree document or None
+        :rtype: tree or None
+        """
+
+        if not res:
+            if not self.getLastErrorCode():
+                self._set(Error.CLI_CONNECT)
+
+            return None
+
+        encoding = res.headers.get('content-encoding')
+
+        if body is not None:
+            # content of previous attempt
+            body.clear()
+
+        try:
+            if body is not None and not res.stream:
+                content = Mapper.decompress(res.body, encoding)
+                doc = Mapper.parse(content) if content is not None else None
+
+                if doc:
+                    body.append(content)
+            elif entities is None:
+                doc = Mapper.parse(res.chunks(Mapper.CHUNK_SIZE) if res.stream else res.body, encoding)
+            else:
+                # entities of previous attempt
+                entities.clear()
+
+                if isinstance(entities, ResultTable):
+                    handler = self.__table_handler(entities)
+                else:
+                    handler = lambda element: entities.append(Mapper.vatEntity(element))
+
+                doc = Mapper.parse(res.chunks(Mapper.CHUNK_SIZE) if res.stream else res.body, encoding, 'entity',
+                                   handler)
+        except socket.timeout:
+            self._set(Error.CLI_TIMEOUT)
+            return None
+        except (OSError, http.client.HTTPException):
+            self._set(Error.CLI_CONNECT)
+            return None
+        finally:
+            res.close()
+
+        return self._check(doc)
+
+    def _check(self, doc):
+        """
+        Check parsed response for service error
+
+        :param doc: etree document or None if response could not be parsed
+        :type doc: tree or None
+        :return: etree document or None
+        :rtype: tree or None
+        """
+
+        if not doc:
+            self._set(Error.CLI_RESPONSE)
+            return None
+
+        code = Mapper.getText(doc, '/result/error/code/text()')
+
+        if len(code) > 0:
+            self._set(int(code), Mapper.getText(doc, '/result/error/description/text()'))
+            return None
+
+        return doc
+
+    def _get_retry_delay(self, attempt, deadline):
+        """
+        Get delay before repeating failed request
+
+        :param attempt: number of failed attempt (0 - first attempt)
+        :type attempt: int
+        :param deadline: call deadline as time.monotonic() value or None
+        :type deadline: float
+        :return: delay in seconds or None if request should not be repeated
+        :rtype: float or None
+        """
+
+        if not self.__retry__ or not self.__retry__.isRetryable(self.getLastErrorCode(), attempt):
+            return None
+
+        delay = self.__retry__.delay(attempt)
+
+        if deadline is not None and time.monotonic() + delay >= deadline:
+            self._set(Error.CLI_TIMEOUT)
+            return None
+
+        return delay
+
+    def _auth(self, method, url):
+        """
+        Prepare authorization header content
+
+        :param method: HTTP method
+        :type method: str
+        :param url: target URL
+        :type url: str
+        :returns: authorization header content or False
+        :rtype: str or False
+        """
+
+        # parse url
+        u = urllib.parse.urlparse(url)
+        ls = u.netloc.split(':')
+
+        host = ls[0]
+        port = 443 if u.scheme == 'https' else 80
+
+        if len(ls) > 1:
+            port = ls[1]
+
+        # prepare auth header value
+        nonce = os.urandom(4).hex()
+        ts = int(time.time())
+
+        s = '' + str(ts) + '\n' \
+            + nonce + '\n' \
+            + method + '\n' \
+            + u.path + '\n' \
+            + host + '\n' \
+            + str(port) + '\n' \
+            + '\n'
+
+        mac = base64.b64encode(hmac.new(self.__key__.encode(), s.encode(), self.HMAC_ALG).digest()).decode()
+
+        return 'MAC id="' + self.__id__ + '", ts="' + str(ts) + '", nonce="' + nonce + '", mac="' + mac + '"'
+
+    def _user_agent(self):
+        """
+        Prepare user agent information header content
+
+        :return: user agent header content
+        :rtype: str
+        """
+
+        return 'NIP24Client/' + self.VERSION + ' Python/' + str(sys.version_info[0]) + '.' + str(sys.version_info[1]) \
+            + '.' + str(sys.version_info[2])
+
+    def _get_path_suffix(self, type, number):
+        """
+        Get path suffix
+
+        :param type: search number type as Number.xxx value
+        :type type: Number
+        :param number: search number value
+        :type number: str
+        :return: path suffix
+        :rtype: string or False
+        """
+
+        if type == Number.NIP:
+            if not NIP.isValid(number):
+                self._set(Error.CLI_NIP)
+                return False
+
+            path = 'nip/' + NIP.normalize(number)
+        elif type == Number.REGON:
+            if not REGON.isValid(number):
+                self._set(Error.CLI_REGON)
+                return False
+
+            path = 'regon/' + REGON.normalize(number)
+        elif type == Number.KRS:
+            if not KRS.isValid(number):
+                self._set(Error.CLI_KRS)
+                return False
+
+            path = 'krs/' + KRS.normalize(number)
+        elif type == Number.EUVAT:
+            if not EUVAT.isValid(number):
+                self._set(Error.CLI_EUVAT)
+                return False
+
+            path = 'euvat/' + EUVAT.normalize(number)
+        elif type == Number.IBAN:
+            if not IBAN.isValid(number):
+                number = 'PL' + number
+
+                if not IBAN.isValid(number):
+                    self._set(Error.CLI_IBAN)
+                    return False
+
+            path = 'iban/' + IBAN.normalize(number)
+        else:
+            self._set(Error.CLI_NUMBER)
+            return False
+
+        return path
+
+    @staticmethod
+    def __format_date(date):
+        """
+        Format date path segment
+
+        :param date: date in format 'yyyy-mm-dd' (None - current day)
+        :type date: str
+        :return: date in format 'yyyy-mm-dd'
+        :rtype: str
+        """
+
+        if not date:
+            return datetime.date.today().strftime('%Y-%m-%d')
+
+        return parse(date).strftime('%Y-%m-%d')
+
+    @staticmethod
+    def __table_handler(table):
+        """
+        Get handler adding parsed entity elements to the table
+
+        :param table: table receiving rows
+        :type table: ResultTable
+        :return: handler function
+        :rtype: callable
+        """
+
+        # as in searchResult(), the list ends at the first entity without nip
+        end = []
+
+        def handler(element):
+            if end:
+                return
+
+            if len(Mapper.convert(element.findtext('nip'), 'text')) == 0:
+                end.append(element)
+                return
+
+            table.append(element)
+
+        return handler
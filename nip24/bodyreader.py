@@ -0,0 +1,82 @@
+#
+# -*- coding: utf-8 -*-
+#
+# Copyright 2015-2025 NETCAT (www.netcat.pl)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# @author NETCAT <firma@netcat.pl>
+# @copyright 2015-2025 NETCAT (www.netcat.pl)
+# @license http://www.apache.org/licenses/LICENSE-2.0
+#
+
+
+
+from nip24 import HTTPUtil
+
+
+class BodyReader:
+    """
+    File-like reader of HTTP response body keeping socket reads within call deadline
+
+    Socket timeout applies to every read separately, so a server sending the body byte by byte could keep a plain
+    read going long after the deadline. The reader makes one socket read at a time and shortens the socket timeout
+    to the time remaining before each of them.
+    """
+
+    def __init__(self, res, sock, timeout=None, deadline=None):
+        """
+        Construct new body reader
+
+        :param res: response with unread body
+        :type res: http.client.HTTPResponse
+        :param sock: connection socket
+        :type sock: socket.socket
+        :param timeout: timeout of every socket read in seconds (None - no timeout)
+        :type timeout: float
+        :param deadline: call deadline as time.monotonic() value (None - no limit)
+        :type deadline: float
+        """
+
+        self.__res__ = res
+        self.__sock__ = sock
+        self.__timeout__ = timeout
+        self.__deadline__ = deadline
+
+    def read(self, size=-1):
+        """
+        Read next part of the body using at most one socket read
+
+        :param size: maximum number of bytes (-1 - as much as one read returns)
+        :type size: int
+        :return: body part, empty at the end of the body
+        :rtype: bytes
+        :raises socket.timeout: if deadline has passed or the read timed out
+        """
+
+        self.__sock__.settimeout(HTTPUtil.getTimeout(self.__timeout__, self.__deadline__))
+
+        return self.__res__.read1(size)
+
+    def readAll(self, size=65536):
+        """
+        Read the rest of the body
+
+        :param size: maximum number of bytes of a single read
+        :type size: int
+        :return: body
+        :rtype: bytes
+        :raises socket.timeout: if deadline has passed or a read timed out
+        """
+
+        return b''.join(iter(lambda: self.read(size), b''))
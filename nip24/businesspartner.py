@@ -26,6 +26,8 @@ class BusinessPartner:
     Business partner data
     """
 
+    __slots__ = ('regon', 'firmName', 'firstName', 'secondName', 'lastName')
+
     def __init__(self):
         self.regon = None
         self.firmName = None
@@ -0,0 +1,405 @@
+#
+# -*- coding: utf-8 -*-
+#
+# Copyright 2015-2025 NETCAT (www.netcat.pl)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# @author NETCAT <firma@netcat.pl>
+# @copyright 2015-2025 NETCAT (www.netcat.pl)
+# @license http://www.apache.org/licenses/LICENSE-2.0
+#
+
+
+import datetime
+import struct
+
+from nip24 import (InvoiceData, AllData, VIESData, VATStatus, IBANStatus, WLStatus, VATPerson, VATEntity, SearchResult,
+                   AccountStatus, BusinessPartner, PKD)
+from dateutil import tz
+
+
+class Codec:
+    """
+    Compact binary serialization of model objects
+
+    Objects are written as class id, number of fields and field values in __slots__ order, so attributes
+    may only be appended to models. Every value starts with a type tag, integers and lengths are varints and
+    repeated strings are written once per payload and then referenced by index.
+    """
+
+    MAGIC = b'N24'
+    VERSION = 1
+
+    # model classes by class id, new classes may only be appended
+    CLASSES = [InvoiceData, AllData, VIESData, VATStatus, IBANStatus, WLStatus, VATPerson, VATEntity, SearchResult,
+               AccountStatus, BusinessPartner, PKD]
+
+    # value tags
+    NONE = 0
+    FALSE = 1
+    TRUE = 2
+    INT = 3
+    FLOAT = 4
+    STR = 5
+    REF = 6
+    DATETIME = 7
+    DATE = 8
+    LIST = 9
+    OBJECT = 10
+
+    # time zone kinds of datetime values
+    TZ_NAIVE = 0
+    TZ_UTC = 1
+    TZ_OFFSET = 2
+    TZ_LOCAL = 3
+
+    # class ids by class
+    __ids__ = dict((cls, i) for i, cls in enumerate(CLASSES))
+
+    __double__ = struct.Struct('<d')
+
+    @staticmethod
+    def toBytes(obj):
+        """
+        Serialize model object, list or scalar value
+
+        :param obj: model object (e.g. AllData, SearchResult), list of them or scalar value
+        :type obj: object
+        :return: serialized value
+        :rtype: bytes
+        """
+
+        out = bytearray(Codec.MAGIC)
+        out.append(Codec.VERSION)
+
+        Codec.__write(out, obj, {})
+
+        return bytes(out)
+
+    @staticmethod
+    def fromBytes(data):
+        """
+        Deserialize value serialized by toBytes()
+
+        :param data: serialized value
+        :type data: bytes
+        :return: model object, list or scalar value
+        :rtype: object
+        :raises ValueError: if data is not a supported payload
+        """
+
+        if data[:len(Codec.MAGIC)] != Codec.MAGIC or len(data) <= len(Codec.MAGIC):
+            raise ValueError('Not a NIP24 serialized object')
+
+        version = data[len(Codec.MAGIC)]
+
+        if version > Codec.VERSION:
+            raise ValueError('Unsupported serialization format version: ' + str(version))
+
+        try:
+            value, pos = Codec.__read(data, len(Codec.MAGIC) + 1, [])
+        except (IndexError, KeyError, struct.error, UnicodeDecodeError):
+            raise ValueError('Invalid NIP24 serialized object')
+
+        if pos != len(data):
+            raise ValueError('Invalid NIP24 serialized object')
+
+        return value
+
+    @staticmethod
+    def __write(out, value, strings):
+        """
+        Write tagged value
+
+        :param out: output buffer
+        :type out: bytearray
+        :param value: value to write
+        :param strings: indexes of already written strings
+        :type strings: dict
+        """
+
+        t = type(value)
+
+        if t is str:
+            index = strings.get(value)
+
+            if index is not None:
+                out.append(Codec.REF)
+
+                if index < 0x80:
+                    out.append(index)
+                else:
+                    Codec.__write_varint(out, index)
+            else:
+                strings[value] = len(strings)
+
+                data = value.encode('utf-8')
+
+                out.append(Codec.STR)
+
+                if len(data) < 0x80:
+                    out.append(len(data))
+                else:
+                    Codec.__write_varint(out, len(data))
+
+                out += data
+        elif value is None:
+            out.append(Codec.NONE)
+        elif t is bool:
+            out.append(Codec.TRUE if value else Codec.FALSE)
+        elif t is datetime.datetime:
+            out.append(Codec.DATETIME)
+            Codec.__write_varint(out, value.toordinal())
+            Codec.__write_varint(out, value.hour * 3600 + value.minute * 60 + value.second)
+            Codec.__write_varint(out, value.microsecond)
+            Codec.__write_tz(out, value)
+        elif t is list or t is tuple:
+            out.append(Codec.LIST)
+            Codec.__write_varint(out, len(value))
+
+            for item in value:
+                Codec.__write(out, item, strings)
+        elif t in Codec.__ids__:
+            Codec.__write_object(out, value, t, strings)
+        elif isinstance(value, bool):
+            out.append(Codec.TRUE if value else Codec.FALSE)
+        elif isinstance(value, int):
+            out.append(Codec.INT)
+            Codec.__write_varint(out, (value << 1) if value >= 0 else ((-value << 1) - 1))
+        elif isinstance(value, float):
+            out.append(Codec.FLOAT)
+            out += Codec.__double__.pack(value)
+        elif isinstance(value, str):
+            Codec.__write(out, str(value), strings)
+        elif isinstance(value, datetime.datetime):
+            Codec.__write(out, datetime.datetime.combine(value.date(), value.timetz()), strings)
+        elif isinstance(value, datetime.date):
+            out.append(Codec.DATE)
+            Codec.__write_varint(out, value.toordinal())
+        elif isinstance(value, tuple(Codec.CLASSES)):
+            # subclasses such as LazyAllData are written as their model class
+            for base in t.__mro__:
+                if base in Codec.__ids__:
+                    Codec.__write_object(out, value, base, strings)
+                    break
+        else:
+            raise TypeError('Unsupported type: ' + t.__name__)
+
+    @staticmethod
+    def __write_object(out, value, cls, strings):
+        """
+        Write model object
+
+        :param out: output buffer
+        :type out: bytearray
+        :param value: model object
+        :type value: object
+        :param cls: model class
+        :type cls: type
+        :param strings: indexes of already written strings
+        :type strings: dict
+        """
+
+        slots = cls.__slots__
+
+        out.append(Codec.OBJECT)
+        out.append(Codec.__ids__[cls])
+        Codec.__write_varint(out, len(slots))
+
+        for name in slots:
+            Codec.__write(out, getattr(value, name), strings)
+
+    @staticmethod
+    def __write_tz(out, value):
+        """
+        Write time zone of datetime value
+
+        :param out: output buffer
+        :type out: bytearray
+        :param value: datetime value
+        :type value: datetime
+        """
+
+        tzinfo = value.tzinfo
+
+        if tzinfo is None:
+            out.append(Codec.TZ_NAIVE)
+        elif isinstance(tzinfo, tz.tzutc):
+            out.append(Codec.TZ_UTC)
+        elif isinstance(tzinfo, tz.tzlocal):
+            out.append(Codec.TZ_LOCAL)
+        else:
+            offset = int(value.utcoffset().total_seconds())
+
+            out.append(Codec.TZ_OFFSET)
+            Codec.__write_varint(out, (offset << 1) if offset >= 0 else ((-offset << 1) - 1))
+
+    @staticmethod
+    def __write_varint(out, n):
+        """
+        Write unsigned integer using 7 bits per byte
+
+        :param out: output buffer
+        :type out: bytearray
+        :param n: non-negative integer
+        :type n: int
+        """
+
+        while n > 0x7f:
+            out.append((n & 0x7f) | 0x80)
+            n >>= 7
+
+        out.append(n)
+
+    @staticmethod
+    def __read(data, pos, strings):
+        """
+        Read tagged value
+
+        :param data: serialized data
+        :type data: bytes
+        :param pos: position of value tag
+        :type pos: int
+        :param strings: already read strings
+        :type strings: list
+        :return: value and position after it
+        :rtype: tuple
+        """
+
+        tag = data[pos]
+        pos += 1
+
+        if tag == Codec.STR:
+            n = data[pos]
+
+            if n < 0x80:
+                pos += 1
+            else:
+                n, pos = Codec.__read_varint(data, pos)
+
+            if pos + n > len(data):
+                raise IndexError()
+
+            value = data[pos:pos + n].decode('utf-8')
+            strings.append(value)
+
+            return value, pos + n
+        elif tag == Codec.REF:
+            n = data[pos]
+
+            if n < 0x80:
+                return strings[n], pos + 1
+
+            n, pos = Codec.__read_varint(data, pos)
+            return strings[n], pos
+        elif tag == Codec.NONE:
+            return None, pos
+        elif tag == Codec.TRUE:
+            return True, pos
+        elif tag == Codec.FALSE:
+            return False, pos
+        elif tag == Codec.OBJECT:
+            id, pos = Codec.__read_varint(data, pos)
+            count, pos = Codec.__read_varint(data, pos)
+
+            cls = Codec.CLASSES[id]
+            slots = cls.__slots__
+
+            obj = cls.__new__(cls)
+
+            for i in range(count):
+                value, pos = Codec.__read(data, pos, strings)
+
+                # fields appended by newer versions are skipped
+                if i < len(slots):
+                    setattr(obj, slots[i], value)
+
+            # fields appended after the object was written get default values
+            if count < len(slots):
+                defaults = cls()
+
+                for name in slots[count:]:
+                    setattr(obj, name, getattr(defaults, name))
+
+            return obj, pos
+        elif tag == Codec.LIST:
+            count, pos = Codec.__read_varint(data, pos)
+            value = []
+
+            for i in range(count):
+                item, pos = Codec.__read(data, pos, strings)
+                value.append(item)
+
+            return value, pos
+        elif tag == Codec.DATETIME:
+            days, pos = Codec.__read_varint(data, pos)
+            seconds, pos = Codec.__read_varint(data, pos)
+            microseconds, pos = Codec.__read_varint(data, pos)
+
+            kind = data[pos]
+            pos += 1
+
+            if kind == Codec.TZ_NAIVE:
+                tzinfo = None
+            elif kind == Codec.TZ_UTC:
+                tzinfo = tz.UTC
+            elif kind == Codec.TZ_LOCAL:
+                tzinfo = tz.tzlocal()
+            elif kind == Codec.TZ_OFFSET:
+                offset, pos = Codec.__read_varint(data, pos)
+                tzinfo = tz.tzoffset(None, (offset >> 1) if not offset & 1 else -((offset + 1) >> 1))
+            else:
+                raise KeyError(kind)
+
+            date = datetime.date.fromordinal(days)
+
+            return datetime.datetime(date.year, date.month, date.day, seconds // 3600, seconds // 60 % 60,
+                                     seconds % 60, microseconds, tzinfo), pos
+        elif tag == Codec.DATE:
+            days, pos = Codec.__read_varint(data, pos)
+            return datetime.date.fromordinal(days), pos
+        elif tag == Codec.INT:
+            n, pos = Codec.__read_varint(data, pos)
+            return (n >> 1) if not n & 1 else -((n + 1) >> 1), pos
+        elif tag == Codec.FLOAT:
+            return Codec.__double__.unpack_from(data, pos)[0], pos + 8
+
+        raise KeyError(tag)
+
+    @staticmethod
+    def __read_varint(data, pos):
+        """
+        Read unsigned integer written by __write_varint()
+
+        :param data: serialized data
+        :type data: bytes
+        :param pos: position of integer
+        :type pos: int
+        :return: integer and position after it
+        :rtype: tuple
+        """
+
+        n = 0
+        shift = 0
+
+        while True:
+            b = data[pos]
+            pos += 1
+
+            n |= (b & 0x7f) << shift
+
+            if b < 0x80:
+                return n, pos
+
+            shift += 7
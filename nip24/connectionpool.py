@@ -0,0 +1,356 @@
+#
+# -*- coding: utf-8 -*-
+#
+# Copyright 2015-2025 NETCAT (www.netcat.pl)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# @author NETCAT <firma@netcat.pl>
+# @copyright 2015-2025 NETCAT (www.netcat.pl)
+# @license http://www.apache.org/licenses/LICENSE-2.0
+#
+
+
+import http.client
+import selectors
+import socket
+import threading
+import time
+
+from nip24 import Response, Transport, HTTPUtil, BodyReader
+
+
+class ConnectionPool(Transport):
+    """
+    HTTP/1.1 keep-alive connection pool
+
+    Like urllib, the pool uses proxies configured by environment variables (http_proxy, https_proxy, no_proxy) and
+    follows redirects of GET and HEAD requests.
+    """
+
+    def __init__(self, maxConnections=10, idleTimeout=30.0):
+        """
+        Construct new connection pool
+
+        :param maxConnections: maximum number of connections opened to a single host
+        :type maxConnections: int
+        :param idleTimeout: number of seconds after which an idle connection is closed (0 - disable reuse)
+        :type idleTimeout: float
+        """
+
+        self.maxConnections = maxConnections
+        self.idleTimeout = idleTimeout
+
+        self.__cond__ = threading.Condition()
+        self.__hosts__ = {}
+
+    def send(self, method, url, headers, connectTimeout=None, readTimeout=None, deadline=None):
+        """
+        Send HTTP request using pooled connection
+
+        :param method: HTTP method
+        :type method: str
+        :param url: target URL
+        :type url: str
+        :param headers: request headers
+        :type headers: dict
+        :param connectTimeout: connect timeout in seconds (None - no timeout)
+        :type connectTimeout: float
+        :param readTimeout: timeout of every socket read in seconds (None - no timeout)
+        :type readTimeout: float
+        :param deadline: call deadline as time.monotonic() value limiting also the wait for a free connection and
+            reading of the body (None - no limit)
+        :type deadline: float
+        :return: response with lowercase header names
+        :rtype: Response
+        """
+
+        for redirect in range(HTTPUtil.MAX_REDIRECTS + 1):
+            key, conn, res, body = self.__open(method, url, headers, connectTimeout, readTimeout, deadline, True)
+
+            self.__release(key, None if res.will_close else conn)
+
+            location = HTTPUtil.getLocation(method, url, res.status, res.getheader('location'))
+
+            if not location:
+                break
+
+            url = location
+
+        return Response(res.status, dict((k.lower(), v) for k, v in res.getheaders()), body)
+
+    def stream(self, method, url, headers, connectTimeout=None, readTimeout=None, deadline=None):
+        """
+        Send HTTP request using pooled connection and return response before its body is read
+
+        Connection is returned to the pool when the response is closed after reading the whole body,
+        otherwise it is closed.
+
+        :param method: HTTP method
+        :type method: str
+        :param url: target URL
+        :type url: str
+        :param headers: request headers
+        :type headers: dict
+        :param connectTimeout: connect timeout in seconds (None - no timeout)
+        :type connectTimeout: float
+        :param readTimeout: timeout of every socket read in seconds (None - no timeout)
+        :type readTimeout: float
+        :param deadline: call deadline as time.monotonic() value limiting also the wait for a free connection and
+            reading of the body (None - no limit)
+        :type deadline: float
+        :return: response with lowercase header names, must be closed after reading its body
+        :rtype: Response
+        """
+
+        for redirect in range(HTTPUtil.MAX_REDIRECTS + 1):
+            key, conn, res, body = self.__open(method, url, headers, connectTimeout, readTimeout, deadline, False)
+
+            location = HTTPUtil.getLocation(method, url, res.status, res.getheader('location'))
+
+            if not location or redirect == HTTPUtil.MAX_REDIRECTS:
+                break
+
+            # body of redirect response is skipped to reuse the connection
+            try:
+                self.__read(conn, res, readTimeout, deadline)
+            except BaseException:
+                conn.close()
+                self.__release(key, None)
+                raise
+
+            self.__release(key, None if res.will_close else conn)
+            url = location
+
+        def release():
+            complete = res.isclosed()
+            res.close()
+
+            if not complete:
+                conn.close()
+
+            self.__release(key, conn if complete and not res.will_close else None)
+
+        return Response(res.status, dict((k.lower(), v) for k, v in res.getheaders()),
+                        stream=res if deadline is None else BodyReader(res, conn.sock, readTimeout, deadline),
+                        release=release)
+
+    def close(self):
+        """
+        Close all idle connections
+        """
+
+        with self.__cond__:
+            for host in self.__hosts__.values():
+                for conn, ts in host['idle']:
+                    conn.close()
+
+                host['active'] -= len(host['idle'])
+                host['idle'] = []
+
+            self.__cond__.notify_all()
+
+    def __open(self, method, url, headers, connectTimeout, readTimeout, deadline, read):
+        """
+        Send HTTP request using pooled connection
+
+        :param method: HTTP method
+        :type method: str
+        :param url: target URL
+        :type url: str
+        :param headers: request headers
+        :type headers: dict
+        :param connectTimeout: connect timeout in seconds (None - no timeout)
+        :type connectTimeout: float
+        :param readTimeout: timeout of every socket read in seconds (None - no timeout)
+        :type readTimeout: float
+        :param deadline: call deadline as time.monotonic() value limiting also the wait for a free connection and
+            reading of the body (None - no limit)
+        :type deadline: float
+        :param read: True to read whole response body
+        :type read: bool
+        :return: host key, connection, response and body (None if not read)
+        :rtype: tuple
+        """
+
+        key, path, netloc = HTTPUtil.splitURL(url)
+
+        conn, reused = self.__acquire(key, deadline)
+        proxy = self.__hosts__[key]['proxy']
+        path, headers = HTTPUtil.getProxyRequest(key, path, netloc, headers, proxy)
+
+        try:
+            while True:
+                try:
+                    if not conn.sock:
+                        conn.timeout = HTTPUtil.getTimeout(connectTimeout, deadline)
+                        conn.connect()
+
+                    conn.sock.settimeout(HTTPUtil.getTimeout(readTimeout, deadline))
+                    conn.request(method, path, headers=headers)
+                    res = conn.getresponse()
+
+                    return key, conn, res, self.__read(conn, res, readTimeout, deadline) if read else None
+                except (ConnectionError, http.client.BadStatusLine):
+                    # server closed kept-alive connection, safe to repeat only idempotent requests
+                    conn.close()
+
+                    if not reused or method not in HTTPUtil.IDEMPOTENT_METHODS:
+                        raise
+
+                    conn = self.__connect(key, proxy)
+                    reused = False
+        except BaseException:
+            conn.close()
+            self.__release(key, None)
+            raise
+
+    def __read(self, conn, res, readTimeout, deadline):
+        """
+        Read whole response body
+
+        :param conn: connection object
+        :type conn: http.client.HTTPConnection
+        :param res: response with unread body
+        :type res: http.client.HTTPResponse
+        :param readTimeout: timeout of every socket read in seconds (None - no timeout)
+        :type readTimeout: float
+        :param deadline: call deadline as time.monotonic() value (None - no limit)
+        :type deadline: float
+        :return: response body
+        :rtype: bytes
+        """
+
+        if deadline is None:
+            return res.read()
+
+        # timeout of a single read does not limit the whole body, a slow server could keep it going past the deadline
+        return BodyReader(res, conn.sock, readTimeout, deadline).readAll()
+
+    def __acquire(self, key, deadline):
+        """
+        Get idle connection or open new one
+
+        :param key: host key
+        :type key: tuple
+        :param deadline: time.monotonic() value after which waiting for a free connection fails (None - no limit)
+        :type deadline: float
+        :return: connection and flag indicating if connection is reused
+        :rtype: tuple
+        """
+
+        with self.__cond__:
+            host = self.__hosts__.get(key)
+
+            if not host:
+                host = self.__hosts__[key] = {'idle': [], 'active': 0, 'proxy': HTTPUtil.getProxy(key)}
+
+            while True:
+                now = time.monotonic()
+
+                while host['idle']:
+                    conn, ts = host['idle'].pop()
+
+                    if now - ts <= self.idleTimeout and not self.__is_stale(conn):
+                        return conn, True
+
+                    conn.close()
+                    host['active'] -= 1
+
+                if host['active'] < self.maxConnections:
+                    host['active'] += 1
+                    return self.__connect(key, host['proxy']), False
+
+                if deadline is None:
+                    self.__cond__.wait()
+                    continue
+
+                remaining = deadline - time.monotonic()
+
+                if remaining <= 0:
+                    raise socket.timeout('timed out waiting for free connection')
+
+                self.__cond__.wait(remaining)
+
+    def __release(self, key, conn):
+        """
+        Return connection to the pool
+
+        :param key: host key
+        :type key: tuple
+        :param conn: connection to reuse or None if connection was closed
+        :type conn: http.client.HTTPConnection
+        """
+
+        with self.__cond__:
+            host = self.__hosts__[key]
+
+            if conn and self.idleTimeout > 0:
+                host['idle'].append((conn, time.monotonic()))
+            else:
+                if conn:
+                    conn.close()
+
+                host['active'] -= 1
+
+            self.__cond__.notify()
+
+    def __connect(self, key, proxy):
+        """
+        Create new connection
+
+        :param key: host key
+        :type key: tuple
+        :param proxy: proxy host, port and headers or None
+        :type proxy: tuple
+        :return: connection object
+        :rtype: http.client.HTTPConnection
+        """
+
+        scheme, host, port = key
+
+        if proxy:
+            if scheme == 'https':
+                conn = http.client.HTTPSConnection(proxy[0], proxy[1], context=HTTPUtil.getSSLContext())
+                conn.set_tunnel(host, port, proxy[2])
+                return conn
+
+            return http.client.HTTPConnection(proxy[0], proxy[1])
+
+        if scheme == 'https':
+            return http.client.HTTPSConnection(host, port, context=HTTPUtil.getSSLContext())
+
+        return http.client.HTTPConnection(host, port)
+
+    def __is_stale(self, conn):
+        """
+        Check if idle connection was closed by the server
+
+        :param conn: connection object
+        :type conn: http.client.HTTPConnection
+        :return: True if connection cannot be reused
+        :rtype: bool
+        """
+
+        if not conn.sock:
+            return True
+
+        try:
+            # idle socket should have nothing to read, otherwise it is closed or out of sync; select() cannot be used,
+            # it fails for descriptors above FD_SETSIZE
+            with selectors.DefaultSelector() as selector:
+                selector.register(conn.sock, selectors.EVENT_READ)
+
+                return bool(selector.select(0))
+        except (OSError, ValueError):
+            return True
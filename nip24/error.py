@@ -103,8 +103,13 @@ class Error:
     CLI_EXCEPTION = 209
     CLI_DATEFORMAT = 210
     CLI_INPUT = 211
+    CLI_TIMEOUT = 212
+    CLI_HTTP = 213
+    CLI_UNAVAILABLE = 214
 
     __codes__ = {
+        DB_AUTH_OVER_PLAN: 'Przekroczono limit zapytań w planie taryfowym',
+
         CLI_CONNECT:    'Nie udało się nawiązać połączenia z serwisem NIP24',
         CLI_RESPONSE:   'Odpowiedź serwisu NIP24 ma nieprawidłowy format',
         CLI_NUMBER:     'Nieprawidłowy typ numeru',
@@ -115,7 +120,10 @@ class Error:
         CLI_IBAN:       'Numer IBAN jest nieprawidłowy',
         CLI_EXCEPTION:  'Funkcja wygenerowała wyjątek',
         CLI_DATEFORMAT: 'Podana data ma nieprawidłowy format',
-        CLI_INPUT:      'Nieprawidłowy parametr wejściowy funkcji'
+        CLI_INPUT:      'Nieprawidłowy parametr wejściowy funkcji',
+        CLI_TIMEOUT:    'Przekroczono czas oczekiwania na odpowiedź serwisu NIP24',
+        CLI_HTTP:       'Serwis NIP24 zwrócił nieoczekiwany status HTTP',
+        CLI_UNAVAILABLE: 'Serwis NIP24 jest chwilowo niedostępny'
     }
 
     @staticmethod
@@ -129,7 +137,4 @@ class Error:
         :rtype: str
         """
 
-        if code < Error.CLI_CONNECT or code > Error.CLI_INPUT:
-            return None
-
-        return Error.__codes__[code]
+        return Error.__codes__.get(code)
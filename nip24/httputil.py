@@ -0,0 +1,191 @@
+#
+# -*- coding: utf-8 -*-
+#
+# Copyright 2015-2025 NETCAT (www.netcat.pl)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# @author NETCAT <firma@netcat.pl>
+# @copyright 2015-2025 NETCAT (www.netcat.pl)
+# @license http://www.apache.org/licenses/LICENSE-2.0
+#
+
+
+import base64
+import socket
+import ssl
+import threading
+import time
+import urllib.parse
+import urllib.request
+
+
+class HTTPUtil:
+    """
+    URL, proxy and redirect helpers shared by ConnectionPool and AsyncConnectionPool
+    """
+
+    IDEMPOTENT_METHODS = ('GET', 'HEAD', 'OPTIONS')
+    REDIRECT_METHODS = ('GET', 'HEAD')
+    REDIRECT_CODES = (301, 302, 303, 307, 308)
+    MAX_REDIRECTS = 10
+
+    # default SSL context shared by all pools, created on first https connection
+    __context__ = None
+    __context_lock__ = threading.Lock()
+
+    @staticmethod
+    def splitURL(url):
+        """
+        Split request URL
+
+        :param url: absolute http or https URL
+        :type url: str
+        :return: host key as (scheme, host, port) tuple, request path with query and host header value
+        :rtype: tuple
+        """
+
+        u = urllib.parse.urlsplit(url)
+        key = (u.scheme, u.hostname, u.port or (443 if u.scheme == 'https' else 80))
+
+        path = u.path or '/'
+
+        if u.query:
+            path += '?' + u.query
+
+        return key, path, u.netloc
+
+    @staticmethod
+    def getProxy(key):
+        """
+        Get proxy configured by environment variables (http_proxy, https_proxy, no_proxy) for the host
+
+        :param key: host key
+        :type key: tuple
+        :return: proxy host, port and headers or None
+        :rtype: tuple or None
+        """
+
+        scheme, host, port = key
+
+        proxy = urllib.request.getproxies().get(scheme)
+
+        if not proxy or urllib.request.proxy_bypass(host):
+            return None
+
+        if '://' not in proxy:
+            proxy = 'http://' + proxy
+
+        u = urllib.parse.urlsplit(proxy)
+        headers = {}
+
+        if u.username:
+            credentials = urllib.parse.unquote(u.username) + ':' + urllib.parse.unquote(u.password or '')
+            headers['Proxy-Authorization'] = 'Basic ' + base64.b64encode(credentials.encode('utf-8')).decode('ascii')
+
+        return u.hostname, u.port or (443 if u.scheme == 'https' else 80), headers
+
+    @staticmethod
+    def getProxyRequest(key, path, netloc, headers, proxy):
+        """
+        Get request path and headers of a request sent through the proxy
+
+        Plain http request is sent to the proxy with absolute URL, https request goes through the tunnel unchanged.
+
+        :param key: host key
+        :type key: tuple
+        :param path: request path with query
+        :type path: str
+        :param netloc: host header value
+        :type netloc: str
+        :param headers: request headers
+        :type headers: dict
+        :param proxy: proxy host, port and headers or None
+        :type proxy: tuple
+        :return: request path and headers
+        :rtype: tuple
+        """
+
+        if not proxy or key[0] != 'http':
+            return path, headers
+
+        return key[0] + '://' + netloc + path, dict(headers, **proxy[2])
+
+    @staticmethod
+    def getLocation(method, url, status, location):
+        """
+        Get redirect target
+
+        :param method: HTTP method
+        :type method: str
+        :param url: request URL
+        :type url: str
+        :param status: response status
+        :type status: int
+        :param location: value of location header or None
+        :type location: str
+        :return: absolute URL to follow or None if response is not a redirect
+        :rtype: str or None
+        """
+
+        if status not in HTTPUtil.REDIRECT_CODES or method not in HTTPUtil.REDIRECT_METHODS or not location:
+            return None
+
+        location = urllib.parse.urljoin(url, location)
+
+        if urllib.parse.urlsplit(location).scheme not in ('http', 'https'):
+            return None
+
+        return location
+
+    @staticmethod
+    def getSSLContext():
+        """
+        Get default SSL context shared by all pools
+
+        Loading CA certificates is expensive, so the context is created once on first use.
+
+        :return: SSL context
+        :rtype: ssl.SSLContext
+        """
+
+        if not HTTPUtil.__context__:
+            with HTTPUtil.__context_lock__:
+                if not HTTPUtil.__context__:
+                    HTTPUtil.__context__ = ssl.create_default_context()
+
+        return HTTPUtil.__context__
+
+    @staticmethod
+    def getTimeout(timeout, deadline):
+        """
+        Get timeout limited by the time remaining to call deadline
+
+        :param timeout: timeout in seconds (None - no timeout)
+        :type timeout: float
+        :param deadline: call deadline as time.monotonic() value (None - no limit)
+        :type deadline: float
+        :return: timeout in seconds or None
+        :rtype: float or None
+        :raises socket.timeout: if deadline has passed
+        """
+
+        if deadline is None:
+            return timeout
+
+        remaining = deadline - time.monotonic()
+
+        if remaining <= 0:
+            raise socket.timeout('call deadline exceeded')
+
+        return remaining if timeout is None else min(timeout, remaining)
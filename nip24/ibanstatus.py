@@ -26,6 +26,8 @@ class IBANStatus:
     IBAN status info
     """
 
+    __slots__ = ('uid', 'nip', 'regon', 'iban', 'valid', 'id', 'date', 'source')
+
     def __init__(self):
         self.uid = None
         self.nip = None
@@ -26,6 +26,11 @@ class InvoiceData:
     Invoice data
     """
 
+    __slots__ = (
+        'uid', 'nip', 'name', 'firstname', 'lastname', 'street', 'streetNumber', 'houseNumber', 'city', 'postCode',
+        'postCity', 'phone', 'email', 'www'
+    )
+
     def __init__(self):
         self.uid = None
         self.nip = None
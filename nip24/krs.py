@@ -28,6 +28,8 @@ class KRS:
     KRS number validator
     """
 
+    __pattern__ = re.compile('[0-9]{10}')
+
     @staticmethod
     def normalize(krs):
         """
@@ -44,7 +46,7 @@ class KRS:
 
         krs = krs.strip().zfill(10)
 
-        if not re.match('[0-9]{10}', krs):
+        if not KRS.__pattern__.match(krs):
             return False
 
         return krs
@@ -0,0 +1,85 @@
+#
+# -*- coding: utf-8 -*-
+#
+# Copyright 2015-2025 NETCAT (www.netcat.pl)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# @author NETCAT <firma@netcat.pl>
+# @copyright 2015-2025 NETCAT (www.netcat.pl)
+# @license http://www.apache.org/licenses/LICENSE-2.0
+#
+
+
+
+class LazyModel:
+    """
+    Base of model objects decoded from the response element on first access of each attribute
+
+    Subclasses derive from LazyModel and a model class and declare __children__ and __decode__ slots. Objects are
+    pickled and copied as objects of the model class with all attributes decoded.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, children, decode):
+        """
+        Construct new lazy model object
+
+        :param children: child elements of the response model element by tag, empty if the element is missing
+        :type children: dict
+        :param decode: function returning attribute value for the children and attribute name
+        :type decode: callable
+        """
+
+        # attributes are left unset and resolved by __getattr__
+        self.__children__ = children
+        self.__decode__ = decode
+
+    def __getattr__(self, name):
+        if name in ('__children__', '__decode__'):
+            raise AttributeError(name)
+
+        value = self.__decode__(self.__children__, name)
+
+        # memoize in the slot, next access does not reach __getattr__
+        setattr(self, name, value)
+
+        return value
+
+    def __reduce__(self):
+        # response elements cannot be pickled, state is set as slots of new model object
+        cls = next(base for base in type(self).__mro__ if not issubclass(base, LazyModel))
+
+        return cls, (), (None, dict((name, getattr(self, name)) for name in cls.__slots__))
+
+    @staticmethod
+    def subclass(cls):
+        """
+        Get lazy subclass of model class, creating it if it is not declared
+
+        :param cls: model class
+        :type cls: type
+        :return: lazy model class
+        :rtype: type
+        """
+
+        for sub in cls.__subclasses__():
+            if issubclass(sub, LazyModel):
+                return sub
+
+        return type('Lazy' + cls.__name__, (LazyModel, cls), {
+            '__slots__': ('__children__', '__decode__'),
+            '__module__': cls.__module__,
+            '__doc__': (cls.__doc__ or '').strip() + ' decoded on first access of each attribute'
+        })
@@ -0,0 +1,1194 @@
+#
+# -*- coding: utf-8 -*-
+#
+# Copyright 2015-2025 NETCAT (www.netcat.pl)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# @author NETCAT <firma@netcat.pl>
+# @copyright 2015-2025 NETCAT (www.netcat.pl)
+# @license http://www.apache.org/licenses/LICENSE-2.0
+#
+
+
+from nip24 import (BusinessPartner, PKD, AllData, InvoiceData, VIESData, VATStatus, IBANStatus, WLStatus, VATPerson,
+                   VATEntity, SearchResult, AccountStatus, LazyModel, Schema)
+import zlib
+
+from datetime import datetime
+from io import BytesIO
+from lxml import etree
+from dateutil import tz
+from dateutil.parser import parse
+
+
+class Mapper:
+    """
+    Service response to model objects mapper
+    """
+
+    CHUNK_SIZE = 16384
+
+    DATE_CACHE_SIZE = 1024
+
+    PROJECTION_CACHE_SIZE = 256
+
+    # compiled XPath expressions by path
+    __xpaths__ = {}
+
+    # parsed date time values by date time string
+    __dates__ = {}
+
+    # time zone dateutil assigns to UTC date times (depends on local time zone)
+    __utc__ = None
+
+    # pool sharing repeated values of 'pooled' fields or None
+    __pool__ = None
+
+    # projected fields and lists tables by schema and attribute names
+    __projections__ = {}
+
+    # generated mapper functions by schema
+    __mappers__ = {}
+
+    # value converters by field type, called with stripped element text
+    __converters__ = {
+        'text': lambda s: s,
+        'pooled': lambda s: Mapper.__pool__.get(s) if Mapper.__pool__ is not None and s else s,
+        'bool': lambda s: s == 'true',
+        'date': lambda s: Mapper.parseDate(s),
+        'datetime': lambda s: Mapper.parseDateTime(s),
+        'int': lambda s: int(s) if s else None,
+        'float': lambda s: float(s) if s else 0.0
+    }
+
+    # InvoiceData fields: attribute, path relative to /result/firm and value type
+    INVOICE_DATA_SCHEMA = Schema(InvoiceData, '/result/firm', [
+        ('uid', 'uid', 'text'),
+        ('nip', 'nip', 'text'),
+        ('name', 'name', 'text'),
+        ('firstname', 'firstname', 'text'),
+        ('lastname', 'lastname', 'text'),
+        ('street', 'street', 'text'),
+        ('streetNumber', 'streetNumber', 'text'),
+        ('houseNumber', 'houseNumber', 'text'),
+        ('city', 'city', 'text'),
+        ('postCode', 'postCode', 'text'),
+        ('postCity', 'postCity', 'text'),
+        ('phone', 'phone', 'text'),
+        ('email', 'email', 'text'),
+        ('www', 'www', 'text')
+    ])
+
+    # BusinessPartner fields: attribute, path relative to businessPartner element and value type
+    BUSINESS_PARTNER_SCHEMA = Schema(BusinessPartner, None, [
+        ('regon', 'regon', 'text'),
+        ('firmName', 'firmName', 'text'),
+        ('firstName', 'firstName', 'text'),
+        ('secondName', 'secondName', 'text'),
+        ('lastName', 'lastName', 'text')
+    ], 'regon')
+
+    # PKD fields: attribute, path relative to PKD element and value type
+    PKD_SCHEMA = Schema(PKD, None, [
+        ('code', 'code', 'pooled'),
+        ('description', 'description', 'pooled'),
+        ('primary', 'primary', 'bool'),
+        ('version', 'version', 'pooled')
+    ], 'code')
+
+    # AllData fields: attribute, path relative to /result/firm and value type
+    ALL_DATA_SCHEMA = Schema(AllData, '/result/firm', [
+        ('uid', 'uid', 'text'),
+        ('type', 'type', 'text'),
+        ('nip', 'nip', 'text'),
+        ('regon', 'regon', 'text'),
+        ('name', 'name', 'text'),
+        ('shortname', 'shortname', 'text'),
+        ('firstname', 'firstname', 'text'),
+        ('secondname', 'secondname', 'text'),
+        ('lastname', 'lastname', 'text'),
+        ('street', 'street', 'text'),
+        ('streetCode', 'streetCode', 'text'),
+        ('streetNumber', 'streetNumber', 'text'),
+        ('houseNumber', 'houseNumber', 'text'),
+        ('city', 'city', 'pooled'),
+        ('cityCode', 'cityCode', 'pooled'),
+        ('community', 'community', 'pooled'),
+        ('communityCode', 'communityCode', 'pooled'),
+        ('county', 'county', 'pooled'),
+        ('countyCode', 'countyCode', 'pooled'),
+        ('state', 'state', 'pooled'),
+        ('stateCode', 'stateCode', 'pooled'),
+        ('postCode', 'postCode', 'text'),
+        ('postCity', 'postCity', 'pooled'),
+        ('phone', 'phone', 'text'),
+        ('email', 'email', 'text'),
+        ('www', 'www', 'text'),
+        ('creationDate', 'creationDate', 'datetime'),
+        ('startDate', 'startDate', 'datetime'),
+        ('registrationDate', 'registrationDate', 'datetime'),
+        ('holdDate', 'holdDate', 'datetime'),
+        ('renevalDate', 'renevalDate', 'datetime'),
+        ('lastUpdateDate', 'lastUpdateDate', 'datetime'),
+        ('endDate', 'endDate', 'datetime'),
+        ('registryEntityCode', 'registryEntity/code', 'pooled'),
+        ('registryEntityName', 'registryEntity/name', 'pooled'),
+        ('registryCode', 'registry/code', 'pooled'),
+        ('registryName', 'registry/name', 'pooled'),
+        ('recordCreationDate', 'record/created', 'datetime'),
+        ('recordNumber', 'record/number', 'text'),
+        ('basicLegalFormCode', 'basicLegalForm/code', 'pooled'),
+        ('basicLegalFormName', 'basicLegalForm/name', 'pooled'),
+        ('specificLegalFormCode', 'specificLegalForm/code', 'pooled'),
+        ('specificLegalFormName', 'specificLegalForm/name', 'pooled'),
+        ('ownershipFormCode', 'ownershipForm/code', 'pooled'),
+        ('ownershipFormName', 'ownershipForm/name', 'pooled'),
+        ('businessPartner', 'businessPartners/businessPartner', 'list', BUSINESS_PARTNER_SCHEMA),
+        ('pkd', 'PKDs/PKD', 'list', PKD_SCHEMA)
+    ])
+
+    # VIESData fields: attribute, path relative to /result/vies and value type
+    VIES_DATA_SCHEMA = Schema(VIESData, '/result/vies', [
+        ('uid', 'uid', 'text'),
+        ('countryCode', 'countryCode', 'text'),
+        ('vatNumber', 'vatNumber', 'text'),
+        ('valid', 'valid', 'bool'),
+        ('traderName', 'traderName', 'text'),
+        ('traderCompanyType', 'traderCompanyType', 'text'),
+        ('traderAddress', 'traderAddress', 'text'),
+        ('id', 'id', 'text'),
+        ('date', 'date', 'date'),
+        ('source', 'source', 'text')
+    ])
+
+    # VATStatus fields: attribute, path relative to /result/vat and value type
+    VAT_STATUS_SCHEMA = Schema(VATStatus, '/result/vat', [
+        ('uid', 'uid', 'text'),
+        ('nip', 'nip', 'text'),
+        ('regon', 'regon', 'text'),
+        ('name', 'name', 'text'),
+        ('status', 'status', 'int'),
+        ('result', 'result', 'text'),
+        ('id', 'id', 'text'),
+        ('date', 'date', 'date'),
+        ('source', 'source', 'text')
+    ])
+
+    # IBANStatus fields: attribute, path relative to /result/iban and value type
+    IBAN_STATUS_SCHEMA = Schema(IBANStatus, '/result/iban', [
+        ('uid', 'uid', 'text'),
+        ('nip', 'nip', 'text'),
+        ('regon', 'regon', 'text'),
+        ('iban', 'iban', 'text'),
+        ('valid', 'valid', 'bool'),
+        ('id', 'id', 'text'),
+        ('date', 'date', 'date'),
+        ('source', 'source', 'text')
+    ])
+
+    # WLStatus fields: attribute, path relative to /result/whitelist and value type
+    WL_STATUS_SCHEMA = Schema(WLStatus, '/result/whitelist', [
+        ('uid', 'uid', 'text'),
+        ('nip', 'nip', 'text'),
+        ('iban', 'iban', 'text'),
+        ('valid', 'valid', 'bool'),
+        ('virtual', 'virtual', 'bool'),
+        ('status', 'vatStatus', 'int'),
+        ('result', 'vatResult', 'text'),
+        ('hashIndex', 'hashIndex', 'int'),
+        ('maskIndex', 'maskIndex', 'int'),
+        ('date', 'date', 'date'),
+        ('source', 'source', 'text')
+    ])
+
+    # VATPerson fields: attribute, path relative to person element and value type
+    VAT_PERSON_SCHEMA = Schema(VATPerson, None, [
+        ('nip', 'nip', 'text'),
+        ('companyName', 'companyName', 'text'),
+        ('firstName', 'firstName', 'text'),
+        ('lastName', 'lastName', 'text')
+    ], 'nip')
+
+    # VATEntity fields: attribute, path relative to entity element and value type
+    VAT_ENTITY_SCHEMA = Schema(VATEntity, None, [
+        ('name', 'name', 'text'),
+        ('nip', 'nip', 'text'),
+        ('regon', 'regon', 'text'),
+        ('krs', 'krs', 'text'),
+        ('residenceAddress', 'residenceAddress', 'text'),
+        ('workingAddress', 'workingAddress', 'text'),
+        ('vatStatus', 'vat/status', 'pooled'),
+        ('vatResult', 'vat/result', 'pooled'),
+        ('representatives', 'representatives/person', 'list', VAT_PERSON_SCHEMA),
+        ('authorizedClerks', 'authorizedClerks/person', 'list', VAT_PERSON_SCHEMA),
+        ('partners', 'partners/person', 'list', VAT_PERSON_SCHEMA),
+        ('ibans', 'ibans/iban', 'list', None),
+        ('hasVirtualAccounts', 'hasVirtualAccounts', 'bool'),
+        ('registrationLegalDate', 'registrationLegalDate', 'date'),
+        ('registrationDenialDate', 'registrationDenialDate', 'date'),
+        ('registrationDenialBasis', 'registrationDenialBasis', 'text'),
+        ('restorationDate', 'restorationDate', 'date'),
+        ('restorationBasis', 'restorationBasis', 'text'),
+        ('removalDate', 'removalDate', 'date'),
+        ('removalBasis', 'removalBasis', 'text')
+    ], 'nip')
+
+    # SearchResult fields: attribute, path relative to /result/search and value type
+    SEARCH_RESULT_SCHEMA = Schema(SearchResult, '/result/search', [
+        ('uid', 'uid', 'text'),
+        ('results', 'entities/entity', 'list', VAT_ENTITY_SCHEMA),
+        ('id', 'id', 'text'),
+        ('date', 'date', 'date'),
+        ('source', 'source', 'pooled')
+    ])
+
+    # AccountStatus fields: attribute, path relative to /result/account and value type
+    ACCOUNT_STATUS_SCHEMA = Schema(AccountStatus, '/result/account', [
+        ('uid', 'uid', 'text'),
+        ('type', 'type', 'text'),
+        ('validTo', 'validTo', 'datetime'),
+        ('billingPlanName', 'billingPlan/name', 'text'),
+        ('subscriptionPrice', 'billingPlan/subscriptionPrice', 'float'),
+        ('itemPrice', 'billingPlan/itemPrice', 'float'),
+        ('itemPriceStatus', 'billingPlan/itemPriceCheckStatus', 'float'),
+        ('itemPriceInvoice', 'billingPlan/itemPriceInvoiceData', 'float'),
+        ('itemPriceAll', 'billingPlan/itemPriceAllData', 'float'),
+        ('itemPriceIBAN', 'billingPlan/itemPriceIBANStatus', 'float'),
+        ('itemPriceWhitelist', 'billingPlan/itemPriceWLStatus', 'float'),
+        ('itemPriceSearchVAT', 'billingPlan/itemPriceSearchVAT', 'float'),
+        ('limit', 'billingPlan/limit', 'int'),
+        ('requestDelay', 'billingPlan/requestDelay', 'int'),
+        ('domainLimit', 'billingPlan/domainLimit', 'int'),
+        ('overPlanAllowed', 'billingPlan/overplanAllowed', 'bool'),
+        ('terytCodes', 'billingPlan/terytCodes', 'bool'),
+        ('excelAddIn', 'billingPlan/excelAddin', 'bool'),
+        ('JPKVAT', 'billingPlan/jpkVat', 'bool'),
+        ('CLI', 'billingPlan/cli', 'bool'),
+        ('stats', 'billingPlan/stats', 'bool'),
+        ('nipMonitor', 'billingPlan/nipMonitor', 'bool'),
+        ('searchByNIP', 'billingPlan/searchByNip', 'bool'),
+        ('searchByREGON', 'billingPlan/searchByRegon', 'bool'),
+        ('searchByKRS', 'billingPlan/searchByKrs', 'bool'),
+        ('funcIsActive', 'billingPlan/funcIsActive', 'bool'),
+        ('funcGetInvoiceData', 'billingPlan/funcGetInvoiceData', 'bool'),
+        ('funcGetAllData', 'billingPlan/funcGetAllData', 'bool'),
+        ('funcGetVIESData', 'billingPlan/funcGetVIESData', 'bool'),
+        ('funcGetVATStatus', 'billingPlan/funcGetVATStatus', 'bool'),
+        ('funcGetIBANStatus', 'billingPlan/funcGetIBANStatus', 'bool'),
+        ('funcGetWhitelistStatus', 'billingPlan/funcGetWLStatus', 'bool'),
+        ('funcSearchVAT', 'billingPlan/funcSearchVAT', 'bool'),
+        ('invoiceDataCount', 'requests/invoiceData', 'int'),
+        ('allDataCount', 'requests/allData', 'int'),
+        ('firmStatusCount', 'requests/firmStatus', 'int'),
+        ('vatStatusCount', 'requests/vatStatus', 'int'),
+        ('viesStatusCount', 'requests/viesStatus', 'int'),
+        ('ibanStatusCount', 'requests/ibanStatus', 'int'),
+        ('whitelistStatusCount', 'requests/wlStatus', 'int'),
+        ('searchVATCount', 'requests/searchVAT', 'int'),
+        ('totalCount', 'requests/total', 'int')
+    ])
+
+    # schemas of response documents
+    SCHEMAS = [
+        INVOICE_DATA_SCHEMA, ALL_DATA_SCHEMA, VIES_DATA_SCHEMA, VAT_STATUS_SCHEMA, IBAN_STATUS_SCHEMA, WL_STATUS_SCHEMA,
+        SEARCH_RESULT_SCHEMA, ACCOUNT_STATUS_SCHEMA
+    ]
+
+    # field tables derived from the schemas: attribute name and value type by child element tag
+    ALL_DATA_FIELDS = ALL_DATA_SCHEMA.fields
+    SEARCH_RESULT_FIELDS = SEARCH_RESULT_SCHEMA.fields
+    BUSINESS_PARTNER_FIELDS = BUSINESS_PARTNER_SCHEMA.fields
+    PKD_FIELDS = PKD_SCHEMA.fields
+    VAT_ENTITY_FIELDS = VAT_ENTITY_SCHEMA.fields
+    VAT_PERSON_FIELDS = VAT_PERSON_SCHEMA.fields
+    ACCOUNT_STATUS_FIELDS = ACCOUNT_STATUS_SCHEMA.fields
+
+    # nested lists: container element, item element, item fields (None - text items) and item key attribute
+    ALL_DATA_LISTS = ALL_DATA_SCHEMA.lists
+    VAT_ENTITY_LISTS = VAT_ENTITY_SCHEMA.lists
+
+    @staticmethod
+    def setStringPool(pool):
+        """
+        Set string pool shared by values of low-cardinality fields (legal forms, registries, territorial units,
+        PKD codes, VAT statuses) of all mapped objects
+
+        :param pool: string pool or None to disable sharing (default)
+        :type pool: StringPool
+        """
+
+        Mapper.__pool__ = pool
+
+    @staticmethod
+    def parse(content, encoding=None, tag=None, handler=None):
+        """
+        Parse response content
+
+        :param content: response content or iterable of content chunks as they are received
+        :type content: bytes or iterable
+        :param encoding: content encoding (gzip, deflate or None)
+        :type encoding: str
+        :param tag: tag of list item elements which are passed to handler as soon as they are parsed
+            and then removed from the document
+        :type tag: str
+        :param handler: function called with every parsed item element
+        :type handler: callable
+        :return: etree document or None
+        :rtype: tree or None
+        """
+
+        if encoding in ('identity', ''):
+            encoding = None
+
+        if encoding not in (None, 'gzip', 'x-gzip', 'deflate'):
+            return None
+
+        try:
+            if isinstance(content, (bytes, bytearray)):
+                if not encoding and not tag:
+                    return etree.parse(BytesIO(content))
+
+                content = Mapper.__split(content)
+
+            if tag:
+                items = Mapper.iterparse(content, encoding, tag)
+
+                try:
+                    while True:
+                        handler(next(items))
+                except StopIteration as e:
+                    return e.value
+
+            parser = etree.XMLParser()
+
+            # decompress directly into the parser without building full size buffer
+            for data in Mapper.__decode(content, encoding):
+                parser.feed(data)
+
+            return etree.ElementTree(parser.close())
+        except (etree.XMLSyntaxError, zlib.error):
+            return None
+
+    @staticmethod
+    def decompress(content, encoding=None):
+        """
+        Decompress response content
+
+        :param content: response content
+        :type content: bytes
+        :param encoding: content encoding (gzip, deflate or None)
+        :type encoding: str
+        :return: decompressed content or None if encoding is not supported or content is invalid
+        :rtype: bytes or None
+        """
+
+        if encoding in ('identity', ''):
+            encoding = None
+
+        if encoding not in (None, 'gzip', 'x-gzip', 'deflate'):
+            return None
+
+        if not encoding:
+            return content
+
+        try:
+            return b''.join(Mapper.__decode(Mapper.__split(content), encoding))
+        except zlib.error:
+            return None
+
+    @staticmethod
+    def toXML(doc):
+        """
+        Serialize parsed response
+
+        :param doc: etree document or element
+        :type doc: tree or etree.Element
+        :return: UTF-8 encoded XML
+        :rtype: bytes
+        """
+
+        return etree.tostring(doc, encoding='UTF-8', xml_declaration=True)
+
+    @staticmethod
+    def iterparse(content, encoding=None, tag=None):
+        """
+        Parse response content, yielding list item elements as soon as they are parsed
+
+        Yielded elements are removed from the document when the next one is requested.
+
+        :param content: response content or iterable of content chunks as they are received
+        :type content: bytes or iterable
+        :param encoding: content encoding (gzip, deflate or None)
+        :type encoding: str
+        :param tag: tag of list item elements
+        :type tag: str
+        :return: generator of item elements, its return value is etree document or None if content is invalid
+        :rtype: generator
+        """
+
+        if encoding in ('identity', ''):
+            encoding = None
+
+        if encoding not in (None, 'gzip', 'x-gzip', 'deflate'):
+            return None
+
+        if isinstance(content, (bytes, bytearray)):
+            content = Mapper.__split(content)
+
+        parser = etree.XMLPullParser(events=('end',), tag=tag)
+
+        try:
+            for data in Mapper.__decode(content, encoding):
+                parser.feed(data)
+
+                yield from Mapper.__items(parser)
+
+            root = parser.close()
+
+            yield from Mapper.__items(parser)
+        except (etree.XMLSyntaxError, zlib.error):
+            return None
+
+        return etree.ElementTree(root)
+
+    @staticmethod
+    def __split(content):
+        """
+        Split content into chunks
+
+        :param content: response content
+        :type content: bytes
+        :return: content chunks
+        :rtype: generator of bytes
+        """
+
+        for i in range(0, len(content), Mapper.CHUNK_SIZE):
+            yield content[i:i + Mapper.CHUNK_SIZE]
+
+    @staticmethod
+    def __decode(chunks, encoding):
+        """
+        Decompress content chunks
+
+        :param chunks: content chunks
+        :type chunks: iterable
+        :param encoding: content encoding (gzip, deflate or None)
+        :type encoding: str
+        :return: decompressed chunks
+        :rtype: generator of bytes
+        """
+
+        inflater = None
+
+        for chunk in chunks:
+            if not encoding:
+                yield chunk
+                continue
+
+            if not inflater:
+                if encoding == 'deflate':
+                    # deflate should be zlib wrapped, but some servers send raw deflate stream
+                    zlib_header = len(chunk) > 1 and chunk[0] & 0x0f == 8 and (chunk[0] * 256 + chunk[1]) % 31 == 0
+                    wbits = zlib.MAX_WBITS if zlib_header else -zlib.MAX_WBITS
+                else:
+                    wbits = 16 + zlib.MAX_WBITS
+
+                inflater = zlib.decompressobj(wbits)
+
+            data = inflater.decompress(chunk)
+
+            if data:
+                yield data
+
+        if inflater:
+            data = inflater.flush()
+
+            if data:
+                yield data
+
+    @staticmethod
+    def __items(parser):
+        """
+        Yield parsed item elements and remove them from the document
+
+        :param parser: pull parser
+        :type parser: etree.XMLPullParser
+        :return: item elements
+        :rtype: generator of etree.Element
+        """
+
+        for event, element in parser.read_events():
+            yield element
+
+            element.clear()
+
+            # drop already handled siblings too, cleared elements are still linked to the parent
+            parent = element.getparent()
+
+            while element.getprevious() is not None:
+                del parent[0]
+
+    @staticmethod
+    def invoiceData(doc, fields=None, lazy=False):
+        """
+        Map response document to InvoiceData object
+
+        :param doc: etree document
+        :type doc: tree
+        :param fields: names of attributes to map, other attributes keep default values (None - all attributes)
+        :type fields: iterable of str
+        :param lazy: True to decode attributes on their first access
+        :type lazy: bool
+        :return: InvoiceData object
+        :rtype: InvoiceData
+        :raises ValueError: if fields contain a name which is not an InvoiceData attribute
+        """
+
+        return Mapper.mapDocument(Mapper.INVOICE_DATA_SCHEMA, doc, fields, lazy)
+
+    @staticmethod
+    def allData(doc, fields=None, lazy=False):
+        """
+        Map response document to AllData object
+
+        :param doc: etree document
+        :type doc: tree
+        :param fields: names of attributes to map, other attributes keep default values (None - all attributes)
+        :type fields: iterable of str
+        :param lazy: True to decode attributes on their first access
+        :type lazy: bool
+        :return: AllData object
+        :rtype: AllData
+        :raises ValueError: if fields contain a name which is not an AllData attribute
+        """
+
+        return Mapper.mapDocument(Mapper.ALL_DATA_SCHEMA, doc, fields, lazy)
+
+    @staticmethod
+    def viesData(doc, fields=None, lazy=False):
+        """
+        Map response document to VIESData object
+
+        :param doc: etree document
+        :type doc: tree
+        :param fields: names of attributes to map, other attributes keep default values (None - all attributes)
+        :type fields: iterable of str
+        :param lazy: True to decode attributes on their first access
+        :type lazy: bool
+        :return: VIESData object
+        :rtype: VIESData
+        :raises ValueError: if fields contain a name which is not a VIESData attribute
+        """
+
+        return Mapper.mapDocument(Mapper.VIES_DATA_SCHEMA, doc, fields, lazy)
+
+    @staticmethod
+    def vatStatus(doc, fields=None, lazy=False):
+        """
+        Map response document to VATStatus object
+
+        :param doc: etree document
+        :type doc: tree
+        :param fields: names of attributes to map, other attributes keep default values (None - all attributes)
+        :type fields: iterable of str
+        :param lazy: True to decode attributes on their first access
+        :type lazy: bool
+        :return: VATStatus object
+        :rtype: VATStatus
+        :raises ValueError: if fields contain a name which is not a VATStatus attribute
+        """
+
+        return Mapper.mapDocument(Mapper.VAT_STATUS_SCHEMA, doc, fields, lazy)
+
+    @staticmethod
+    def ibanStatus(doc, fields=None, lazy=False):
+        """
+        Map response document to IBANStatus object
+
+        :param doc: etree document
+        :type doc: tree
+        :param fields: names of attributes to map, other attributes keep default values (None - all attributes)
+        :type fields: iterable of str
+        :param lazy: True to decode attributes on their first access
+        :type lazy: bool
+        :return: IBANStatus object
+        :rtype: IBANStatus
+        :raises ValueError: if fields contain a name which is not an IBANStatus attribute
+        """
+
+        return Mapper.mapDocument(Mapper.IBAN_STATUS_SCHEMA, doc, fields, lazy)
+
+    @staticmethod
+    def wlStatus(doc, fields=None, lazy=False):
+        """
+        Map response document to WLStatus object
+
+        :param doc: etree document
+        :type doc: tree
+        :param fields: names of attributes to map, other attributes keep default values (None - all attributes)
+        :type fields: iterable of str
+        :param lazy: True to decode attributes on their first access
+        :type lazy: bool
+        :return: WLStatus object
+        :rtype: WLStatus
+        :raises ValueError: if fields contain a name which is not a WLStatus attribute
+        """
+
+        return Mapper.mapDocument(Mapper.WL_STATUS_SCHEMA, doc, fields, lazy)
+
+    @staticmethod
+    def searchResult(doc, entities=None, fields=None):
+        """
+        Map response document to SearchResult object
+
+        :param doc: etree document
+        :type doc: tree
+        :param entities: entities already mapped while parsing the document (None - map entity elements of doc)
+        :type entities: list of VATEntity
+        :param fields: names of attributes to map, other attributes keep default values (None - all attributes)
+        :type fields: iterable of str
+        :return: SearchResult object
+        :rtype: SearchResult
+        :raises ValueError: if fields contain a name which is not a SearchResult attribute
+        """
+
+        if entities is None:
+            return Mapper.mapDocument(Mapper.SEARCH_RESULT_SCHEMA, doc, fields)
+
+        if fields is None:
+            fields = Mapper.SEARCH_RESULT_SCHEMA.paths.keys()
+        elif 'results' not in fields:
+            entities = ()
+
+        sr = Mapper.mapDocument(Mapper.SEARCH_RESULT_SCHEMA, doc, [name for name in fields if name != 'results'])
+
+        for ve in entities:
+            if len(ve.nip) == 0:
+                break
+
+            sr.results.append(ve)
+
+        return sr
+
+    @staticmethod
+    def iterSearchResult(content, encoding=None):
+        """
+        Parse search result content, yielding VATEntity objects as soon as their elements are parsed
+
+        :param content: response content or iterable of content chunks as they are received
+        :type content: bytes or iterable
+        :param encoding: content encoding (gzip, deflate or None)
+        :type encoding: str
+        :return: generator of VATEntity, its return value is etree document without entities or None
+            if content is invalid
+        :rtype: generator
+        """
+
+        items = Mapper.iterparse(content, encoding, 'entity')
+        done = False
+
+        try:
+            while True:
+                element = next(items)
+
+                if done:
+                    continue
+
+                ve = Mapper.vatEntity(element)
+
+                if len(ve.nip) == 0:
+                    done = True
+                    continue
+
+                yield ve
+        except StopIteration as e:
+            return e.value
+
+    @staticmethod
+    def vatEntity(element):
+        """
+        Map entity element to VATEntity object
+
+        :param element: entity element
+        :type element: etree.Element
+        :return: VATEntity object
+        :rtype: VATEntity
+        """
+
+        return Mapper.getMapper(Mapper.VAT_ENTITY_SCHEMA)(element)
+
+    @staticmethod
+    def accountStatus(doc, fields=None, lazy=False):
+        """
+        Map response document to AccountStatus object
+
+        :param doc: etree document
+        :type doc: tree
+        :param fields: names of attributes to map, other attributes keep default values (None - all attributes)
+        :type fields: iterable of str
+        :param lazy: True to decode attributes on their first access
+        :type lazy: bool
+        :return: AccountStatus object
+        :rtype: AccountStatus
+        :raises ValueError: if fields contain a name which is not an AccountStatus attribute
+        """
+
+        return Mapper.mapDocument(Mapper.ACCOUNT_STATUS_SCHEMA, doc, fields, lazy)
+
+    @staticmethod
+    def mapDocument(schema, doc, fields=None, lazy=False):
+        """
+        Map response document to model object described by schema
+
+        :param schema: model schema
+        :type schema: Schema
+        :param doc: etree document
+        :type doc: tree
+        :param fields: names of attributes to map, other attributes keep default values (None - all attributes)
+        :type fields: iterable of str
+        :param lazy: True to decode attributes on their first access
+        :type lazy: bool
+        :return: model object
+        :raises ValueError: if fields contain a name which is not a model attribute
+        """
+
+        parent = Mapper.xpath(schema.path)(doc)
+
+        return Mapper.getMapper(schema)(parent[0] if len(parent) == 1 else None, fields, lazy)
+
+    @staticmethod
+    def getMapper(schema):
+        """
+        Get mapper generated for schema, generating it on the first use
+
+        :param schema: model schema
+        :type schema: Schema
+        :return: function(element, fields=None, lazy=False) mapping model element to model object
+        :rtype: callable
+        """
+
+        mapper = Mapper.__mappers__.get(schema)
+
+        if mapper is None:
+            mapper = Mapper.__mappers__[schema] = Mapper.compile(schema)
+
+        return mapper
+
+    @staticmethod
+    def compile(schema):
+        """
+        Generate function mapping model element to model object described by schema
+
+        Value converters, default values, projections and mappers of list items are resolved once, so the generated
+        function only walks children of the element.
+
+        :param schema: model schema
+        :type schema: Schema
+        :return: function(element, fields=None, lazy=False) returning model object; element None gives object with
+            default values, fields limits mapped attributes and lazy returns object decoding attributes on first access
+        :rtype: callable
+        :raises ValueError: if schema has a field of unknown type
+        """
+
+        cls = schema.cls
+        lazy_cls = LazyModel.subclass(cls)
+        items = dict((name, (Mapper.getMapper(item) if item else None,) + schema.lists[name])
+                     for name, item in schema.items.items())
+        projections = {}
+
+        def resolve(fields, lists):
+            return Mapper.resolve(fields), Mapper.__get_defaults(fields), [(name, items[name]) for name in lists]
+
+        full = resolve(schema.fields, schema.lists)
+
+        def decode(children, name):
+            item = items.get(name)
+
+            if item is not None:
+                return Mapper.__get_list(children.get(item[1]), item)
+
+            field = schema.paths.get(name)
+
+            if field is None:
+                raise AttributeError("'" + cls.__name__ + "' object has no attribute '" + name + "'")
+
+            tags, type = field
+            element = children.get(tags[0])
+
+            for tag in tags[1:]:
+                if element is None:
+                    break
+
+                element = next(element.iterchildren(tag), None)
+
+            return Mapper.convert(element.text if element is not None else '', type)
+
+        def map(element, fields=None, lazy=False):
+            if lazy:
+                # index children once, the last one wins as in a full walk
+                return lazy_cls(dict((child.tag, child) for child in element) if element is not None else {}, decode)
+
+            if fields is None:
+                converters, defaults, lists = full
+            else:
+                names = frozenset(fields)
+                projection = projections.get(names)
+
+                if projection is None:
+                    projection = resolve(*Mapper.project(schema, names))
+
+                    if len(projections) >= Mapper.PROJECTION_CACHE_SIZE:
+                        projections.clear()
+
+                    projections[names] = projection
+
+                converters, defaults, lists = projection
+
+            obj = cls()
+
+            for name, value in defaults:
+                setattr(obj, name, value)
+
+            if element is not None:
+                Mapper.walkConverters(element, converters, obj)
+
+                for name, item in lists:
+                    setattr(obj, name, Mapper.__get_list(next(element.iterchildren(item[1]), None), item))
+
+            return obj
+
+        return map
+
+    @staticmethod
+    def resolve(fields):
+        """
+        Replace value types of fields table by converter functions
+
+        :param fields: target key (attribute name or column index) and value type by child element tag, dict value
+            for nested elements
+        :type fields: dict
+        :return: target key and converter by child element tag, dict value for nested elements
+        :rtype: dict
+        :raises ValueError: if a field has unknown type
+        """
+
+        converters = {}
+
+        for tag, field in fields.items():
+            if isinstance(field, dict):
+                converters[tag] = Mapper.resolve(field)
+            elif field[1] in Mapper.__converters__:
+                converters[tag] = (field[0], Mapper.__converters__[field[1]])
+            else:
+                raise ValueError('Unknown field type: ' + str(field[1]))
+
+        return converters
+
+    @staticmethod
+    def __get_defaults(fields):
+        """
+        Get values of fields missing in response
+
+        :param fields: attribute name and value type by child element tag, dict value for nested elements
+        :type fields: dict
+        :return: attribute name and default value pairs
+        :rtype: list of tuple
+        """
+
+        defaults = []
+
+        for field in fields.values():
+            if isinstance(field, dict):
+                defaults.extend(Mapper.__get_defaults(field))
+            else:
+                defaults.append((field[0], Mapper.convert('', field[1])))
+
+        return defaults
+
+    @staticmethod
+    def walkConverters(element, converters, target, setter=setattr):
+        """
+        Map child elements to target values using converters resolved by resolve()
+
+        :param element: parent element
+        :type element: etree.Element
+        :param converters: target key and converter by child element tag, dict value for nested elements
+        :type converters: dict
+        :param target: target object or row
+        :type target: object or list
+        :param setter: function setting target value by key, e.g. setattr for objects or operator.setitem for rows
+        :type setter: callable
+        """
+
+        for child in element:
+            field = converters.get(child.tag)
+
+            if field is None:
+                continue
+
+            if isinstance(field, dict):
+                Mapper.walkConverters(child, field, target, setter)
+            else:
+                text = child.text
+                setter(target, field[0], field[1](text.strip() if text else ''))
+
+    @staticmethod
+    def __get_list(container, item):
+        """
+        Map items of nested list
+
+        :param container: container element of items or None
+        :type container: etree.Element
+        :param item: item mapper (None - text items), container tag, item tag, item fields and item key attribute
+        :type item: tuple
+        :return: list of items, ending before the first item with empty key attribute
+        :rtype: list
+        """
+
+        values = []
+
+        if container is None:
+            return values
+
+        mapper, tag, key = item[0], item[2], item[4]
+
+        for element in container.iterchildren(tag):
+            if mapper is None:
+                value = Mapper.convert(element.text, 'text')
+
+                if len(value) == 0:
+                    break
+            else:
+                value = mapper(element)
+
+                if len(getattr(value, key)) == 0:
+                    break
+
+            values.append(value)
+
+        return values
+
+    @staticmethod
+    def project(schema, names):
+        """
+        Get fields and lists tables of schema limited to specified attributes
+
+        :param schema: model schema
+        :type schema: Schema
+        :param names: names of attributes to keep
+        :type names: iterable of str
+        :return: projected fields and lists tables
+        :rtype: tuple
+        :raises ValueError: if a name is neither a field nor a list of the schema
+        """
+
+        names = frozenset(names)
+        key = (schema, names)
+
+        projection = Mapper.__projections__.get(key)
+
+        if projection is None:
+            unknown = names.difference(schema.paths, schema.lists)
+
+            if unknown:
+                raise ValueError('Unknown field: ' + ', '.join(sorted(unknown)))
+
+            projection = (Mapper.__project(schema.fields, names),
+                          dict((name, item) for name, item in schema.lists.items() if name in names))
+
+            if len(Mapper.__projections__) >= Mapper.PROJECTION_CACHE_SIZE:
+                Mapper.__projections__.clear()
+
+            Mapper.__projections__[key] = projection
+
+        return projection
+
+    @staticmethod
+    def __project(fields, names):
+        """
+        Get fields table limited to specified attributes
+
+        :param fields: attribute name and value type by child element tag, dict value for nested elements
+        :type fields: dict
+        :param names: names of attributes to keep
+        :type names: frozenset
+        :return: fields table without other attributes and without empty nested tables
+        :rtype: dict
+        """
+
+        table = {}
+
+        for tag, field in fields.items():
+            if isinstance(field, dict):
+                field = Mapper.__project(field, names)
+
+                if field:
+                    table[tag] = field
+            elif field[0] in names:
+                table[tag] = field
+
+        return table
+
+    @staticmethod
+    def xpath(path):
+        """
+        Get compiled XPath expression, compiling it only on the first use
+
+        :param path: xpath string
+        :type path: str
+        :return: compiled expression
+        :rtype: etree.XPath
+        """
+
+        xp = Mapper.__xpaths__.get(path)
+
+        if xp is None:
+            xp = Mapper.__xpaths__[path] = etree.XPath(path, smart_strings=False)
+
+        return xp
+
+    @staticmethod
+    def convert(s, type):
+        """
+        Convert element text to value of specified type
+
+        :param s: element text
+        :type s: str or None
+        :param type: value type (text, pooled, date, datetime, bool, int or float)
+        :type type: str
+        :return: converted value
+        """
+
+        converter = Mapper.__converters__.get(type)
+
+        if converter is None:
+            raise ValueError('Unknown field type: ' + str(type))
+
+        return converter(s.strip() if s else '')
+
+    @staticmethod
+    def getText(doc, xpath):
+        """
+        Get XML element as text
+
+        :param doc: etree document
+        :type doc: tree
+        :param xpath: xpath string
+        :type xpath: string
+        :return: string
+        :rtype: str
+        """
+
+        s = Mapper.xpath(xpath)(doc)
+
+        if not s:
+            return ''
+
+        if len(s) != 1:
+            return ''
+
+        return str(s[0].strip())
+
+    @staticmethod
+    def parseDateTime(s):
+        """
+        Parse date time string
+
+        :param s: date time string
+        :type s: str
+        :return: datetime
+        :rtype: datetime or None
+        """
+
+        if len(s) == 0:
+            return None
+
+        dt = Mapper.__dates__.get(s)
+
+        if dt is None:
+            dt = Mapper.__parse_iso(s)
+
+            if dt is None:
+                dt = parse(s)
+
+            if len(Mapper.__dates__) >= Mapper.DATE_CACHE_SIZE:
+                Mapper.__dates__.clear()
+
+            Mapper.__dates__[s] = dt
+
+        return dt
+
+    @staticmethod
+    def parseDate(s):
+        """
+        Parse xsd:date string
+
+        :param s: date string
+        :type s: str
+        :return: datetime
+        :rtype: datetime or None
+        """
+
+        sl = len(s)
+
+        if sl == 0:
+            return None
+        elif sl == 11:
+            # dateutil does not support xsd:date type in form YYYY-MM-DDZ
+            s = s[0:10] + 'T00:00:00Z'
+        elif sl == 16:
+            # dateutil does not support xsd:date type in form YYYY-MM-DD+00:00
+            s = s[0:10] + 'T00:00:00' + s[10:]
+
+        return Mapper.parseDateTime(s)
+
+    @staticmethod
+    def __parse_iso(s):
+        """
+        Parse ISO 8601 date time string without dateutil
+
+        :param s: date time string
+        :type s: str
+        :return: datetime with the same time zone objects as dateutil or None if not in ISO format
+        :rtype: datetime or None
+        """
+
+        if len(s) < 10 or s[4] != '-' or s[7] != '-':
+            return None
+
+        if s[-1] == 'Z':
+            s = s[:-1] + '+00:00'
+
+        try:
+            dt = datetime.fromisoformat(s)
+        except ValueError:
+            return None
+
+        offset = dt.utcoffset()
+
+        if offset:
+            dt = dt.replace(tzinfo=tz.tzoffset(None, int(offset.total_seconds())))
+        elif offset is not None:
+            if Mapper.__utc__ is None:
+                Mapper.__utc__ = parse('2000-01-01T00:00:00Z').tzinfo
+
+            dt = dt.replace(tzinfo=Mapper.__utc__)
+
+        return dt
+
+
+
+# generate mappers of all response documents once, at import time
+for _schema in Mapper.SCHEMAS:
+    Mapper.getMapper(_schema)
@@ -0,0 +1,151 @@
+#
+# -*- coding: utf-8 -*-
+#
+# Copyright 2015-2025 NETCAT (www.netcat.pl)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# @author NETCAT <firma@netcat.pl>
+# @copyright 2015-2025 NETCAT (www.netcat.pl)
+# @license http://www.apache.org/licenses/LICENSE-2.0
+#
+
+
+import threading
+import urllib.parse
+
+from nip24 import Response, Transport, AsyncTransport
+
+
+class MemoryTransport(Transport):
+    """
+    In-memory transport replaying canned responses
+    """
+
+    def __init__(self, responses=None):
+        """
+        Construct new in-memory transport
+
+        :param responses: canned response bodies by URL path fragment, e.g. {'/get/all/': b'<result>...'}
+        :type responses: dict
+        """
+
+        self.responses = []
+        self.requests = 0
+
+        self.__lock__ = threading.Lock()
+
+        if responses:
+            for path, body in responses.items():
+                self.add(path, body)
+
+    def add(self, path, body, status=200, headers=None):
+        """
+        Add canned response
+
+        :param path: URL path fragment, first added matching fragment wins
+        :type path: str
+        :param body: response body
+        :type body: bytes
+        :param status: HTTP status
+        :type status: int
+        :param headers: response headers with lowercase names
+        :type headers: dict
+        """
+
+        self.responses.append((path, Response(status, headers or {'content-type': 'application/xml'}, body)))
+
+    def send(self, method, url, headers, connectTimeout=None, readTimeout=None, deadline=None):
+        """
+        Get canned response matching request URL
+
+        :param method: HTTP method
+        :type method: str
+        :param url: target URL
+        :type url: str
+        :param headers: request headers
+        :type headers: dict
+        :param connectTimeout: ignored
+        :type connectTimeout: float
+        :param readTimeout: ignored
+        :type readTimeout: float
+        :param deadline: ignored
+        :type deadline: float
+        :return: matching response or 404 response
+        :rtype: Response
+        """
+
+        with self.__lock__:
+            self.requests += 1
+
+        path = urllib.parse.urlsplit(url).path
+
+        for fragment, response in self.responses:
+            if fragment in path:
+                return response
+
+        return Response(404)
+
+
+class AsyncMemoryTransport(AsyncTransport):
+    """
+    In-memory transport replaying canned responses for asyncio
+    """
+
+    def __init__(self, responses=None):
+        """
+        Construct new in-memory transport
+
+        :param responses: canned response bodies by URL path fragment, e.g. {'/get/all/': b'<result>...'}
+        :type responses: dict
+        """
+
+        self.memory = MemoryTransport(responses)
+
+    def add(self, path, body, status=200, headers=None):
+        """
+        Add canned response
+
+        :param path: URL path fragment, first added matching fragment wins
+        :type path: str
+        :param body: response body
+        :type body: bytes
+        :param status: HTTP status
+        :type status: int
+        :param headers: response headers with lowercase names
+        :type headers: dict
+        """
+
+        self.memory.add(path, body, status, headers)
+
+    async def send(self, method, url, headers, connectTimeout=None, readTimeout=None, deadline=None):
+        """
+        Get canned response matching request URL
+
+        :param method: HTTP method
+        :type method: str
+        :param url: target URL
+        :type url: str
+        :param headers: request headers
+        :type headers: dict
+        :param connectTimeout: ignored
+        :type connectTimeout: float
+        :param readTimeout: ignored
+        :type readTimeout: float
+        :param deadline: ignored
+        :type deadline: float
+        :return: matching response or 404 response
+        :rtype: Response
+        """
+
+        return self.memory.send(method, url, headers)
@@ -20,6 +20,7 @@
 # @license http://www.apache.org/licenses/LICENSE-2.0
 #
 
+import operator
 import re
 
 
@@ -28,6 +29,12 @@ class NIP:
     NIP number validator
     """
 
+    __pattern__ = re.compile('[0-9]{10}')
+
+    # checksum weights and sum of weights times ord('0'), checked digits are summed as character codes
+    __weights__ = (6, 5, 7, 2, 3, 4, 5, 6, 7)
+    __offset__ = 48 * sum(__weights__)
+
     @staticmethod
     def normalize(nip):
         """
@@ -42,9 +49,9 @@ class NIP:
         if not nip:
             return False
 
-        nip = re.sub('[ -]', '', nip).upper()
+        nip = nip.replace(' ', '').replace('-', '').upper()
 
-        if not re.match('[0-9]{10}', nip):
+        if not NIP.__pattern__.match(nip):
             return False
 
         return nip
@@ -65,15 +72,7 @@ class NIP:
         if not nip:
             return False
 
-        w = [6, 5, 7, 2, 3, 4, 5, 6, 7]
-        sum = 0
-
-        for i in range(0, len(w)):
-            sum += int(nip[i]) * w[i]
-
-        sum %= 11
-
-        if sum != int(nip[9]):
-            return False
+        # first 10 characters are ASCII digits
+        digits = nip[:10].encode('ascii')
 
-        return True
+        return (sum(map(operator.mul, NIP.__weights__, digits)) - NIP.__offset__) % 11 == digits[9] - 48
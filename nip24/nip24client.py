@@ -20,39 +20,19 @@
 # @license http://www.apache.org/licenses/LICENSE-2.0
 #
 
-import base64
-import datetime
-import hashlib
-import hmac
-import os
-import sys
+import concurrent.futures
+import http.client
+import socket
 import time
-import urllib.error
-import urllib.parse
-import urllib.request
 
-from nip24 import (Error, Number, NIP, REGON, KRS, EUVAT, BusinessPartner, PKD, IBAN, AllData, InvoiceData,
-                   VIESData, VATStatus, IBANStatus, WLStatus, VATPerson, VATEntity, SearchResult, AccountStatus)
-from io import BytesIO
-from lxml import etree
-from dateutil.parser import parse
+from nip24 import Error, Number, ConnectionPool, RateLimiter, SingleFlight, Mapper, Result, BaseNIP24Client
 
 
-class NIP24Client:
+class NIP24Client(BaseNIP24Client):
     """
     NIP24 service client
     """
 
-    VERSION = '1.4.2'
-
-    PRODUCTION_URL = 'https://www.nip24.pl/api'
-    TEST_URL = 'https://www.nip24.pl/api-test'
-
-    TEST_ID = 'test_id'
-    TEST_KEY = 'test_key'
-
-    HMAC_ALG = hashlib.sha256
-
     def __init__(self, id=None, key=None):
         """
         Construct new service client object
@@ -62,26 +42,57 @@ class NIP24Client:
         :param key: NIP24 key
         :type key: str
         """
-        self.__url__ = self.TEST_URL
-        self.__id__ = self.TEST_ID
-        self.__key__ = self.TEST_KEY
 
-        if id is not None and key is not None:
-            self.__url__ = self.PRODUCTION_URL
-            self.__id__ = id
-            self.__key__ = key
+        BaseNIP24Client.__init__(self, id, key)
 
-        self.__clear()
+        self.__transport__ = ConnectionPool()
+        self.__flight__ = SingleFlight()
 
-    def setURL(self, url):
+    def setTransport(self, transport):
         """
-        Set non default service URL
+        Set non default HTTP transport
 
-        :param url: service URL
-        :type url: str
+        :param transport: transport object, e.g. ConnectionPool(idleTimeout=0) to disable keep-alive
+        :type transport: Transport
+        """
+
+        self.__transport__ = transport
+
+    def setSingleFlight(self, enabled):
+        """
+        Enable or disable sharing of one in-flight request by concurrent identical calls
+
+        :param enabled: True to coalesce identical concurrent requests (default)
+        :type enabled: bool
         """
 
-        self.__url__ = url
+        self.__flight__ = SingleFlight() if enabled else None
+
+    def configureRateLimiter(self, burst=1):
+        """
+        Configure client side rate limiter using current account's billing plan
+
+        :param burst: number of requests that may be sent at once without waiting
+        :type burst: int
+        :return: True if rate limiter was configured
+        :rtype: bool
+        """
+
+        status = self.getAccountStatus()
+
+        if not status:
+            return False
+
+        self.setRateLimiter(RateLimiter.fromAccountStatus(status, burst))
+
+        return True
+
+    def close(self):
+        """
+        Close idle connections
+        """
+
+        self.__transport__.close()
 
     def isActive(self, nip_):
         """
@@ -107,45 +118,12 @@ class NIP24Client:
         :rtype: bool
         """
 
-        # clear error
-        self.__clear()
+        url = self._get_url('/check/firm/', type, number)
 
-        # validate number and construct path
-        suffix = self.__get_path_suffix(type, number)
-
-        if not suffix:
+        if not url:
             return False
 
-        # prepare url
-        url = self.__url__ + '/check/firm/' + suffix
-
-        # send request
-        res = self.__get(url)
-
-        if not res:
-            self.__set(Error.CLI_CONNECT)
-            return False
-
-        # parse response
-        doc = etree.parse(BytesIO(res))
-
-        if not doc:
-            self.__set(Error.CLI_RESPONSE)
-            return False
-
-        code = self.__get_text(doc, '/result/error/code/text()')
-
-        if len(code) > 0:
-            if int(code) == 9:
-                # not active
-                self.__clear()
-                return False
-            else:
-                self.__set(int(code), self.__get_text(doc, '/result/error/description/text()'))
-                return False
-
-        # ok
-        return True
+        return self._is_active(self.__fetch(url))
 
     def getInvoiceData(self, nip, force=True):
         """
@@ -175,62 +153,14 @@ class NIP24Client:
         :rtype: InvoiceData or False
         """
 
-        # clear error
-        self.__clear()
+        url = self._get_url('/get/invoice/', type, number)
 
-        # validate number and construct path
-        suffix = self.__get_path_suffix(type, number)
-
-        if not suffix:
-            return False
-
-        # prepare url
-        url = self.__url__ + '/get/invoice/' + suffix
-
-        # send request
-        res = self.__get(url)
-
-        if not res:
-            self.__set(Error.CLI_CONNECT)
-            return False
-
-        # parse response
-        doc = etree.parse(BytesIO(res))
-
-        if not doc:
-            self.__set(Error.CLI_RESPONSE)
+        if not url:
             return False
 
-        code = self.__get_text(doc, '/result/error/code/text()')
+        return self._map(self.__fetch(url), Mapper.invoiceData)
 
-        if len(code) > 0:
-            self.__set(int(code), self.__get_text(doc, '/result/error/description/text()'))
-            return False
-
-        invoice = InvoiceData()
-
-        invoice.uid = self.__get_text(doc, '/result/firm/uid/text()')
-
-        invoice.nip = self.__get_text(doc, '/result/firm/nip/text()')
-
-        invoice.name = self.__get_text(doc, '/result/firm/name/text()')
-        invoice.firstname = self.__get_text(doc, '/result/firm/firstname/text()')
-        invoice.lastname = self.__get_text(doc, '/result/firm/lastname/text()')
-
-        invoice.street = self.__get_text(doc, '/result/firm/street/text()')
-        invoice.streetNumber = self.__get_text(doc, '/result/firm/streetNumber/text()')
-        invoice.houseNumber = self.__get_text(doc, '/result/firm/houseNumber/text()')
-        invoice.city = self.__get_text(doc, '/result/firm/city/text()')
-        invoice.postCode = self.__get_text(doc, '/result/firm/postCode/text()')
-        invoice.postCity = self.__get_text(doc, '/result/firm/postCity/text()')
-
-        invoice.phone = self.__get_text(doc, '/result/firm/phone/text()')
-        invoice.email = self.__get_text(doc, '/result/firm/email/text()')
-        invoice.www = self.__get_text(doc, '/result/firm/www/text()')
-
-        return invoice
-
-    def getAllData(self, nip, force=True):
+    def getAllData(self, nip, force=True, fields=None):
         """
         Get all firm data for specified NIP number
 
@@ -238,13 +168,15 @@ class NIP24Client:
         :type nip: str
         :param force: ignored, left for backward compatibility
         :type force: bool
+        :param fields: names of AllData attributes to map, e.g. ['name', 'regon', 'pkd'] (None - all attributes)
+        :type fields: iterable of str
         :return: AllData object or False
         :rtype: AllData or False
         """
 
-        return self.getAllDataExt(Number.NIP, nip)
+        return self.getAllDataExt(Number.NIP, nip, fields=fields)
 
-    def getAllDataExt(self, type, number, force=True):
+    def getAllDataExt(self, type, number, force=True, fields=None):
         """
         Get all data for specified number type
 
@@ -254,148 +186,18 @@ class NIP24Client:
         :type number: str
         :param force: ignored, left for backward compatibility
         :type force: bool
+        :param fields: names of AllData attributes to map, other attributes keep default values, lists
+            businessPartner and pkd are built only if named (None - all attributes, ignored in lazy mode)
+        :type fields: iterable of str
         :return: AllData object or False
         :rtype: AllData or False
+        :raises ValueError: if fields contain a name which is not an AllData attribute
         """
 
-        # clear error
-        self.__clear()
-
-        # validate number and construct path
-        suffix = self.__get_path_suffix(type, number)
-
-        if not suffix:
-            return False
-
-        # prepare url
-        url = self.__url__ + '/get/all/' + suffix
-
-        # send request
-        res = self.__get(url)
-
-        if not res:
-            self.__set(Error.CLI_CONNECT)
-            return False
-
-        # parse response
-        doc = etree.parse(BytesIO(res))
-
-        if not doc:
-            self.__set(Error.CLI_RESPONSE)
-            return False
-
-        code = self.__get_text(doc, '/result/error/code/text()')
-
-        if len(code) > 0:
-            self.__set(int(code), self.__get_text(doc, '/result/error/description/text()'))
-            return False
-
-        all = AllData()
-
-        all.uid = self.__get_text(doc, '/result/firm/uid/text()')
-
-        all.type = self.__get_text(doc, '/result/firm/type/text()')
-        all.nip = self.__get_text(doc, '/result/firm/nip/text()')
-        all.regon = self.__get_text(doc, '/result/firm/regon/text()')
-
-        all.name = self.__get_text(doc, '/result/firm/name/text()')
-        all.shortname = self.__get_text(doc, '/result/firm/shortname/text()')
-        all.firstname = self.__get_text(doc, '/result/firm/firstname/text()')
-        all.secondname = self.__get_text(doc, '/result/firm/secondname/text()')
-        all.lastname = self.__get_text(doc, '/result/firm/lastname/text()')
-
-        all.street = self.__get_text(doc, '/result/firm/street/text()')
-        all.streetCode = self.__get_text(doc, '/result/firm/streetCode/text()')
-        all.streetNumber = self.__get_text(doc, '/result/firm/streetNumber/text()')
-        all.houseNumber = self.__get_text(doc, '/result/firm/houseNumber/text()')
-        all.city = self.__get_text(doc, '/result/firm/city/text()')
-        all.cityCode = self.__get_text(doc, '/result/firm/cityCode/text()')
-        all.community = self.__get_text(doc, '/result/firm/community/text()')
-        all.communityCode = self.__get_text(doc, '/result/firm/communityCode/text()')
-        all.county = self.__get_text(doc, '/result/firm/county/text()')
-        all.countyCode = self.__get_text(doc, '/result/firm/countyCode/text()')
-        all.state = self.__get_text(doc, '/result/firm/state/text()')
-        all.stateCode = self.__get_text(doc, '/result/firm/stateCode/text()')
-        all.postCode = self.__get_text(doc, '/result/firm/postCode/text()')
-        all.postCity = self.__get_text(doc, '/result/firm/postCity/text()')
+        # fail before sending the request
+        self._check_fields(fields)
 
-        all.phone = self.__get_text(doc, '/result/firm/phone/text()')
-        all.email = self.__get_text(doc, '/result/firm/email/text()')
-        all.www = self.__get_text(doc, '/result/firm/www/text()')
-
-        all.creationDate = self.__get_date_time(doc, '/result/firm/creationDate/text()')
-        all.startDate = self.__get_date_time(doc, '/result/firm/startDate/text()')
-        all.registrationDate = self.__get_date_time(doc, '/result/firm/registrationDate/text()')
-        all.holdDate = self.__get_date_time(doc, '/result/firm/holdDate/text()')
-        all.renevalDate = self.__get_date_time(doc, '/result/firm/renevalDate/text()')
-        all.lastUpdateDate = self.__get_date_time(doc, '/result/firm/lastUpdateDate/text()')
-        all.endDate = self.__get_date_time(doc, '/result/firm/endDate/text()')
-
-        all.registryEntityCode = self.__get_text(doc, '/result/firm/registryEntity/code/text()')
-        all.registryEntityName = self.__get_text(doc, '/result/firm/registryEntity/name/text()')
-
-        all.registryCode = self.__get_text(doc, '/result/firm/registry/code/text()')
-        all.registryName = self.__get_text(doc, '/result/firm/registry/name/text()')
-
-        all.recordCreationDate = self.__get_date_time(doc, '/result/firm/record/created/text()')
-        all.recordNumber = self.__get_text(doc, '/result/firm/record/number/text()')
-
-        all.basicLegalFormCode = self.__get_text(doc, '/result/firm/basicLegalForm/code/text()')
-        all.basicLegalFormName = self.__get_text(doc, '/result/firm/basicLegalForm/name/text()')
-
-        all.specificLegalFormCode = self.__get_text(doc, '/result/firm/specificLegalForm/code/text()')
-        all.specificLegalFormName = self.__get_text(doc, '/result/firm/specificLegalForm/name/text()')
-
-        all.ownershipFormCode = self.__get_text(doc, '/result/firm/ownershipForm/code/text()')
-        all.ownershipFormName = self.__get_text(doc, '/result/firm/ownershipForm/name/text()')
-
-        all.businessPartner = []
-
-        i = 1
-        while True:
-            code = self.__get_text(doc, '/result/firm/businessPartners/businessPartner[' + str(i) + ']/regon/text()')
-
-            if len(code) == 0:
-                break
-
-            firm = self.__get_text(doc, '/result/firm/businessPartners/businessPartner[' + str(i) + ']/firmName/text()')
-            first = self.__get_text(doc, '/result/firm/businessPartners/businessPartner[' + str(i) + ']/firstName/text()')
-            second = self.__get_text(doc, '/result/firm/businessPartners/businessPartner[' + str(i) + ']/secondName/text()')
-            last = self.__get_text(doc, '/result/firm/businessPartners/businessPartner[' + str(i) + ']/lastName/text()')
-
-            bp = BusinessPartner()
-            bp.regon = code
-            bp.firmName = firm
-            bp.firstName = first
-            bp.secondName = second
-            bp.lastName = last
-
-            all.businessPartner.append(bp)
-            i += 1
-
-        all.pkd = []
-
-        i = 1
-        while True:
-            code = self.__get_text(doc, '/result/firm/PKDs/PKD[' + str(i) + ']/code/text()')
-
-            if len(code) == 0:
-                break
-
-            descr = self.__get_text(doc, '/result/firm/PKDs/PKD[' + str(i) + ']/description/text()')
-            pri = self.__get_text(doc, '/result/firm/PKDs/PKD[' + str(i) + ']/primary/text()')
-            ver = self.__get_text(doc, '/result/firm/PKDs/PKD[' + str(i) + ']/version/text()')
-
-            pkd = PKD()
-            pkd.code = code
-            pkd.description = descr
-            pkd.primary = True if pri == "true" else False
-            pkd.version = ver
-
-            all.pkd.append(pkd)
-            i += 1
-
-        return all
+        return self._map(self.__get_all_data(type, number), Mapper.allData, fields)
 
     def getVIESData(self, euvat):
         """
@@ -407,56 +209,12 @@ class NIP24Client:
         :rtype: VIESData or False
         """
 
-        # clear error
-        self.__clear()
-
-        # validate number and construct path
-        suffix = self.__get_path_suffix(Number.EUVAT, euvat)
-
-        if not suffix:
-            return False
-
-        # prepare url
-        url = self.__url__ + '/get/vies/' + suffix
-
-        # send request
-        res = self.__get(url)
+        url = self._get_url('/get/vies/', Number.EUVAT, euvat)
 
-        if not res:
-            self.__set(Error.CLI_CONNECT)
+        if not url:
             return False
 
-        # parse response
-        doc = etree.parse(BytesIO(res))
-
-        if not doc:
-            self.__set(Error.CLI_RESPONSE)
-            return False
-
-        code = self.__get_text(doc, '/result/error/code/text()')
-
-        if len(code) > 0:
-            self.__set(int(code), self.__get_text(doc, '/result/error/description/text()'))
-            return False
-
-        vies = VIESData()
-
-        vies.uid = self.__get_text(doc, '/result/vies/uid/text()')
-
-        vies.countryCode = self.__get_text(doc, '/result/vies/countryCode/text()')
-        vies.vatNumber = self.__get_text(doc, '/result/vies/vatNumber/text()')
-
-        vies.valid = True if self.__get_text(doc, '/result/vies/valid/text()') == 'true' else False
-
-        vies.traderName = self.__get_text(doc, '/result/vies/traderName/text()')
-        vies.traderCompanyType = self.__get_text(doc, '/result/vies/traderCompanyType/text()')
-        vies.traderAddress = self.__get_text(doc, '/result/vies/traderAddress/text()')
-
-        vies.id = self.__get_text(doc, '/result/vies/id/text()')
-        vies.date = self.__get_date(doc, '/result/vies/date/text()')
-        vies.source = self.__get_text(doc, '/result/vies/source/text()')
-
-        return vies
+        return self._map(self.__fetch(url), Mapper.viesData)
 
     def getVATStatus(self, nip, direct=True):
         """
@@ -486,54 +244,12 @@ class NIP24Client:
         :rtype: VATStatus or False
         """
 
-        # clear error
-        self.__clear()
-
-        # validate number and construct path
-        suffix = self.__get_path_suffix(type, number)
-
-        if not suffix:
-            return False
-
-        # prepare url
-        url = self.__url__ + '/check/vat/direct/' + suffix
-
-        # send request
-        res = self.__get(url)
+        url = self._get_url('/check/vat/direct/', type, number)
 
-        if not res:
-            self.__set(Error.CLI_CONNECT)
+        if not url:
             return False
 
-        # parse response
-        doc = etree.parse(BytesIO(res))
-
-        if not doc:
-            self.__set(Error.CLI_RESPONSE)
-            return False
-
-        code = self.__get_text(doc, '/result/error/code/text()')
-
-        if len(code) > 0:
-            self.__set(int(code), self.__get_text(doc, '/result/error/description/text()'))
-            return False
-
-        vat = VATStatus()
-
-        vat.uid = self.__get_text(doc, '/result/vat/uid/text()')
-
-        vat.nip = self.__get_text(doc, '/result/vat/nip/text()')
-        vat.regon = self.__get_text(doc, '/result/vat/regon/text()')
-        vat.name = self.__get_text(doc, '/result/vat/name/text()')
-
-        vat.status = int(self.__get_text(doc, '/result/vat/status/text()'))
-        vat.result = self.__get_text(doc, '/result/vat/result/text()')
-
-        vat.id = self.__get_text(doc, '/result/vat/id/text()')
-        vat.date = self.__get_date(doc, '/result/vat/date/text()')
-        vat.source = self.__get_text(doc, '/result/vat/source/text()')
-
-        return vat
+        return self._map(self.__fetch(url), Mapper.vatStatus)
 
     def getIBANStatus(self, nip, iban, date=None):
         """
@@ -567,63 +283,12 @@ class NIP24Client:
         :rtype: IBANStatus or False
         """
 
-        # clear error
-        self.__clear()
-
-        # validate number and construct path
-        suffix = self.__get_path_suffix(type, number)
-
-        if not suffix:
-            return False
-
-        if not IBAN.isValid(iban):
-            iban = 'PL' + iban
-
-            if not IBAN.isValid(iban):
-                self.__set(Error.CLI_IBAN)
-                return False
-
-        if not date:
-            date = datetime.date.today().strftime('%Y-%m-%d')
-
-        # prepare url
-        url = self.__url__ + '/check/iban/' + suffix + '/' + IBAN.normalize(iban) + '/' + parse(date).strftime('%Y-%m-%d')
-
-        # send request
-        res = self.__get(url)
+        url = self._get_iban_url('/check/iban/', type, number, iban, date)
 
-        if not res:
-            self.__set(Error.CLI_CONNECT)
+        if not url:
             return False
 
-        # parse response
-        doc = etree.parse(BytesIO(res))
-
-        if not doc:
-            self.__set(Error.CLI_RESPONSE)
-            return False
-
-        code = self.__get_text(doc, '/result/error/code/text()')
-
-        if len(code) > 0:
-            self.__set(int(code), self.__get_text(doc, '/result/error/description/text()'))
-            return False
-
-        ibs = IBANStatus()
-
-        ibs.uid = self.__get_text(doc, '/result/iban/uid/text()')
-
-        ibs.nip = self.__get_text(doc, '/result/iban/nip/text()')
-        ibs.regon = self.__get_text(doc, '/result/iban/regon/text()')
-        ibs.iban = self.__get_text(doc, '/result/iban/iban/text()')
-
-        ibs.valid = True if self.__get_text(doc, '/result/iban/valid/text()') == 'true' else False
-
-        ibs.id = self.__get_text(doc, '/result/iban/id/text()')
-        ibs.date = self.__get_date(doc, '/result/iban/date/text()')
-        ibs.source = self.__get_text(doc, '/result/iban/source/text()')
-
-        return ibs
+        return self._map(self.__fetch(url), Mapper.ibanStatus)
 
     def getWhitelistStatus(self, nip, iban, date=None):
         """
@@ -657,67 +322,12 @@ class NIP24Client:
         :rtype: WLStatus or False
         """
 
-        # clear error
-        self.__clear()
-
-        # validate number and construct path
-        suffix = self.__get_path_suffix(type, number)
-
-        if not suffix:
-            return False
-
-        if not IBAN.isValid(iban):
-            iban = 'PL' + iban
-
-            if not IBAN.isValid(iban):
-                self.__set(Error.CLI_IBAN)
-                return False
-
-        if not date:
-            date = datetime.date.today().strftime('%Y-%m-%d')
-
-        # prepare url
-        url = self.__url__ + '/check/whitelist/' + suffix + '/' + IBAN.normalize(iban) + '/' + parse(date).strftime('%Y-%m-%d')
+        url = self._get_iban_url('/check/whitelist/', type, number, iban, date)
 
-        # send request
-        res = self.__get(url)
-
-        if not res:
-            self.__set(Error.CLI_CONNECT)
-            return False
-
-        # parse response
-        doc = etree.parse(BytesIO(res))
-
-        if not doc:
-            self.__set(Error.CLI_RESPONSE)
+        if not url:
             return False
 
-        code = self.__get_text(doc, '/result/error/code/text()')
-
-        if len(code) > 0:
-            self.__set(int(code), self.__get_text(doc, '/result/error/description/text()'))
-            return False
-
-        wls = WLStatus()
-
-        wls.uid = self.__get_text(doc, '/result/whitelist/uid/text()')
-
-        wls.nip = self.__get_text(doc, '/result/whitelist/nip/text()')
-        wls.iban = self.__get_text(doc, '/result/whitelist/iban/text()')
-
-        wls.valid = True if self.__get_text(doc, '/result/whitelist/valid/text()') == 'true' else False
-        wls.virtual = True if self.__get_text(doc, '/result/whitelist/virtual/text()') == 'true' else False
-
-        wls.status = int(self.__get_text(doc, '/result/whitelist/vatStatus/text()'))
-        wls.result = self.__get_text(doc, '/result/whitelist/vatResult/text()')
-
-        wls.hashIndex = int(self.__get_text(doc, '/result/whitelist/hashIndex/text()'))
-        wls.maskIndex = int(self.__get_text(doc, '/result/whitelist/maskIndex/text()'))
-        wls.date = self.__get_date(doc, '/result/whitelist/date/text()')
-        wls.source = self.__get_text(doc, '/result/whitelist/source/text()')
-
-        return wls
+        return self._map(self.__fetch(url), Mapper.wlStatus)
 
     def searchVATRegistry(self, nip, date=None):
         """
@@ -747,94 +357,130 @@ class NIP24Client:
         :rtype: SearchResult or False
         """
 
-        # clear error
-        self.__clear()
+        url = self._get_search_url(type, number, date)
 
-        # validate number and construct path
-        suffix = self.__get_path_suffix(type, number)
+        if not url:
+            return False
+
+        # send request
+        entities = [] if self.__stream__ else None
 
-        if not suffix:
+        doc = self.__fetch(url, entities)
+
+        if not doc:
             return False
 
-        if not date:
-            date = datetime.date.today().strftime('%Y-%m-%d')
+        return Mapper.searchResult(doc, entities)
 
-        # prepare url
-        url = self.__url__ + '/search/vat/' + suffix + '/' + parse(date).strftime('%Y-%m-%d')
+    def iterVATRegistry(self, nip, date=None):
+        """
+        Search data in VAT registry, yielding entities one by one as the response is received
 
-        # send request
-        res = self.__get(url)
+        :param nip: NIP number
+        :type nip: str
+        :param date: date in format 'yyyy-mm-dd' (None - current day)
+        :type date: str
+        :return: generator of VATEntity objects, check getLastErrorCode() after iteration
+        :rtype: generator
+        """
 
-        if not res:
-            self.__set(Error.CLI_CONNECT)
-            return False
+        return self.iterVATRegistryExt(Number.NIP, nip, date)
 
-        # parse response
-        doc = etree.parse(BytesIO(res))
+    def iterVATRegistryExt(self, type, number, date=None):
+        """
+        Search data in VAT registry, yielding entities one by one as the response is received
 
-        if not doc:
-            self.__set(Error.CLI_RESPONSE)
-            return False
+        Entities are mapped while the response is parsed and are not kept by the client, so only the entity
+        being processed is held in memory. Iteration ends early on error, in which case getLastErrorCode()
+        returns error code.
 
-        code = self.__get_text(doc, '/result/error/code/text()')
+        :param type: search number type as Number.xxx value
+        :type type: Number
+        :param number: search number value
+        :type number: str
+        :param date: date in format 'yyyy-mm-dd' (None - current day)
+        :type date: str
+        :return: generator of VATEntity objects, check getLastErrorCode() after iteration
+        :rtype: generator
+        """
 
-        if len(code) > 0:
-            self.__set(int(code), self.__get_text(doc, '/result/error/description/text()'))
-            return False
+        url = self._get_search_url(type, number, date)
 
-        sr = SearchResult()
+        if not url:
+            return
 
-        sr.uid = self.__get_text(doc, '/result/search/uid/text()')
+        # send request, it can be repeated only until first entity is returned
+        deadline = self._get_deadline()
+        attempt = 0
 
-        i = 1
         while True:
-            nip = self.__get_text(doc, '/result/search/entities/entity[' + str(i) + ']/nip/text()')
+            self._clear()
 
-            if len(nip) == 0:
-                break
+            res = self.__get(url, deadline, True)
+            yielded = False
 
-            ve = VATEntity()
+            if not res:
+                if not self.getLastErrorCode():
+                    self._set(Error.CLI_CONNECT)
+            else:
+                entities = Mapper.iterSearchResult(res.chunks(Mapper.CHUNK_SIZE) if res.stream else res.body,
+                                                   res.headers.get('content-encoding'))
+
+                try:
+                    while True:
+                        ve = next(entities)
+                        yielded = True
 
-            ve.name = self.__get_text(doc, '/result/search/entities/entity[' + str(i) + ']/name/text()')
-            ve.nip = nip
-            ve.regon = self.__get_text(doc, '/result/search/entities/entity[' + str(i) + ']/regon/text()')
-            ve.krs = self.__get_text(doc, '/result/search/entities/entity[' + str(i) + ']/krs/text()')
-            ve.residenceAddress = self.__get_text(doc, '/result/search/entities/entity[' + str(i) + ']/residenceAddress/text()')
-            ve.workingAddress = self.__get_text(doc, '/result/search/entities/entity[' + str(i) + ']/workingAddress/text()')
-            ve.vatStatus = self.__get_text(doc, '/result/search/entities/entity[' + str(i) + ']/vat/status/text()')
-            ve.vatResult = self.__get_text(doc, '/result/search/entities/entity[' + str(i) + ']/vat/result/text()')
+                        yield ve
+                except StopIteration as e:
+                    if self._check(e.value):
+                        return
+                except socket.timeout:
+                    self._set(Error.CLI_TIMEOUT)
+                except (OSError, http.client.HTTPException):
+                    self._set(Error.CLI_CONNECT)
+                finally:
+                    res.close()
 
-            self.__get_vat_person(doc, '/result/search/entities/entity[' + str(i) + ']/representatives', ve.representatives)
-            self.__get_vat_person(doc, '/result/search/entities/entity[' + str(i) + ']/authorizedClerks', ve.authorizedClerks)
-            self.__get_vat_person(doc, '/result/search/entities/entity[' + str(i) + ']/partners', ve.partners)
+            if yielded:
+                return
 
-            k = 1
-            while True:
-                iban = self.__get_text(doc, '/result/search/entities/entity[' + str(i) + ']/ibans/iban[' + str(k) + ']/text()')
+            delay = self._get_retry_delay(attempt, deadline)
 
-                if len(iban) == 0:
-                    break
+            if delay is None:
+                return
 
-                ve.ibans.append(iban)
-                k += 1
+            time.sleep(delay)
+            attempt += 1
 
-            ve.hasVirtualAccounts = True if self.__get_text(doc, '/result/search/entities/entity[' + str(i) + ']/hasVirtualAccounts/text()') == 'true' else False
-            ve.registrationLegalDate = self.__get_date(doc, '/result/search/entities/entity[' + str(i) + ']/registrationLegalDate/text()')
-            ve.registrationDenialDate = self.__get_date(doc, '/result/search/entities/entity[' + str(i) + ']/registrationDenialDate/text()')
-            ve.registrationDenialBasis = self.__get_text(doc, '/result/search/entities/entity[' + str(i) + ']/registrationDenialBasis/text()')
-            ve.restorationDate = self.__get_date(doc, '/result/search/entities/entity[' + str(i) + ']/restorationDate/text()')
-            ve.restorationBasis = self.__get_text(doc, '/result/search/entities/entity[' + str(i) + ']/restorationBasis/text()')
-            ve.removalDate = self.__get_date(doc, '/result/search/entities/entity[' + str(i) + ']/removalDate/text()')
-            ve.removalBasis = self.__get_text(doc, '/result/search/entities/entity[' + str(i) + ']/removalBasis/text()')
+    def searchVATRegistryTable(self, type, number, date=None):
+        """
+        Search data in VAT registry and return found entities as a columnar table
 
-            sr.results.append(ve)
-            i += 1
+        Rows are filled while the response is parsed, without creating VATEntity objects.
 
-        sr.id = self.__get_text(doc, '/result/search/id/text()')
-        sr.date = self.__get_date(doc, '/result/search/date/text()')
-        sr.source = self.__get_text(doc, '/result/search/source/text()')
+        :param type: search number type as Number.xxx value
+        :type type: Number
+        :param number: search number value
+        :type number: str
+        :param date: date in format 'yyyy-mm-dd' (None - current day)
+        :type date: str
+        :return: table of VATEntity attributes or False
+        :rtype: ResultTable or False
+        """
 
-        return sr
+        url = self._get_search_url(type, number, date)
+
+        if not url:
+            return False
+
+        # send request
+        table = self._search_table()
+
+        if not self.__fetch(url, table):
+            return False
+
+        return table
 
     def getAccountStatus(self):
         """
@@ -844,350 +490,422 @@ class NIP24Client:
         :rtype: AccountStatus or False
         """
 
-        # clear error
-        self.__clear()
+        return self._map(self.__fetch(self._get_url('/check/account/status')), Mapper.accountStatus)
 
-        # prepare url
-        url = self.__url__ + '/check/account/status'
+    def isActiveBatch(self, numbers, *, workers=10):
+        """
+        Check activity of many firms concurrently
 
-        # send request
-        res = self.__get(url)
+        :param numbers: iterable of (Number.xxx, number) pairs
+        :type numbers: iterable
+        :param workers: maximum number of concurrent requests
+        :type workers: int
+        :return: list of results in input order, each with True or False as value
+        :rtype: list of Result
+        """
 
-        if not res:
-            self.__set(Error.CLI_CONNECT)
-            return False
+        return self.__batch(self.isActiveExt, numbers, workers)
 
-        # parse response
-        doc = etree.parse(BytesIO(res))
+    def getInvoiceDataBatch(self, numbers, *, workers=10):
+        """
+        Get invoice data for many numbers concurrently
 
-        if not doc:
-            self.__set(Error.CLI_RESPONSE)
-            return False
+        :param numbers: iterable of (Number.xxx, number) pairs
+        :type numbers: iterable
+        :param workers: maximum number of concurrent requests
+        :type workers: int
+        :return: list of results in input order, each with InvoiceData object or False as value
+        :rtype: list of Result
+        """
 
-        code = self.__get_text(doc, '/result/error/code/text()')
+        return self.__batch(self.getInvoiceDataExt, numbers, workers)
 
-        if len(code) > 0:
-            self.__set(int(code), self.__get_text(doc, '/result/error/description/text()'))
-            return False
+    def getAllDataBatch(self, numbers, *, workers=10, fields=None):
+        """
+        Get all data for many numbers concurrently
 
-        status = AccountStatus()
+        :param numbers: iterable of (Number.xxx, number) pairs
+        :type numbers: iterable
+        :param workers: maximum number of concurrent requests
+        :type workers: int
+        :param fields: names of AllData attributes to map (None - all attributes)
+        :type fields: iterable of str
+        :return: list of results in input order, each with AllData object or False as value
+        :rtype: list of Result
+        :raises ValueError: if fields contain a name which is not an AllData attribute
+        """
 
-        status.uid = self.__get_text(doc, '/result/account/uid/text()')
-        status.type = self.__get_text(doc, '/result/account/type/text()')
-        status.validTo = self.__get_date_time(doc, '/result/account/validTo/text()')
-        status.billingPlanName = self.__get_text(doc, '/result/account/billingPlan/name/text()')
-        
-        status.subscriptionPrice = float('0' + self.__get_text(doc, '/result/account/billingPlan/subscriptionPrice/text()'))
-        status.itemPrice = float('0' + self.__get_text(doc, '/result/account/billingPlan/itemPrice/text()'))
-        status.itemPriceStatus = float('0' + self.__get_text(doc, '/result/account/billingPlan/itemPriceCheckStatus/text()'))
-        status.itemPriceInvoice = float('0' + self.__get_text(doc, '/result/account/billingPlan/itemPriceInvoiceData/text()'))
-        status.itemPriceAll = float('0' + self.__get_text(doc, '/result/account/billingPlan/itemPriceAllData/text()'))
-        status.itemPriceIBAN = float('0' + self.__get_text(doc, '/result/account/billingPlan/itemPriceIBANStatus/text()'))
-        status.itemPriceWhitelist = float('0' + self.__get_text(doc, '/result/account/billingPlan/itemPriceWLStatus/text()'))
-        status.itemPriceSearchVAT = float('0' + self.__get_text(doc, '/result/account/billingPlan/itemPriceSearchVAT/text()'))
-        
-        status.limit = int(self.__get_text(doc, '/result/account/billingPlan/limit/text()'))
-        status.requestDelay = int(self.__get_text(doc, '/result/account/billingPlan/requestDelay/text()'))
-        status.domainLimit = int(self.__get_text(doc, '/result/account/billingPlan/domainLimit/text()'))
+        return self.__batch(self.getAllDataExt, numbers, workers, True, fields)
 
-        status.overPlanAllowed = True if self.__get_text(doc, '/result/account/billingPlan/overplanAllowed/text()') == 'true' else False
-        status.terytCodes = True if self.__get_text(doc, '/result/account/billingPlan/terytCodes/text()') == 'true' else False
-        status.excelAddIn = True if self.__get_text(doc, '/result/account/billingPlan/excelAddin/text()') == 'true' else False
-        status.JPKVAT = True if self.__get_text(doc, '/result/account/billingPlan/jpkVat/text()') == 'true' else False
-        status.CLI = True if self.__get_text(doc, '/result/account/billingPlan/cli/text()') == 'true' else False
-        status.stats = True if self.__get_text(doc, '/result/account/billingPlan/stats/text()') == 'true' else False
-        status.nipMonitor = True if self.__get_text(doc, '/result/account/billingPlan/nipMonitor/text()') == 'true' else False
-        
-        status.searchByNIP = True if self.__get_text(doc, '/result/account/billingPlan/searchByNip/text()') == 'true' else False
-        status.searchByREGON = True if self.__get_text(doc, '/result/account/billingPlan/searchByRegon/text()') == 'true' else False
-        status.searchByKRS = True if self.__get_text(doc, '/result/account/billingPlan/searchByKrs/text()') == 'true' else False
-        
-        status.funcIsActive = True if self.__get_text(doc, '/result/account/billingPlan/funcIsActive/text()') == 'true' else False
-        status.funcGetInvoiceData = True if self.__get_text(doc, '/result/account/billingPlan/funcGetInvoiceData/text()') == 'true' else False
-        status.funcGetAllData = True if self.__get_text(doc, '/result/account/billingPlan/funcGetAllData/text()') == 'true' else False
-        status.funcGetVIESData = True if self.__get_text(doc, '/result/account/billingPlan/funcGetVIESData/text()') == 'true' else False
-        status.funcGetVATStatus = True if self.__get_text(doc, '/result/account/billingPlan/funcGetVATStatus/text()') == 'true' else False
-        status.funcGetIBANStatus = True if self.__get_text(doc, '/result/account/billingPlan/funcGetIBANStatus/text()') == 'true' else False
-        status.funcGetWhitelistStatus = True if self.__get_text(doc, '/result/account/billingPlan/funcGetWLStatus/text()') == 'true' else False
-        status.funcSearchVAT = True if self.__get_text(doc, '/result/account/billingPlan/funcSearchVAT/text()') == 'true' else False
-        
-        status.invoiceDataCount = int(self.__get_text(doc, '/result/account/requests/invoiceData/text()'))
-        status.allDataCount = int(self.__get_text(doc, '/result/account/requests/allData/text()'))
-        status.firmStatusCount = int(self.__get_text(doc, '/result/account/requests/firmStatus/text()'))
-        status.vatStatusCount = int(self.__get_text(doc, '/result/account/requests/vatStatus/text()'))
-        status.viesStatusCount = int(self.__get_text(doc, '/result/account/requests/viesStatus/text()'))
-        status.ibanStatusCount = int(self.__get_text(doc, '/result/account/requests/ibanStatus/text()'))
-        status.whitelistStatusCount = int(self.__get_text(doc, '/result/account/requests/wlStatus/text()'))
-        status.searchVATCount = int(self.__get_text(doc, '/result/account/requests/searchVAT/text()'))
-        status.totalCount = int(self.__get_text(doc, '/result/account/requests/total/text()'))
+    def getAllDataTable(self, numbers, *, workers=10, fields=None):
+        """
+        Get all data for many numbers concurrently as a columnar table
 
-        return status
+        Rows are filled directly from parsed responses, without creating AllData objects. Every response is
+        released as soon as its rows are added, only responses of up to 2 * workers items are kept at once.
 
-    def getLastErrorCode(self):
+        :param numbers: iterable of (Number.xxx, number) pairs
+        :type numbers: iterable
+        :param workers: maximum number of concurrent requests
+        :type workers: int
+        :param fields: names of AllData attributes to include as columns or lists (None - all attributes)
+        :type fields: iterable of str
+        :return: table with a row per input item in input order, columns code and error hold error info of items
+            whose other columns are left empty
+        :rtype: ResultTable
+        :raises ValueError: if fields contain a name which is not an AllData attribute
         """
-        Get last error code
 
-        :return: error code
-        :rtype: int
+        table = self._all_data_table(fields)
+
+        self.__batch_table(table, numbers, workers)
+
+        return table
+
+    def getVIESDataBatch(self, euvats, *, workers=10):
+        """
+        Get VIES data for many numbers concurrently
+
+        :param euvats: iterable of EU VAT numbers with 2-letter country prefix
+        :type euvats: iterable
+        :param workers: maximum number of concurrent requests
+        :type workers: int
+        :return: list of results in input order, each with VIESData object or False as value
+        :rtype: list of Result
         """
 
-        return self.__errcode__
+        return self.__batch(lambda type, number: self.getVIESData(number), ((Number.EUVAT, euvat) for euvat in euvats), workers)
 
-    def getLastError(self):
+    def getVATStatusBatch(self, numbers, *, workers=10):
         """
-        Get last error message
+        Check VAT status of many firms concurrently
 
-        :return: unicode string
-        :rtype: str
+        :param numbers: iterable of (Number.xxx, number) pairs
+        :type numbers: iterable
+        :param workers: maximum number of concurrent requests
+        :type workers: int
+        :return: list of results in input order, each with VATStatus object or False as value
+        :rtype: list of Result
         """
 
-        return self.__err__
+        return self.__batch(self.getVATStatusExt, numbers, workers)
 
-    def __clear(self):
+    def getIBANStatusBatch(self, numbers, date=None, *, workers=10):
         """
-        Clear error info
+        Check bank accounts of many firms concurrently
+
+        :param numbers: iterable of (Number.xxx, number, iban) tuples
+        :type numbers: iterable
+        :param date: date in format 'yyyy-mm-dd' (None - current day)
+        :type date: str
+        :param workers: maximum number of concurrent requests
+        :type workers: int
+        :return: list of results in input order, each with IBANStatus object or False as value
+        :rtype: list of Result
         """
 
-        self.__errcode__ = 0
-        self.__err__ = ''
+        return self.__batch(self.getIBANStatusExt, numbers, workers, date)
 
-    def __set(self, code, err=None):
+    def getWhitelistStatusBatch(self, numbers, date=None, *, workers=10):
         """
-        Set error info
-        :param code: error code
-        :type code: int
-        :param err: error message
-        :type err: str
+        Check bank accounts and VAT status of many firms using whitelist file concurrently
+
+        :param numbers: iterable of (Number.xxx, number, iban) tuples
+        :type numbers: iterable
+        :param date: date in format 'yyyy-mm-dd' (None - current day)
+        :type date: str
+        :param workers: maximum number of concurrent requests
+        :type workers: int
+        :return: list of results in input order, each with WLStatus object or False as value
+        :rtype: list of Result
         """
 
-        self.__errcode__ = code
-        self.__err__ = err if err else Error.message(code)
+        return self.__batch(self.getWhitelistStatusExt, numbers, workers, date)
 
-    def __auth(self, method, url):
+    def searchVATRegistryBatch(self, numbers, date=None, *, workers=10):
         """
-        Prepare authorization header content
+        Search data in VAT registry for many numbers concurrently
 
-        :param method: HTTP method
-        :type method: str
-        :param url: target URL
-        :type url: str
-        :returns: authorization header content or False
-        :rtype: str or False
+        :param numbers: iterable of (Number.xxx, number) pairs
+        :type numbers: iterable
+        :param date: date in format 'yyyy-mm-dd' (None - current day)
+        :type date: str
+        :param workers: maximum number of concurrent requests
+        :type workers: int
+        :return: list of results in input order, each with SearchResult object or False as value
+        :rtype: list of Result
         """
 
-        # parse url
-        u = urllib.parse.urlparse(url)
-        ls = u.netloc.split(':')
+        return self.__batch(self.searchVATRegistryExt, numbers, workers, date)
 
-        host = ls[0]
-        port = 443 if u.scheme == 'https' else 80
+    def call(self, method, *args, **kwargs):
+        """
+        Call client method and return its result together with error info
 
-        if len(ls) > 1:
-            port = ls[1]
+        :param method: bound client method, e.g. client.getAllDataExt
+        :type method: callable
+        :param args: method arguments
+        :param kwargs: method keyword arguments
+        :return: call result
+        :rtype: Result
+        """
 
-        # prepare auth header value
-        nonce = os.urandom(4).hex()
-        ts = int(time.time())
+        start = time.perf_counter()
+        value = method(*args, **kwargs)
 
-        s = '' + str(ts) + '\n' \
-            + nonce + '\n' \
-            + method + '\n' \
-            + u.path + '\n' \
-            + host + '\n' \
-            + str(port) + '\n' \
-            + '\n'
+        return Result(value, self.getLastErrorCode(), self.getLastError(), time.perf_counter() - start)
 
-        mac = base64.b64encode(hmac.new(self.__key__.encode(), s.encode(), self.HMAC_ALG).digest()).decode()
+    def callRaw(self, method, *args, **kwargs):
+        """
+        Call client method and return service response XML instead of model object together with error info
 
-        return 'MAC id="' + self.__id__ + '", ts="' + str(ts) + '", nonce="' + nonce + '", mac="' + mac + '"'
+        The request is validated, sent, retried and shared with concurrent identical calls as by the method
+        itself, only the response is not mapped. Supported are methods returning single result, e.g. isActiveExt,
+        getAllDataExt, searchVATRegistryExt or getAccountStatus.
 
-    def __user_agent(self):
+        :param method: bound client method, e.g. client.getAllDataExt
+        :type method: callable
+        :param args: method arguments
+        :param kwargs: method keyword arguments
+        :return: call result with response XML as received (decompressed) or False as value, in streaming mode the
+            XML is serialized from the parsed response
+        :rtype: Result
         """
-        Prepare user agent information header content
 
-        :return: user agent header content
-        :rtype: str
+        start = time.perf_counter()
+        previous = self._begin_raw()
+
+        try:
+            return self._raw_result(method(*args, **kwargs), start, True)
+        finally:
+            self._end_raw(previous)
+
+    def callElement(self, method, *args, **kwargs):
         """
+        Call client method and return root element of service response instead of model object together with error
+        info
 
-        return 'NIP24Client/' + self.VERSION + ' Python/' + str(sys.version_info[0]) + '.' + str(sys.version_info[1]) \
-            + '.' + str(sys.version_info[2])
+        Same as callRaw(), but the parsed response is returned. It may be shared with concurrent identical calls
+        and must not be modified.
 
-    def __get(self, url):
+        :param method: bound client method, e.g. client.getAllDataExt
+        :type method: callable
+        :param args: method arguments
+        :param kwargs: method keyword arguments
+        :return: call result with response root element or False as value
+        :rtype: Result
         """
-        Get result of HTTP GET request
 
-        :param url: target URL
-        :type url: str
-        :returns: result content or False
-        :rtype: bytearray or False
+        start = time.perf_counter()
+        previous = self._begin_raw()
+
+        try:
+            return self._raw_result(method(*args, **kwargs), start, False)
+        finally:
+            self._end_raw(previous)
+
+    def __get_all_data(self, type, number):
         """
+        Get all data response document
 
-        # auth
-        auth = self.__auth('GET', url)
+        :param type: search number type as Number.xxx value
+        :type type: Number
+        :param number: search number value
+        :type number: str
+        :return: etree document or False
+        :rtype: tree or False
+        """
 
-        if not auth:
-            return False
+        url = self._get_url('/get/all/', type, number)
 
-        # send request
-        try:
-            req = urllib.request.Request(url)
-            req.add_header('Accept', 'application/xml')
-            req.add_header('Authorization', auth)
-            req.add_header('User-Agent', self.__user_agent())
-
-            res = urllib.request.urlopen(req)
-            content = res.read()
-        except urllib.error.URLError as ue:
-            # print ue.code
+        if not url:
             return False
 
-        return content
+        return self.__fetch(url) or False
 
-    def __get_text(self, doc, xpath):
+    def __fetch(self, url, entities=None):
         """
-        Get XML element as text
+        Send request and parse response, sharing the request with concurrent identical calls
 
-        :param doc: etree document
-        :type doc: tree
-        :param xpath: xpath string
-        :type xpath: string
-        :return: string
-        :rtype: str
+        :param url: target URL
+        :type url: str
+        :param entities: list or table receiving entities mapped while parsing search result (None - do not map
+            entities)
+        :type entities: list of VATEntity or ResultTable
+        :return: etree document or None
+        :rtype: tree or None
         """
 
-        s = doc.xpath(xpath)
+        raw = self._get_raw()
+        body = None
 
-        if not s:
-            return ''
+        if raw is not None:
+            # callRaw() gets the whole document and the received content
+            entities = None
+            body = []
 
-        if len(s) != 1:
-            return ''
+        deadline = self._get_deadline()
 
-        return str(s[0].strip())
+        if not self.__flight__ or entities is not None:
+            # entities are removed from the document while parsing, so it cannot be shared
+            doc = self.__request(url, deadline, entities, body)
+        else:
+            def request():
+                doc = self.__request(url, deadline, body=body)
+                return doc, body, self.getLastErrorCode(), self.getLastError()
+
+            try:
+                # content is kept only for callRaw() calls, so they are shared only with each other
+                doc, body, code, err = self.__flight__.do(url if body is None else (url, 'raw'), request, deadline)
+            except TimeoutError:
+                doc, body, code, err = None, None, Error.CLI_TIMEOUT, None
+
+            if code:
+                self._set(code, err)
+            else:
+                self._clear()
 
-    def __get_date_time(self, doc, xpath):
+        if raw is not None:
+            # response is returned by callRaw(), calling method ends without mapping it
+            self._add_raw(raw, doc, body)
+            return None
+
+        return doc
+
+    def __request(self, url, deadline, entities=None, body=None):
         """
-        Get XML element as date time object
+        Send request and parse response, retrying transient errors
 
-        :param doc: etree document
-        :type doc: tree
-        :param xpath: xpath string
-        :type xpath: string
-        :return: datetime
-        :rtype: datetime or None
+        :param url: target URL
+        :type url: str
+        :param deadline: call deadline as time.monotonic() value or None
+        :type deadline: float
+        :param entities: list or table receiving entities mapped while parsing search result (None - do not map
+            entities)
+        :type entities: list of VATEntity or ResultTable
+        :param body: list receiving decompressed response content (None - content is not kept)
+        :type body: list of bytes
+        :return: etree document or None
+        :rtype: tree or None
         """
 
-        s = self.__get_text(doc, xpath)
+        attempt = 0
 
-        if len(s) == 0:
-            return None
+        while True:
+            self._clear()
+
+            doc = self._parse(self.__get(url, deadline), entities, body)
+
+            if doc:
+                return doc
+
+            delay = self._get_retry_delay(attempt, deadline)
 
-        return parse(s)
+            if delay is None:
+                return None
 
-    def __get_date(self, doc, xpath):
+            time.sleep(delay)
+            attempt += 1
+
+    def __get(self, url, deadline=None, stream=False):
         """
-        Get XML element as date object
+        Get result of HTTP GET request
 
-        :param doc: etree document
-        :type doc: tree
-        :param xpath: xpath string
-        :type xpath: string
-        :return: datetime
-        :rtype: datetime or None
+        :param url: target URL
+        :type url: str
+        :param deadline: call deadline as time.monotonic() value or None
+        :type deadline: float
+        :param stream: True to return response before its body is read, regardless of streaming mode
+        :type stream: bool
+        :returns: HTTP response or False
+        :rtype: Response or False
         """
 
-        s = self.__get_text(doc, xpath)
+        request = self._prepare_get(url, deadline)
 
-        sl = len(s)
+        if not request:
+            return False
 
-        if sl == 0:
-            return None
-        elif sl == 11:
-            # dateutil does not support xsd:date type in form YYYY-MM-DDZ
-            s = s[0:10] + 'T00:00:00Z'
-        elif sl == 16:
-            # dateutil does not support xsd:date type in form YYYY-MM-DD+00:00
-            s = s[0:10] + 'T00:00:00' + s[10:]
+        headers, wait, timeouts = request
+
+        if wait > 0:
+            time.sleep(wait)
+
+        # send request
+        send = self.__transport__.stream if self.__stream__ or stream else self.__transport__.send
 
-        return parse(s)
+        try:
+            res = send('GET', url, headers, *timeouts, deadline=deadline)
+        except socket.timeout:
+            self._set(Error.CLI_TIMEOUT)
+            return False
+        except (OSError, http.client.HTTPException):
+            return False
 
-    def __get_vat_person(self, doc, xpath, list):
+        return self._check_response(res)
+
+    def __batch(self, method, items, workers, *args):
         """
-        Get element content as VAT person object
+        Call method for every unique item using thread pool
 
-        :param doc: etree document
-        :type doc: tree
-        :param xpath: xpath string
-        :type xpath: string
-        :param list: persons array
-        :type list: list of VATPerson
-        :return:
+        :param method: bound client method
+        :type method: callable
+        :param items: iterable of method arguments tuples
+        :type items: iterable
+        :param workers: maximum number of concurrent requests
+        :type workers: int
+        :param args: additional arguments common to all calls
+        :return: list of results in input order
+        :rtype: list of Result
         """
 
-        i = 1
-        while True:
-            nip = self.__get_text(doc, xpath + '/person[' + str(i) + ']/nip/text()')
+        keys, unique, results = self._prepare_batch(items)
 
-            if len(nip) == 0:
-                break
+        if unique:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, min(workers, len(unique)))) as executor:
+                futures = dict((key, executor.submit(self.call, method, *(item + args))) for key, item in unique.items())
 
-            vp = VATPerson()
+            for key, future in futures.items():
+                results[key] = future.result()
 
-            vp.nip = nip
-            vp.companyName = self.__get_text(doc, xpath + '/person[' + str(i) + ']/companyName/text()')
-            vp.firstName = self.__get_text(doc, xpath + '/person[' + str(i) + ']/firstName/text()')
-            vp.lastName = self.__get_text(doc, xpath + '/person[' + str(i) + ']/lastName/text()')
+        return [results[key] for key in keys]
 
-            list.append(vp)
-            i += 1
+    def __batch_table(self, table, items, workers):
+        """
+        Get all data for every unique item using thread pool and add rows to the table in input order
 
-    def __get_path_suffix(self, type, number):
+        :param table: table receiving rows
+        :type table: ResultTable
+        :param items: iterable of (Number.xxx, number) pairs
+        :type items: iterable
+        :param workers: maximum number of concurrent requests
+        :type workers: int
         """
-        Get path suffix
 
-        :param type: search number type as Number.xxx value
-        :type type: Number
-        :param number: search number value
-        :type number: str
-        :return: path suffix
-        :rtype: string or False
-        """
-
-        if type == Number.NIP:
-            if not NIP.isValid(number):
-                self.__set(Error.CLI_NIP)
-                return False
-
-            path = 'nip/' + NIP.normalize(number)
-        elif type == Number.REGON:
-            if not REGON.isValid(number):
-                self.__set(Error.CLI_REGON)
-                return False
-
-            path = 'regon/' + REGON.normalize(number)
-        elif type == Number.KRS:
-            if not KRS.isValid(number):
-                self.__set(Error.CLI_KRS)
-                return False
-
-            path = 'krs/' + KRS.normalize(number)
-        elif type == Number.EUVAT:
-            if not EUVAT.isValid(number):
-                self.__set(Error.CLI_EUVAT)
-                return False
-
-            path = 'euvat/' + EUVAT.normalize(number)
-        elif type == Number.IBAN:
-            if not IBAN.isValid(number):
-                number = 'PL' + number
-
-                if not IBAN.isValid(number):
-                    self.__set(Error.CLI_IBAN)
-                    return False
-
-            path = 'iban/' + IBAN.normalize(number)
-        else:
-            self.__set(Error.CLI_NUMBER)
-            return False
+        keys, unique, results = self._prepare_batch(items)
+
+        # row of last occurrence of every item, its response is released after adding it
+        last = dict((key, i) for i, key in enumerate(keys))
+        pending = {}
+        queue = iter(unique.items())
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, min(workers, len(unique)))) as executor:
+            for i, key in enumerate(keys):
+                result = results.get(key)
+
+                if result is None:
+                    # requests are sent ahead of the row being added, but not more than 2 * workers
+                    while key not in pending or len(pending) < 2 * workers:
+                        entry = next(queue, None)
+
+                        if not entry:
+                            break
+
+                        pending[entry[0]] = executor.submit(self.call, self.__get_all_data, *entry[1])
+
+                    result = pending[key].result()
+
+                    if last[key] == i:
+                        del pending[key]
 
-        return path
+                self._add_row(table, result)
@@ -26,6 +26,8 @@ class PKD:
     PKD data
     """
 
+    __slots__ = ('code', 'description', 'primary', 'version')
+
     def __init__(self):
         self.code = None
         self.description = None
@@ -0,0 +1,119 @@
+#
+# -*- coding: utf-8 -*-
+#
+# Copyright 2015-2025 NETCAT (www.netcat.pl)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# @author NETCAT <firma@netcat.pl>
+# @copyright 2015-2025 NETCAT (www.netcat.pl)
+# @license http://www.apache.org/licenses/LICENSE-2.0
+#
+
+
+import threading
+import time
+
+
+class RateLimiter:
+    """
+    Client side request rate limiter
+    """
+
+    def __init__(self, delay=0.0, burst=1, quota=None):
+        """
+        Construct new rate limiter
+
+        :param delay: minimal average interval between requests in seconds
+        :type delay: float
+        :param burst: number of requests that may be sent at once without waiting
+        :type burst: int
+        :param quota: number of requests allowed in total (None - unlimited)
+        :type quota: int
+        """
+
+        self.delay = delay
+        self.burst = max(1, burst)
+        self.quota = quota
+
+        self.__lock__ = threading.Lock()
+        self.__tat__ = 0.0
+        self.__count__ = 0
+
+    @staticmethod
+    def fromAccountStatus(status, burst=1):
+        """
+        Create rate limiter matching account's billing plan
+
+        :param status: account status
+        :type status: AccountStatus
+        :param burst: number of requests that may be sent at once without waiting
+        :type burst: int
+        :return: rate limiter object
+        :rtype: RateLimiter
+        """
+
+        quota = None
+
+        if status.limit and not status.overPlanAllowed:
+            quota = max(0, status.limit - (status.totalCount or 0))
+
+        return RateLimiter(float(status.requestDelay or 0), burst, quota)
+
+    def reserve(self):
+        """
+        Reserve time slot for the next request
+
+        :return: number of seconds to wait before sending request or None if quota is exhausted
+        :rtype: float or None
+        """
+
+        with self.__lock__:
+            if self.quota is not None and self.__count__ >= self.quota:
+                return None
+
+            self.__count__ += 1
+
+            # generic cell rate algorithm
+            now = time.monotonic()
+            tat = max(self.__tat__, now)
+            self.__tat__ = tat + self.delay
+
+            return max(0.0, tat - (self.burst - 1) * self.delay - now)
+
+    def cancel(self):
+        """
+        Give back time slot and quota of the last reservation whose request is not going to be sent
+        """
+
+        with self.__lock__:
+            self.__count__ = max(0, self.__count__ - 1)
+            self.__tat__ -= self.delay
+
+    def acquire(self):
+        """
+        Wait until the next request may be sent
+
+        :return: False if quota is exhausted
+        :rtype: bool
+        """
+
+        wait = self.reserve()
+
+        if wait is None:
+            return False
+
+        if wait > 0:
+            time.sleep(wait)
+
+        return True
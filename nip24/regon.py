@@ -20,6 +20,7 @@
 # @license http://www.apache.org/licenses/LICENSE-2.0
 #
 
+import operator
 import re
 
 
@@ -28,6 +29,16 @@ class REGON:
     REGON number validator
     """
 
+    __pattern__ = re.compile('[0-9]{9,14}')
+
+    # checksum weights of 9 and 14 digit numbers and sums of weights times ord('0'), checked digits are summed
+    # as character codes
+    __weights9__ = (8, 9, 2, 3, 4, 5, 6, 7)
+    __offset9__ = 48 * sum(__weights9__)
+
+    __weights14__ = (2, 4, 8, 5, 0, 9, 7, 3, 6, 1, 2, 4, 8)
+    __offset14__ = 48 * sum(__weights14__)
+
     @staticmethod
     def normalize(regon):
         """
@@ -44,7 +55,7 @@ class REGON:
 
         regon = regon.strip()
 
-        if not re.match('[0-9]{9,14}', regon):
+        if not REGON.__pattern__.match(regon):
             return False
 
         if len(regon) != 9 and len(regon) != 14:
@@ -69,63 +80,51 @@ class REGON:
             return False
 
         if len(regon) == 9:
-            return REGON.__isValidR9(regon)
+            return REGON.__isValidR9(regon.encode('ascii'))
         else:
-            if not REGON.__isValidR9(regon[0:9]):
+            # only first 9 characters are known to be digits
+            if not regon.isascii() or not regon.isdigit():
                 return False
 
-            return REGON.__isValidR14(regon)
+            digits = regon.encode('ascii')
+
+            if not REGON.__isValidR9(digits):
+                return False
+
+            return REGON.__isValidR14(digits)
 
     @staticmethod
-    def __isValidR9(regon):
+    def __isValidR9(digits):
         """
         Check 9-digit REGON number
 
-        :param regon: input string
-        :type regon: str
+        :param digits: ASCII digits
+        :type digits: bytes
         :returns: True if NIP is valid
         :rtype: bool
         """
 
-        w = [8, 9, 2, 3, 4, 5, 6, 7]
-        sum = 0
-
-        for i in range(0, len(w)):
-            sum += int(regon[i]) * w[i]
+        checksum = (sum(map(operator.mul, REGON.__weights9__, digits)) - REGON.__offset9__) % 11
 
-        sum %= 11
+        if checksum == 10:
+            checksum = 0
 
-        if (sum == 10):
-            sum = 0
-
-        if sum != int(regon[8]):
-            return False
-
-        return True
+        return checksum == digits[8] - 48
 
     @staticmethod
-    def __isValidR14(regon):
+    def __isValidR14(digits):
         """
         Check 14-digit REGON number
 
-        :param regon: input string
-        :type regon: str
+        :param digits: ASCII digits
+        :type digits: bytes
         :returns: True if NIP is valid
         :rtype: bool
         """
 
-        w = [2, 4, 8, 5, 0, 9, 7, 3, 6, 1, 2, 4, 8]
-        sum = 0
+        checksum = (sum(map(operator.mul, REGON.__weights14__, digits)) - REGON.__offset14__) % 11
 
-        for i in range(0, len(w)):
-            sum += int(regon[i]) * w[i]
-
-        sum %= 11
-
-        if (sum == 10):
-            sum = 0
-
-        if sum != int(regon[13]):
-            return False
+        if checksum == 10:
+            checksum = 0
 
-        return True
+        return checksum == digits[13] - 48
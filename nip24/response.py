@@ -0,0 +1,92 @@
+#
+# -*- coding: utf-8 -*-
+#
+# Copyright 2015-2025 NETCAT (www.netcat.pl)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# @author NETCAT <firma@netcat.pl>
+# @copyright 2015-2025 NETCAT (www.netcat.pl)
+# @license http://www.apache.org/licenses/LICENSE-2.0
+#
+
+
+
+class Response:
+    """
+    HTTP response
+    """
+
+    def __init__(self, status=200, headers=None, body=b'', stream=None, release=None):
+        """
+        Construct new response object
+
+        :param status: HTTP status code
+        :type status: int
+        :param headers: response headers with lowercase names
+        :type headers: dict
+        :param body: response body, empty if body is streamed
+        :type body: bytes
+        :param stream: unread response body as file-like object or None
+        :type stream: object
+        :param release: function called once when streamed response is closed
+        :type release: callable
+        """
+
+        self.status = status
+        self.headers = headers if headers is not None else {}
+        self.body = body
+        self.stream = stream
+
+        self.__release__ = release
+
+    def chunks(self, size=16384):
+        """
+        Iterate over response body, reading streamed body as it arrives
+
+        :param size: maximum chunk size in bytes
+        :type size: int
+        :return: body chunks
+        :rtype: generator of bytes
+        """
+
+        if not self.stream:
+            for i in range(0, len(self.body), size):
+                yield self.body[i:i + size]
+
+            return
+
+        while True:
+            data = self.stream.read(size)
+
+            if not data:
+                return
+
+            yield data
+
+    def close(self):
+        """
+        Release streamed response resources
+        """
+
+        release = self.__release__
+        self.__release__ = None
+
+        if release:
+            release()
+
+    def __str__(self):
+        return 'Response: [status = ' + str(self.status) \
+            + ', headers = ' + str(self.headers) \
+            + ', body = ' + ('stream' if self.stream else str(len(self.body)) + ' bytes') \
+            + ']'
@@ -0,0 +1,51 @@
+#
+# -*- coding: utf-8 -*-
+#
+# Copyright 2015-2025 NETCAT (www.netcat.pl)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# @author NETCAT <firma@netcat.pl>
+# @copyright 2015-2025 NETCAT (www.netcat.pl)
+# @license http://www.apache.org/licenses/LICENSE-2.0
+#
+
+
+
+class Result:
+    """
+    Single call result
+    """
+
+    def __init__(self, value=None, code=0, error='', time=0.0):
+        self.value = value
+        self.code = code
+        self.error = error
+        self.time = time
+
+    def isSuccess(self):
+        """
+        Check if call finished without error
+
+        :return: True if call was successful
+        :rtype: bool
+        """
+
+        return self.code == 0
+
+    def __str__(self):
+        return 'Result: [value = ' + str(self.value) \
+            + ', code = ' + str(self.code) \
+            + ', error = ' + str(self.error) \
+            + ', time = ' + str(self.time) \
+            + ']'
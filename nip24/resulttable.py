@@ -0,0 +1,503 @@
+#
+# -*- coding: utf-8 -*-
+#
+# Copyright 2015-2025 NETCAT (www.netcat.pl)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# @author NETCAT <firma@netcat.pl>
+# @copyright 2015-2025 NETCAT (www.netcat.pl)
+# @license http://www.apache.org/licenses/LICENSE-2.0
+#
+
+
+import array
+import csv
+import datetime
+import json
+import operator
+
+from nip24 import Mapper
+
+
+class ResultTable:
+    """
+    Columnar table of mapped results
+
+    Every attribute is stored in its own array, values of low-cardinality ('pooled') fields are dictionary
+    encoded and nested lists are stored as child tables with offset arrays. Slicing returns a view sharing
+    the arrays of the table.
+    """
+
+    def __init__(self, fields, lists=None, columns=None):
+        """
+        Construct new empty table
+
+        :param fields: attribute name and value type by child element tag, dict value for nested elements
+            (e.g. Mapper.ALL_DATA_FIELDS)
+        :type fields: dict
+        :param lists: nested lists by attribute name: container element tag, item element tag, item fields
+            (None - item element text is the value) and item key attribute, the list ends at the first item
+            without it (e.g. Mapper.ALL_DATA_LISTS)
+        :type lists: dict
+        :param columns: additional columns set by append() arguments as (attribute name, value type) pairs
+        :type columns: list
+        """
+
+        self.__names__ = []
+        self.__types__ = []
+        self.__converters__ = Mapper.resolve(self.__add_fields(fields))
+
+        for name, type in columns or []:
+            self.__add_column(name, type)
+
+        self.__index__ = dict((name, i) for i, name in enumerate(self.__names__))
+        self.__defaults__ = [Mapper.convert('', type) for type in self.__types__]
+
+        # arrays of values or dictionary codes and dictionaries of encoded columns
+        self.__values__ = [array.array('I') if type == 'pooled' else [] for type in self.__types__]
+        self.__dicts__ = [([], {}) if type == 'pooled' else None for type in self.__types__]
+
+        # child tables and offsets of rows of nested lists
+        self.__lists__ = {}
+        self.__containers__ = {}
+
+        for name, (container, tag, item_fields, key) in (lists or {}).items():
+            if item_fields is None:
+                child = ResultTable({}, columns=[('value', 'text')])
+                key = 'value'
+            else:
+                child = ResultTable(item_fields)
+
+            self.__lists__[name] = (tag, child, child.__index__[key], item_fields is None, array.array('L', [0]))
+            self.__containers__[container] = name
+
+        self.__count__ = 0
+        self.__start__ = 0
+        self.__stop__ = None
+
+    def append(self, element, **values):
+        """
+        Map element to a new row
+
+        :param element: parent element of fields (e.g. /result/firm element) or None to add a row of default values
+        :type element: etree.Element
+        :param values: values of additional columns by attribute name
+        """
+
+        row = self.__row(element)
+
+        for name, value in values.items():
+            row[self.__index__[name]] = value
+
+        self.__add(row)
+
+    def clear(self):
+        """
+        Remove all rows
+        """
+
+        if self.__stop__ is not None:
+            raise ValueError('Table view cannot be modified')
+
+        for i, values in enumerate(self.__values__):
+            del values[:]
+
+            if self.__dicts__[i]:
+                self.__dicts__[i] = ([], {})
+
+        for tag, child, key, text, offsets in self.__lists__.values():
+            child.clear()
+            del offsets[1:]
+
+        self.__count__ = 0
+
+    def getColumnNames(self):
+        """
+        Get names of scalar columns
+
+        :return: attribute names
+        :rtype: list of str
+        """
+
+        return list(self.__names__)
+
+    def getListNames(self):
+        """
+        Get names of nested lists
+
+        :return: attribute names
+        :rtype: list of str
+        """
+
+        return list(self.__lists__.keys())
+
+    def getColumn(self, name):
+        """
+        Get decoded values of column
+
+        :param name: attribute name
+        :type name: str
+        :return: column values
+        :rtype: list
+        """
+
+        start, stop = self.__bounds()
+        i = self.__index__[name]
+
+        if self.__dicts__[i]:
+            dictionary = self.__dicts__[i][0]
+
+            return [dictionary[code] for code in self.__values__[i][start:stop]]
+
+        return self.__values__[i][start:stop]
+
+    def getList(self, name):
+        """
+        Get child table of nested list items of all rows
+
+        :param name: list attribute name
+        :type name: str
+        :return: view of child table
+        :rtype: ResultTable
+        """
+
+        start, stop = self.__bounds()
+        tag, child, key, text, offsets = self.__lists__[name]
+
+        return child.__view(offsets[start], offsets[stop])
+
+    def getOffsets(self, name):
+        """
+        Get offsets of nested list items in child table returned by getList(), row i items are
+        offsets[i]:offsets[i + 1]
+
+        :param name: list attribute name
+        :type name: str
+        :return: len(table) + 1 offsets
+        :rtype: list of int
+        """
+
+        start, stop = self.__bounds()
+        offsets = self.__lists__[name][4]
+
+        return [offset - offsets[start] for offset in offsets[start:stop + 1]]
+
+    def toCSV(self, file):
+        """
+        Write scalar columns as CSV with header row, nested lists are not exported
+
+        :param file: text file opened with newline=''
+        :type file: file
+        """
+
+        writer = csv.writer(file)
+        writer.writerow(self.__names__)
+
+        columns = [self.getColumn(name) for name in self.__names__]
+
+        for row in zip(*columns):
+            writer.writerow([ResultTable.__format(value) for value in row])
+
+    def toNDJSON(self, file):
+        """
+        Write rows as newline delimited JSON objects including nested lists
+
+        :param file: text file
+        :type file: file
+        """
+
+        for row in self:
+            file.write(json.dumps(row, ensure_ascii=False, default=ResultTable.__format) + '\n')
+
+    def toArrow(self):
+        """
+        Convert table to Apache Arrow table, encoded columns become dictionary arrays and nested lists
+        list arrays, requires pyarrow package
+
+        :return: Arrow table
+        :rtype: pyarrow.Table
+        """
+
+        import pyarrow
+
+        names, arrays = self.__arrow(pyarrow)
+
+        return pyarrow.Table.from_arrays(arrays, names)
+
+    def __len__(self):
+        start, stop = self.__bounds()
+
+        return stop - start
+
+    def __iter__(self):
+        start, stop = self.__bounds()
+
+        for i in range(start, stop):
+            yield self.__get(i)
+
+    def __getitem__(self, key):
+        start, stop = self.__bounds()
+
+        if isinstance(key, slice):
+            first, last, step = key.indices(stop - start)
+
+            if step != 1:
+                raise ValueError('Table slice step must be 1')
+
+            return self.__view(start + first, start + max(first, last))
+
+        if key < 0:
+            key += stop - start
+
+        if key < 0 or key >= stop - start:
+            raise IndexError('Table row index out of range')
+
+        return self.__get(start + key)
+
+    def __str__(self):
+        return 'ResultTable: [rows = ' + str(len(self)) \
+            + ', columns = ' + str(self.__names__) \
+            + ', lists = ' + str(self.getListNames()) \
+            + ']'
+
+    def __add_fields(self, fields):
+        """
+        Add columns of field table
+
+        :param fields: attribute name and value type by child element tag, dict value for nested elements
+        :type fields: dict
+        :return: column index and value type by child element tag, dict value for nested elements
+        :rtype: dict
+        """
+
+        tags = {}
+
+        for tag, field in fields.items():
+            if isinstance(field, dict):
+                tags[tag] = self.__add_fields(field)
+            else:
+                tags[tag] = (self.__add_column(field[0], field[1]), field[1])
+
+        return tags
+
+    def __add_column(self, name, type):
+        """
+        Add column
+
+        :param name: attribute name
+        :type name: str
+        :param type: value type
+        :type type: str
+        :return: column index
+        :rtype: int
+        """
+
+        self.__names__.append(name)
+        self.__types__.append(type)
+
+        return len(self.__names__) - 1
+
+    def __row(self, element):
+        """
+        Map element to list of column values, items of nested lists are added to child tables
+
+        :param element: parent element of fields or None
+        :type element: etree.Element
+        :return: column values
+        :rtype: list
+        """
+
+        row = list(self.__defaults__)
+
+        if element is not None:
+            Mapper.walkConverters(element, self.__converters__, row, operator.setitem)
+
+            for container, name in self.__containers__.items():
+                items = next(element.iterchildren(container), None)
+
+                if items is not None:
+                    self.__add_items(items, name)
+
+        for tag, child, key, text, offsets in self.__lists__.values():
+            offsets.append(child.__count__)
+
+        return row
+
+    def __add_items(self, container, name):
+        """
+        Add items of nested list to child table
+
+        :param container: container element of items
+        :type container: etree.Element
+        :param name: list attribute name
+        :type name: str
+        """
+
+        tag, child, key, text, offsets = self.__lists__[name]
+
+        for item in container.iterchildren(tag):
+            if text:
+                row = [Mapper.convert(item.text, 'text')]
+            else:
+                row = child.__row(item)
+
+            if len(row[key]) == 0:
+                break
+
+            child.__add(row)
+
+    def __add(self, row):
+        """
+        Add row of column values
+
+        :param row: column values
+        :type row: list
+        """
+
+        if self.__stop__ is not None:
+            raise ValueError('Table view cannot be modified')
+
+        for i, value in enumerate(row):
+            encoded = self.__dicts__[i]
+
+            if encoded:
+                dictionary, codes = encoded
+                code = codes.get(value)
+
+                if code is None:
+                    code = len(dictionary)
+                    dictionary.append(value)
+                    codes[value] = code
+
+                value = code
+
+            self.__values__[i].append(value)
+
+        self.__count__ += 1
+
+    def __bounds(self):
+        """
+        Get rows range of table or view
+
+        :return: first row and row after last one
+        :rtype: tuple
+        """
+
+        return self.__start__, self.__count__ if self.__stop__ is None else self.__stop__
+
+    def __view(self, start, stop):
+        """
+        Create view of rows range sharing arrays with the table
+
+        :param start: first row
+        :type start: int
+        :param stop: row after last one
+        :type stop: int
+        :return: table view
+        :rtype: ResultTable
+        """
+
+        view = object.__new__(ResultTable)
+        view.__dict__.update(self.__dict__)
+
+        view.__start__ = start
+        view.__stop__ = stop
+
+        return view
+
+    def __get(self, i):
+        """
+        Get row as dict including nested lists
+
+        :param i: row index in arrays
+        :type i: int
+        :return: values by attribute name
+        :rtype: dict
+        """
+
+        row = {}
+
+        for c, name in enumerate(self.__names__):
+            value = self.__values__[c][i]
+
+            if self.__dicts__[c]:
+                value = self.__dicts__[c][0][value]
+
+            row[name] = value
+
+        for name, (tag, child, key, text, offsets) in self.__lists__.items():
+            if text:
+                row[name] = child.__values__[0][offsets[i]:offsets[i + 1]]
+            else:
+                row[name] = [child.__get(j) for j in range(offsets[i], offsets[i + 1])]
+
+        return row
+
+    def __arrow(self, pyarrow):
+        """
+        Convert columns to Arrow arrays
+
+        :param pyarrow: pyarrow module
+        :return: column names and arrays
+        :rtype: tuple
+        """
+
+        start, stop = self.__bounds()
+
+        names = list(self.__names__)
+        arrays = []
+
+        for i, values in enumerate(self.__values__):
+            if self.__dicts__[i]:
+                codes = pyarrow.array(values[start:stop], pyarrow.uint32())
+                dictionary = pyarrow.array(self.__dicts__[i][0], pyarrow.string())
+
+                arrays.append(pyarrow.DictionaryArray.from_arrays(codes, dictionary))
+            else:
+                arrays.append(pyarrow.array(values[start:stop]))
+
+        for name, (tag, child, key, text, offsets) in self.__lists__.items():
+            items = child.__view(offsets[start], offsets[stop])
+
+            if text:
+                values = pyarrow.array(items.getColumn('value'), pyarrow.string())
+            else:
+                item_names, item_arrays = items.__arrow(pyarrow)
+                values = pyarrow.StructArray.from_arrays(item_arrays, item_names)
+
+            names.append(name)
+            arrays.append(pyarrow.ListArray.from_arrays(pyarrow.array(self.getOffsets(name), pyarrow.int32()),
+                                                        values))
+
+        return names, arrays
+
+    @staticmethod
+    def __format(value):
+        """
+        Format value for text export
+
+        :param value: column value
+        :return: text value or value itself if no formatting is required
+        """
+
+        if value is None:
+            return ''
+
+        if isinstance(value, bool):
+            return 'true' if value else 'false'
+
+        if isinstance(value, (datetime.date, datetime.datetime)):
+            return value.isoformat()
+
+        return value
@@ -0,0 +1,89 @@
+#
+# -*- coding: utf-8 -*-
+#
+# Copyright 2015-2025 NETCAT (www.netcat.pl)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# @author NETCAT <firma@netcat.pl>
+# @copyright 2015-2025 NETCAT (www.netcat.pl)
+# @license http://www.apache.org/licenses/LICENSE-2.0
+#
+
+
+import random
+
+from nip24 import Error
+
+
+class RetryPolicy:
+    """
+    Retry policy for transient errors
+    """
+
+    RETRYABLE_CODES = frozenset([
+        Error.GUS_SYNC,
+        Error.VIES_SYNC,
+        Error.CEIDG_SYNC,
+        Error.MAINTENANCE,
+        Error.IBAN_SYNC,
+        Error.CLI_CONNECT,
+        Error.CLI_TIMEOUT,
+        Error.CLI_UNAVAILABLE
+    ])
+
+    def __init__(self, maxRetries=3, baseDelay=0.5, maxDelay=10.0, codes=None):
+        """
+        Construct new retry policy
+
+        :param maxRetries: maximum number of retries of a single call
+        :type maxRetries: int
+        :param baseDelay: delay before the first retry in seconds, doubled with every next retry
+        :type baseDelay: float
+        :param maxDelay: maximum delay between retries in seconds
+        :type maxDelay: float
+        :param codes: error codes which should be retried (None - RETRYABLE_CODES)
+        :type codes: set of int
+        """
+
+        self.maxRetries = maxRetries
+        self.baseDelay = baseDelay
+        self.maxDelay = maxDelay
+        self.codes = frozenset(codes) if codes is not None else self.RETRYABLE_CODES
+
+    def isRetryable(self, code, attempt):
+        """
+        Check if failed call should be retried
+
+        :param code: error code of the failed attempt
+        :type code: int
+        :param attempt: number of retries already made
+        :type attempt: int
+        :return: True if call should be retried
+        :rtype: bool
+        """
+
+        return attempt < self.maxRetries and code in self.codes
+
+    def delay(self, attempt):
+        """
+        Get delay before next retry
+
+        :param attempt: number of retries already made
+        :type attempt: int
+        :return: delay in seconds
+        :rtype: float
+        """
+
+        # capped exponential backoff with full jitter
+        return random.uniform(0, min(self.maxDelay, self.baseDelay * (2 ** attempt)))
@@ -0,0 +1,90 @@
+#
+# -*- coding: utf-8 -*-
+#
+# Copyright 2015-2025 NETCAT (www.netcat.pl)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# @author NETCAT <firma@netcat.pl>
+# @copyright 2015-2025 NETCAT (www.netcat.pl)
+# @license http://www.apache.org/licenses/LICENSE-2.0
+#
+
+
+
+class Schema:
+    """
+    Declarative description of a model object: class, response element and fields
+    """
+
+    __slots__ = ('cls', 'path', 'key', 'fields', 'lists', 'items', 'paths')
+
+    def __init__(self, cls, path, fields, key=None):
+        """
+        Construct new schema
+
+        :param cls: model class
+        :type cls: type
+        :param path: xpath of model element in response document (None - list items)
+        :type path: str
+        :param fields: (attribute name, element path relative to model element, type) tuples, where type is text,
+            pooled, bool, date, datetime, int, float or list; list fields have item schema (None - text items)
+            as fourth value
+        :type fields: list of tuple
+        :param key: attribute which must not be empty, a list of items ends at the first item without it
+        :type key: str
+        """
+
+        self.cls = cls
+        self.path = path
+        self.key = key
+
+        # attribute name and value type by child element tag, dict value for nested elements
+        self.fields = {}
+
+        # nested lists by attribute name: container element tag, item element tag, item fields and item key
+        self.lists = {}
+
+        # item schemas of nested lists by attribute name
+        self.items = {}
+
+        # element path (tuple of tags) and value type by attribute name
+        self.paths = {}
+
+        for field in fields:
+            name, path, type = field[:3]
+            tags = tuple(path.split('/'))
+
+            if type == 'list':
+                item = field[3]
+
+                self.lists[name] = ('/'.join(tags[:-1]), tags[-1], item.fields if item else None,
+                                    item.key if item else None)
+                self.items[name] = item
+            else:
+                table = self.fields
+
+                for tag in tags[:-1]:
+                    table = table.setdefault(tag, {})
+
+                table[tags[-1]] = (name, type)
+
+                self.paths[name] = (tags, type)
+
+    def __str__(self):
+        return 'Schema: [cls = ' + self.cls.__name__ \
+            + ', path = ' + str(self.path) \
+            + ', key = ' + str(self.key) \
+            + ', fields = ' + str(list(self.paths.keys())) \
+            + ', lists = ' + str(list(self.lists.keys())) \
+            + ']'
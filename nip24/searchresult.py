@@ -26,6 +26,8 @@ class SearchResult:
     Search result
     """
 
+    __slots__ = ('uid', 'results', 'id', 'date', 'source')
+
     def __init__(self):
         self.uid = None
 
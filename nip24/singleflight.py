@@ -0,0 +1,119 @@
+#
+# -*- coding: utf-8 -*-
+#
+# Copyright 2015-2025 NETCAT (www.netcat.pl)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# @author NETCAT <firma@netcat.pl>
+# @copyright 2015-2025 NETCAT (www.netcat.pl)
+# @license http://www.apache.org/licenses/LICENSE-2.0
+#
+
+
+import asyncio
+import threading
+import time
+
+
+class SingleFlight:
+    """
+    Coalescing of concurrent identical calls
+    """
+
+    def __init__(self):
+        self.__lock__ = threading.Lock()
+        self.__calls__ = {}
+
+    def do(self, key, func, deadline=None):
+        """
+        Call function unless identical call is already in flight, then wait for its result
+
+        :param key: call key
+        :type key: hashable
+        :param func: function to call
+        :type func: callable
+        :param deadline: time.monotonic() value after which waiting for the call in flight fails (None - no limit)
+        :type deadline: float
+        :return: function result shared by all concurrent callers
+        :raises TimeoutError: if the call in flight does not finish before the deadline
+        """
+
+        with self.__lock__:
+            call = self.__calls__.get(key)
+            leader = call is None
+
+            if leader:
+                # event, result, exception
+                call = self.__calls__[key] = [threading.Event(), None, None]
+
+        if not leader:
+            if not call[0].wait(None if deadline is None else max(0.0, deadline - time.monotonic())):
+                raise TimeoutError('timed out waiting for identical call in flight')
+
+            if call[2]:
+                raise call[2]
+
+            return call[1]
+
+        try:
+            call[1] = func()
+        except BaseException as e:
+            call[2] = e
+            raise
+        finally:
+            with self.__lock__:
+                del self.__calls__[key]
+
+            call[0].set()
+
+        return call[1]
+
+
+class AsyncSingleFlight:
+    """
+    Coalescing of concurrent identical calls for asyncio
+
+    Only calls made in the same event loop are coalesced.
+    """
+
+    def __init__(self):
+        self.__calls__ = {}
+
+    async def do(self, key, func, deadline=None):
+        """
+        Call coroutine function unless identical call is already in flight, then wait for its result
+
+        :param key: call key
+        :type key: hashable
+        :param func: coroutine function to call
+        :type func: callable
+        :param deadline: time.monotonic() value after which waiting for the call in flight fails (None - no limit)
+        :type deadline: float
+        :return: function result shared by all concurrent callers
+        :raises asyncio.TimeoutError: if the call in flight does not finish before the deadline
+        """
+
+        # task of another event loop cannot be awaited
+        key = (asyncio.get_running_loop(), key)
+        task = self.__calls__.get(key)
+
+        if not task:
+            # separate task, so cancelling the first caller does not cancel the others
+            task = self.__calls__[key] = asyncio.ensure_future(func())
+            task.add_done_callback(lambda t: self.__calls__.pop(key) if self.__calls__.get(key) is t else None)
+
+        if deadline is None:
+            return await asyncio.shield(task)
+
+        return await asyncio.wait_for(asyncio.shield(task), deadline - time.monotonic())
@@ -0,0 +1,79 @@
+#
+# -*- coding: utf-8 -*-
+#
+# Copyright 2015-2025 NETCAT (www.netcat.pl)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# @author NETCAT <firma@netcat.pl>
+# @copyright 2015-2025 NETCAT (www.netcat.pl)
+# @license http://www.apache.org/licenses/LICENSE-2.0
+#
+
+
+import collections
+import threading
+
+
+class StringPool:
+    """
+    Bounded pool of shared strings, least recently used strings are evicted first
+    """
+
+    def __init__(self, maxSize=10000):
+        """
+        Construct new string pool
+
+        :param maxSize: maximum number of pooled strings
+        :type maxSize: int
+        """
+
+        self.maxSize = maxSize
+
+        self.__lock__ = threading.Lock()
+        self.__strings__ = collections.OrderedDict()
+
+    def get(self, s):
+        """
+        Get pooled string equal to the given one, adding it to the pool if missing
+
+        :param s: string
+        :type s: str
+        :return: pooled string
+        :rtype: str
+        """
+
+        with self.__lock__:
+            pooled = self.__strings__.get(s)
+
+            if pooled is not None:
+                self.__strings__.move_to_end(s)
+                return pooled
+
+            self.__strings__[s] = s
+
+            if len(self.__strings__) > self.maxSize:
+                self.__strings__.popitem(last=False)
+
+            return s
+
+    def clear(self):
+        """
+        Remove all strings from the pool
+        """
+
+        with self.__lock__:
+            self.__strings__.clear()
+
+    def __len__(self):
+        return len(self.__strings__)
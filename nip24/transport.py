@@ -0,0 +1,129 @@
+#
+# -*- coding: utf-8 -*-
+#
+# Copyright 2015-2025 NETCAT (www.netcat.pl)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# @author NETCAT <firma@netcat.pl>
+# @copyright 2015-2025 NETCAT (www.netcat.pl)
+# @license http://www.apache.org/licenses/LICENSE-2.0
+#
+
+
+import abc
+
+
+class Transport(abc.ABC):
+    """
+    HTTP transport interface
+    """
+
+    @abc.abstractmethod
+    def send(self, method, url, headers, connectTimeout=None, readTimeout=None, deadline=None):
+        """
+        Send HTTP request
+
+        :param method: HTTP method
+        :type method: str
+        :param url: target URL
+        :type url: str
+        :param headers: request headers
+        :type headers: dict
+        :param connectTimeout: connect timeout in seconds (None - no timeout)
+        :type connectTimeout: float
+        :param readTimeout: response read timeout in seconds (None - no timeout)
+        :type readTimeout: float
+        :param deadline: call deadline as time.monotonic() value limiting also the wait for a free connection and
+            reading of the body (None - no limit)
+        :type deadline: float
+        :return: response with lowercase header names
+        :rtype: Response
+        :raises OSError: on network error, socket.timeout on timeout
+        :raises http.client.HTTPException: on protocol error
+        """
+
+        pass
+
+    def stream(self, method, url, headers, connectTimeout=None, readTimeout=None, deadline=None):
+        """
+        Send HTTP request and return response before its body is read
+
+        Default implementation reads the whole body using send().
+
+        :param method: HTTP method
+        :type method: str
+        :param url: target URL
+        :type url: str
+        :param headers: request headers
+        :type headers: dict
+        :param connectTimeout: connect timeout in seconds (None - no timeout)
+        :type connectTimeout: float
+        :param readTimeout: response read timeout in seconds (None - no timeout)
+        :type readTimeout: float
+        :param deadline: call deadline as time.monotonic() value limiting also the wait for a free connection and
+            reading of the body (None - no limit)
+        :type deadline: float
+        :return: response with lowercase header names, must be closed after reading its body
+        :rtype: Response
+        :raises OSError: on network error, socket.timeout on timeout
+        :raises http.client.HTTPException: on protocol error
+        """
+
+        return self.send(method, url, headers, connectTimeout, readTimeout, deadline)
+
+    def close(self):
+        """
+        Release transport resources
+        """
+
+        pass
+
+
+class AsyncTransport(abc.ABC):
+    """
+    HTTP transport interface for asyncio
+    """
+
+    @abc.abstractmethod
+    async def send(self, method, url, headers, connectTimeout=None, readTimeout=None, deadline=None):
+        """
+        Send HTTP request
+
+        :param method: HTTP method
+        :type method: str
+        :param url: target URL
+        :type url: str
+        :param headers: request headers
+        :type headers: dict
+        :param connectTimeout: connect timeout in seconds (None - no timeout)
+        :type connectTimeout: float
+        :param readTimeout: response read timeout in seconds (None - no timeout)
+        :type readTimeout: float
+        :param deadline: call deadline as time.monotonic() value limiting also the wait for a free connection and
+            reading of the body (None - no limit)
+        :type deadline: float
+        :return: response with lowercase header names
+        :rtype: Response
+        :raises OSError: on network error, asyncio.TimeoutError on timeout
+        :raises http.client.HTTPException: on protocol error
+        """
+
+        pass
+
+    async def close(self):
+        """
+        Release transport resources
+        """
+
+        pass
@@ -26,6 +26,13 @@ class VATEntity:
     VAT registry entity
     """
 
+    __slots__ = (
+        'name', 'nip', 'regon', 'krs', 'residenceAddress', 'workingAddress', 'vatStatus', 'vatResult',
+        'representatives', 'authorizedClerks', 'partners', 'ibans', 'hasVirtualAccounts', 'registrationLegalDate',
+        'registrationDenialDate', 'registrationDenialBasis', 'restorationDate', 'restorationBasis', 'removalDate',
+        'removalBasis'
+    )
+
     def __init__(self):
         self.name = None
         self.nip = None
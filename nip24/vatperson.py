@@ -26,6 +26,8 @@ class VATPerson:
     VAT registry person
     """
 
+    __slots__ = ('companyName', 'firstName', 'lastName', 'nip')
+
     def __init__(self):
         self.companyName = None
         self.firstName = None
@@ -26,6 +26,8 @@ class VATStatus:
     VAT status info
     """
 
+    __slots__ = ('uid', 'nip', 'regon', 'name', 'status', 'result', 'id', 'date', 'source')
+
     NOT_REGISTERED = 1
     ACTIVE = 2
     EXEMPTED = 3
@@ -26,6 +26,11 @@ class VIESData:
     VIES data
     """
 
+    __slots__ = (
+        'uid', 'countryCode', 'vatNumber', 'valid', 'traderName', 'traderCompanyType', 'traderAddress', 'id', 'date',
+        'source'
+    )
+
     def __init__(self):
         self.uid = None
         self.countryCode = None
@@ -26,6 +26,10 @@ class WLStatus:
     Whitelist status info
     """
 
+    __slots__ = (
+        'uid', 'nip', 'iban', 'valid', 'virtual', 'status', 'result', 'hashIndex', 'maskIndex', 'date', 'source'
+    )
+
     def __init__(self):
         self.uid = None
         self.nip = None
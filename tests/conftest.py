@@ -0,0 +1,134 @@
+#
+# -*- coding: utf-8 -*-
+#
+# Copyright 2015-2025 NETCAT (www.netcat.pl)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# @author NETCAT <firma@netcat.pl>
+# @copyright 2015-2025 NETCAT (www.netcat.pl)
+# @license http://www.apache.org/licenses/LICENSE-2.0
+#
+
+
+
+#
+# Shared fixtures: local raw socket HTTP servers with full control over the bytes sent
+#
+
+import os
+import socket
+import sys
+import threading
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'benchmarks'))
+
+
+def read_request(rfile):
+    """
+    Read request head, return request line or None if the client closed the connection
+    """
+
+    line = rfile.readline()
+
+    if not line:
+        return None
+
+    while rfile.readline() not in (b'\r\n', b'\n', b''):
+        pass
+
+    return line.decode('latin-1').strip()
+
+
+def keep_alive(body=b'ok', requests=None):
+    """
+    Handler answering every request on the connection with 200 and the body
+    """
+
+    def handler(conn, rfile, index):
+        while True:
+            line = read_request(rfile)
+
+            if not line:
+                return
+
+            if requests is not None:
+                requests.append((index, line))
+
+            conn.sendall(b'HTTP/1.1 200 OK\r\nContent-Length: ' + str(len(body)).encode() + b'\r\n\r\n' + body)
+
+    return handler
+
+
+def trickle(conn, rfile, index):
+    """
+    Handler sending the body one byte at a time, each byte well within a single read timeout
+    """
+
+    read_request(rfile)
+    conn.sendall(b'HTTP/1.1 200 OK\r\nContent-Length: 20\r\n\r\n')
+
+    for i in range(20):
+        time.sleep(0.05)
+        conn.sendall(b'x')
+
+
+@pytest.fixture
+def server():
+    """
+    Start local servers calling handler(conn, rfile, index) for every accepted connection, returning base URL
+
+    Handler gets the connection socket, its binary file and the connection number counted from 0.
+    """
+
+    sockets = []
+
+    def start(handler):
+        sock = socket.create_server(('127.0.0.1', 0))
+        sockets.append(sock)
+        count = [0]
+
+        def handle(conn, index):
+            with conn, conn.makefile('rb') as rfile:
+                try:
+                    handler(conn, rfile, index)
+                except OSError:
+                    pass
+
+        def accept():
+            while True:
+                try:
+                    conn, addr = sock.accept()
+                except OSError:
+                    return
+
+                threading.Thread(target=handle, args=(conn, count[0]), daemon=True).start()
+                count[0] += 1
+
+        threading.Thread(target=accept, daemon=True).start()
+
+        return 'http://127.0.0.1:' + str(sock.getsockname()[1])
+
+    yield start
+
+    for sock in sockets:
+        try:
+            sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+
+        sock.close()
@@ -0,0 +1,262 @@
+#
+# -*- coding: utf-8 -*-
+#
+# Copyright 2015-2025 NETCAT (www.netcat.pl)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# @author NETCAT <firma@netcat.pl>
+# @copyright 2015-2025 NETCAT (www.netcat.pl)
+# @license http://www.apache.org/licenses/LICENSE-2.0
+#
+
+
+
+import asyncio
+import http.client
+import time
+
+import pytest
+
+from conftest import read_request, keep_alive, trickle
+from nip24 import AsyncConnectionPool, HTTPUtil
+
+
+def send(pool, *args, **kwargs):
+    return asyncio.run(pool.send(*args, **kwargs))
+
+
+def fixed(response):
+    """
+    Handler answering every request on the connection with the same raw response
+    """
+
+    def handler(conn, rfile, index):
+        while read_request(rfile):
+            conn.sendall(response)
+
+    return handler
+
+
+def test_reuses_connection(server):
+    requests = []
+    url = server(keep_alive(requests=requests))
+
+    async def main():
+        pool = AsyncConnectionPool()
+
+        return [(await pool.send('GET', url, {})).body for i in range(3)]
+
+    assert asyncio.run(main()) == [b'ok'] * 3
+    assert [index for index, line in requests] == [0, 0, 0]
+
+
+@pytest.mark.parametrize('response', [
+    # chunk extension and trailer
+    b'HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n3;ext=1\r\nabc\r\n2\r\nde\r\n0\r\nX-Trailer: 1\r\n\r\n',
+    # upper case hex size, no trailer
+    b'HTTP/1.1 200 OK\r\nTransfer-Encoding: Chunked\r\n\r\n5\r\nabcde\r\n0\r\n\r\n',
+    b'HTTP/1.1 200 OK\r\nContent-Length: 5\r\n\r\nabcde',
+    # interim response is skipped
+    b'HTTP/1.1 100 Continue\r\n\r\nHTTP/1.1 200 OK\r\nContent-Length: 5\r\n\r\nabcde'
+])
+def test_reads_body_and_keeps_connection(server, response):
+    requests = []
+
+    def handler(conn, rfile, index):
+        while True:
+            line = read_request(rfile)
+
+            if not line:
+                return
+
+            requests.append(index)
+            conn.sendall(response)
+
+    url = server(handler)
+
+    async def main():
+        pool = AsyncConnectionPool()
+
+        return [(await pool.send('GET', url, {})).body for i in range(2)]
+
+    # second request on the same connection fails unless the whole first response was consumed
+    assert asyncio.run(main()) == [b'abcde'] * 2
+    assert requests == [0, 0]
+
+
+def test_reads_body_until_close(server):
+    def handler(conn, rfile, index):
+        read_request(rfile)
+        conn.sendall(b'HTTP/1.0 200 OK\r\n\r\nabcde')
+
+    url = server(handler)
+
+    res = send(AsyncConnectionPool(), 'GET', url, {})
+
+    assert res.body == b'abcde'
+    assert res.headers['connection'] == 'close'
+
+
+def test_head_response_has_no_body(server):
+    url = server(fixed(b'HTTP/1.1 200 OK\r\nContent-Length: 5\r\n\r\n'))
+
+    assert send(AsyncConnectionPool(), 'HEAD', url, {}).body == b''
+
+
+@pytest.mark.parametrize('response', [
+    b'HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\nxyz\r\nabc\r\n0\r\n\r\n',
+    b'HTTP/1.1 200 OK\r\nContent-Length: five\r\n\r\nabcde',
+    b'HTTP/1.1 200 OK\r\nContent-Length: 10\r\n\r\nabcde'
+])
+def test_rejects_invalid_body(server, response):
+    def handler(conn, rfile, index):
+        read_request(rfile)
+        conn.sendall(response)
+
+    url = server(handler)
+
+    with pytest.raises(http.client.HTTPException):
+        send(AsyncConnectionPool(), 'GET', url, {})
+
+
+def test_rejects_invalid_status_line(server):
+    url = server(fixed(b'HTTP/1.1 OK\r\n\r\n'))
+
+    with pytest.raises(http.client.BadStatusLine):
+        send(AsyncConnectionPool(), 'GET', url, {})
+
+
+def test_follows_redirect(server):
+    requests = []
+
+    def handler(conn, rfile, index):
+        while True:
+            line = read_request(rfile)
+
+            if not line:
+                return
+
+            requests.append(line)
+
+            if ' /a ' in line:
+                conn.sendall(b'HTTP/1.1 301 Moved Permanently\r\nLocation: /b?x=1\r\nContent-Length: 5\r\n\r\nmoved')
+            else:
+                conn.sendall(b'HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nok')
+
+    url = server(handler)
+    pool = AsyncConnectionPool()
+
+    res = send(pool, 'GET', url + '/a', {})
+
+    assert res.status == 200
+    assert res.body == b'ok'
+    assert requests == ['GET /a HTTP/1.1', 'GET /b?x=1 HTTP/1.1']
+
+    # only GET and HEAD are redirected
+    assert send(pool, 'POST', url + '/a', {}).status == 301
+
+
+def test_redirect_loop_is_limited(server):
+    requests = []
+
+    def handler(conn, rfile, index):
+        while read_request(rfile):
+            requests.append(index)
+            conn.sendall(b'HTTP/1.1 302 Found\r\nLocation: /loop\r\nContent-Length: 0\r\n\r\n')
+
+    url = server(handler)
+
+    assert send(AsyncConnectionPool(), 'GET', url + '/loop', {}).status == 302
+    assert len(requests) == HTTPUtil.MAX_REDIRECTS + 1
+
+
+def test_retries_request_on_closed_kept_alive_connection(server):
+    requests = []
+
+    def handler(conn, rfile, index):
+        # first connection answers once and then drops the next request as if it timed out on the server
+        while True:
+            line = read_request(rfile)
+
+            if not line:
+                return
+
+            requests.append(index)
+
+            if index == 0 and len(requests) > 1:
+                return
+
+            conn.sendall(b'HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nok')
+
+    url = server(handler)
+
+    async def main():
+        pool = AsyncConnectionPool()
+
+        return [(await pool.send('GET', url, {})).body for i in range(2)]
+
+    assert asyncio.run(main()) == [b'ok'] * 2
+    assert requests == [0, 0, 1]
+
+
+def test_does_not_retry_non_idempotent_request(server):
+    def handler(conn, rfile, index):
+        read_request(rfile)
+        conn.sendall(b'HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nok')
+
+        # drop the second request
+        read_request(rfile)
+
+    url = server(handler)
+
+    async def main():
+        pool = AsyncConnectionPool()
+
+        await pool.send('GET', url, {})
+        await pool.send('POST', url, {})
+
+    with pytest.raises(ConnectionError):
+        asyncio.run(main())
+
+
+def test_wait_for_connection_ends_at_deadline(server):
+    url = server(trickle)
+
+    async def main():
+        pool = AsyncConnectionPool(maxConnections=1)
+        busy = asyncio.ensure_future(pool.send('GET', url, {}))
+
+        await asyncio.sleep(0.1)
+
+        try:
+            await pool.send('GET', url, {}, deadline=time.monotonic() + 0.2)
+        finally:
+            busy.cancel()
+
+    start = time.monotonic()
+
+    with pytest.raises(TimeoutError):
+        asyncio.run(main())
+
+    assert time.monotonic() - start < 0.75
+
+
+def test_body_read_ends_at_deadline(server):
+    url = server(trickle)
+    start = time.monotonic()
+
+    with pytest.raises(TimeoutError):
+        send(AsyncConnectionPool(), 'GET', url, {}, 1.0, 5.0, deadline=start + 0.25)
+
+    assert time.monotonic() - start < 0.75
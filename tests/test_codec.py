@@ -0,0 +1,124 @@
+#
+# -*- coding: utf-8 -*-
+#
+# Copyright 2015-2025 NETCAT (www.netcat.pl)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# @author NETCAT <firma@netcat.pl>
+# @copyright 2015-2025 NETCAT (www.netcat.pl)
+# @license http://www.apache.org/licenses/LICENSE-2.0
+#
+
+
+
+import datetime
+
+import pytest
+from dateutil import tz
+
+from nip24 import NIP24Client, MemoryTransport, Number, Codec, AllData
+from responses import transport_responses
+
+NIP = '7171642051'
+IBAN = '49154000046458439719826658'
+
+
+@pytest.fixture(scope='module')
+def client():
+    nip24 = NIP24Client()
+    nip24.setTransport(MemoryTransport(transport_responses(pkds=3, entities=2)))
+
+    return nip24
+
+
+@pytest.mark.parametrize('call', [
+    lambda nip24: nip24.getInvoiceDataExt(Number.NIP, NIP),
+    lambda nip24: nip24.getAllDataExt(Number.NIP, NIP),
+    lambda nip24: nip24.getVIESData('PL' + NIP),
+    lambda nip24: nip24.getVATStatusExt(Number.NIP, NIP),
+    lambda nip24: nip24.getIBANStatusExt(Number.NIP, NIP, IBAN),
+    lambda nip24: nip24.getWhitelistStatusExt(Number.NIP, NIP, IBAN),
+    lambda nip24: nip24.searchVATRegistryExt(Number.NIP, NIP),
+    lambda nip24: nip24.getAccountStatus()
+])
+def test_model_round_trip(client, call):
+    obj = call(client)
+
+    assert obj, client.getLastError()
+
+    copy = Codec.fromBytes(Codec.toBytes(obj))
+
+    assert type(copy) is type(obj)
+    assert str(copy) == str(obj)
+
+
+def test_lazy_model_is_written_as_model_class(client):
+    client.setLazy(True)
+
+    try:
+        obj = client.getAllDataExt(Number.NIP, NIP)
+    finally:
+        client.setLazy(False)
+
+    copy = Codec.fromBytes(Codec.toBytes(obj))
+
+    assert type(copy) is AllData
+    assert str(copy) == str(client.getAllDataExt(Number.NIP, NIP))
+
+
+@pytest.mark.parametrize('value', [
+    None, True, False, 0, 1, -1, 63, 64, -64, -65, 2 ** 70, -2 ** 70, 0.5, -1e300,
+    '', 'abc', 'zażółć gęślą jaźń', 'x' * 200,
+    datetime.date(2023, 5, 6),
+    datetime.datetime(2023, 5, 6, 12, 30, 15, 123456),
+    datetime.datetime(2023, 5, 6, 12, 30, tzinfo=tz.tzutc()),
+    datetime.datetime(2023, 5, 6, 12, 30, tzinfo=tz.tzoffset(None, 7200)),
+    datetime.datetime(2023, 5, 6, 12, 30, tzinfo=tz.tzoffset(None, -19800)),
+    [1, 'a', None, [2.5, 'a']],
+    ['repeated'] * 200
+])
+def test_value_round_trip(value):
+    copy = Codec.fromBytes(Codec.toBytes(value))
+
+    assert copy == value
+    assert type(copy) is type(value)
+
+    if isinstance(value, datetime.datetime):
+        assert copy.utcoffset() == value.utcoffset()
+
+
+def test_repeated_strings_are_written_once():
+    one = len(Codec.toBytes(['repeated string']))
+    many = len(Codec.toBytes(['repeated string'] * 100))
+
+    assert many < one + 100 * 3
+
+
+@pytest.mark.parametrize('data', [
+    b'',
+    b'N24',
+    b'XYZ\x01\x00',
+    b'N24\x7f\x00',
+    b'N24\x01\x05\x10abc',
+    b'N24\x01\x00\x00',
+    b'N24\x01\x0a\xff\x00'
+])
+def test_rejects_invalid_data(data):
+    with pytest.raises(ValueError):
+        Codec.fromBytes(data)
+
+
+def test_rejects_unsupported_type():
+    with pytest.raises(TypeError):
+        Codec.toBytes(object())
@@ -0,0 +1,189 @@
+#
+# -*- coding: utf-8 -*-
+#
+# Copyright 2015-2025 NETCAT (www.netcat.pl)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# @author NETCAT <firma@netcat.pl>
+# @copyright 2015-2025 NETCAT (www.netcat.pl)
+# @license http://www.apache.org/licenses/LICENSE-2.0
+#
+
+
+
+import socket
+import time
+
+import pytest
+
+from conftest import read_request, keep_alive, trickle
+from nip24 import ConnectionPool, HTTPUtil
+
+
+def test_reuses_connection(server):
+    requests = []
+    url = server(keep_alive(requests=requests))
+    pool = ConnectionPool()
+
+    for i in range(3):
+        res = pool.send('GET', url + '/a', {})
+
+        assert res.status == 200
+        assert res.body == b'ok'
+
+    assert [index for index, line in requests] == [0, 0, 0]
+
+
+def test_chunked_body(server):
+    def handler(conn, rfile, index):
+        while read_request(rfile):
+            conn.sendall(b'HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n'
+                         b'3;ext=1\r\nabc\r\n2\r\nde\r\n0\r\nX-Trailer: 1\r\n\r\n')
+
+    url = server(handler)
+    pool = ConnectionPool()
+
+    assert pool.send('GET', url, {}).body == b'abcde'
+    assert b''.join(pool.stream('GET', url, {}).chunks(2)) == b'abcde'
+
+
+def test_follows_redirect(server):
+    requests = []
+
+    def handler(conn, rfile, index):
+        while True:
+            line = read_request(rfile)
+
+            if not line:
+                return
+
+            requests.append(line)
+
+            if ' /a ' in line:
+                conn.sendall(b'HTTP/1.1 302 Found\r\nLocation: /b?x=1\r\nContent-Length: 5\r\n\r\nmoved')
+            else:
+                conn.sendall(b'HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nok')
+
+    url = server(handler)
+    pool = ConnectionPool()
+
+    res = pool.send('GET', url + '/a', {})
+
+    assert res.status == 200
+    assert res.body == b'ok'
+    assert requests == ['GET /a HTTP/1.1', 'GET /b?x=1 HTTP/1.1']
+
+    res = pool.stream('GET', url + '/a', {})
+
+    assert res.status == 200
+    assert b''.join(res.chunks()) == b'ok'
+
+    res.close()
+
+    # only GET and HEAD are redirected
+    assert pool.send('POST', url + '/a', {}).status == 302
+
+
+def test_redirect_loop_is_limited(server):
+    requests = []
+
+    def handler(conn, rfile, index):
+        while read_request(rfile):
+            requests.append(index)
+            conn.sendall(b'HTTP/1.1 302 Found\r\nLocation: /loop\r\nContent-Length: 0\r\n\r\n')
+
+    url = server(handler)
+
+    res = ConnectionPool().send('GET', url + '/loop', {})
+
+    assert res.status == 302
+    assert len(requests) == HTTPUtil.MAX_REDIRECTS + 1
+
+
+def test_retries_request_on_closed_kept_alive_connection(server):
+    requests = []
+
+    def handler(conn, rfile, index):
+        # first connection answers once and then drops the next request as if it timed out on the server
+        while True:
+            line = read_request(rfile)
+
+            if not line:
+                return
+
+            requests.append((index, line))
+
+            if index == 0 and len(requests) > 1:
+                return
+
+            conn.sendall(b'HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nok')
+
+    url = server(handler)
+    pool = ConnectionPool()
+
+    assert pool.send('GET', url, {}).body == b'ok'
+    assert pool.send('GET', url, {}).body == b'ok'
+    assert [index for index, line in requests] == [0, 0, 1]
+
+
+def test_does_not_retry_non_idempotent_request(server):
+    def handler(conn, rfile, index):
+        read_request(rfile)
+        conn.sendall(b'HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nok')
+
+        # drop the second request
+        read_request(rfile)
+
+    url = server(handler)
+    pool = ConnectionPool()
+
+    assert pool.send('GET', url, {}).body == b'ok'
+
+    with pytest.raises(ConnectionError):
+        pool.send('POST', url, {})
+
+
+def test_wait_for_connection_ends_at_deadline(server):
+    url = server(keep_alive())
+    pool = ConnectionPool(maxConnections=1)
+
+    res = pool.stream('GET', url, {})
+    start = time.monotonic()
+
+    with pytest.raises(socket.timeout):
+        pool.send('GET', url, {}, deadline=start + 0.2)
+
+    assert time.monotonic() - start < 1.0
+
+    res.close()
+
+    assert pool.send('GET', url, {}, deadline=time.monotonic() + 1.0).body == b'ok'
+
+
+@pytest.mark.parametrize('method', ['send', 'stream'])
+def test_body_read_ends_at_deadline(server, method):
+    url = server(trickle)
+    start = time.monotonic()
+
+    with pytest.raises(socket.timeout):
+        res = getattr(ConnectionPool(), method)('GET', url, {}, 1.0, 1.0, deadline=start + 0.25)
+        b''.join(res.chunks())
+
+    assert time.monotonic() - start < 0.75
+
+
+def test_body_read_without_deadline_completes(server):
+    url = server(trickle)
+
+    assert ConnectionPool().send('GET', url, {}, 1.0, 1.0).body == b'x' * 20
@@ -0,0 +1,177 @@
+#
+# -*- coding: utf-8 -*-
+#
+# Copyright 2015-2025 NETCAT (www.netcat.pl)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# @author NETCAT <firma@netcat.pl>
+# @copyright 2015-2025 NETCAT (www.netcat.pl)
+# @license http://www.apache.org/licenses/LICENSE-2.0
+#
+
+
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from nip24 import SingleFlight, AsyncSingleFlight
+
+
+def test_coalesces_concurrent_calls():
+    flight = SingleFlight()
+    started = threading.Event()
+    calls = []
+    results = []
+
+    def func():
+        calls.append(1)
+        started.set()
+        time.sleep(0.2)
+        return 'result'
+
+    leader = threading.Thread(target=lambda: results.append(flight.do('key', func)))
+    leader.start()
+    started.wait()
+
+    followers = [threading.Thread(target=lambda: results.append(flight.do('key', func))) for i in range(3)]
+
+    for t in followers:
+        t.start()
+
+    for t in [leader] + followers:
+        t.join()
+
+    assert calls == [1]
+    assert results == ['result'] * 4
+
+    # finished call is not cached
+    assert flight.do('key', lambda: 'next') == 'next'
+
+
+def test_shares_exception():
+    flight = SingleFlight()
+    started = threading.Event()
+    errors = []
+
+    def func():
+        started.set()
+        time.sleep(0.2)
+        raise ValueError('failed')
+
+    def call():
+        try:
+            flight.do('key', func)
+        except ValueError as e:
+            errors.append(str(e))
+
+    leader = threading.Thread(target=call)
+    leader.start()
+    started.wait()
+
+    follower = threading.Thread(target=call)
+    follower.start()
+
+    leader.join()
+    follower.join()
+
+    assert errors == ['failed', 'failed']
+
+
+def test_follower_wait_ends_at_deadline():
+    flight = SingleFlight()
+    started = threading.Event()
+    results = []
+
+    def func():
+        started.set()
+        time.sleep(0.5)
+        return 'result'
+
+    leader = threading.Thread(target=lambda: results.append(flight.do('key', func)))
+    leader.start()
+    started.wait()
+
+    start = time.monotonic()
+
+    with pytest.raises(TimeoutError):
+        flight.do('key', func, time.monotonic() + 0.1)
+
+    assert time.monotonic() - start < 0.4
+
+    leader.join()
+
+    # leader is not affected by the follower giving up
+    assert results == ['result']
+
+
+def test_async_coalesces_concurrent_calls():
+    calls = []
+
+    async def func():
+        calls.append(1)
+        await asyncio.sleep(0.1)
+        return 'result'
+
+    async def main():
+        flight = AsyncSingleFlight()
+
+        return await asyncio.gather(*(flight.do('key', func) for i in range(4)))
+
+    assert asyncio.run(main()) == ['result'] * 4
+    assert calls == [1]
+
+
+def test_async_follower_wait_ends_at_deadline():
+    async def func():
+        await asyncio.sleep(0.5)
+        return 'result'
+
+    async def main():
+        flight = AsyncSingleFlight()
+        leader = asyncio.ensure_future(flight.do('key', func))
+
+        await asyncio.sleep(0)
+
+        start = time.monotonic()
+
+        with pytest.raises(asyncio.TimeoutError):
+            await flight.do('key', func, time.monotonic() + 0.1)
+
+        assert time.monotonic() - start < 0.4
+
+        # cancelling the follower does not cancel the shared call
+        return await leader
+
+    assert asyncio.run(main()) == 'result'
+
+
+def test_async_cancelled_caller_does_not_cancel_others():
+    async def func():
+        await asyncio.sleep(0.2)
+        return 'result'
+
+    async def main():
+        flight = AsyncSingleFlight()
+        first = asyncio.ensure_future(flight.do('key', func))
+        second = asyncio.ensure_future(flight.do('key', func))
+
+        await asyncio.sleep(0.05)
+        first.cancel()
+
+        return await second
+
+    assert asyncio.run(main()) == 'result'